@@ -0,0 +1,106 @@
+"""
+流入制御の過負荷テスト
+
+同時実行数が増えるほど遅くなるバックエンドを模したアプリに、処理能力を
+超えるリクエストを送り続け、流入制御の有無で受け付けたリクエストの
+p99レイテンシと503の割合を比較する。
+
+実行方法（backendディレクトリで）:
+    python benchmarks/admission_control_load.py
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from presentation.middleware.admission_control import (  # noqa: E402
+    AdmissionController,
+    AdmissionControlMiddleware,
+    AIMDLimit
+)
+
+
+# バックエンドが遅延なく処理できる同時実行数と、その時の応答時間（秒）
+BACKEND_CAPACITY = 16
+BACKEND_LATENCY = 0.1
+# 負荷をかける時間（秒）と1秒あたりのリクエスト数（処理能力の約3倍）
+DURATION = 5
+REQUESTS_PER_SECOND = 3 * BACKEND_CAPACITY / BACKEND_LATENCY
+
+
+def _create_app(with_admission_control: bool):
+    app = FastAPI()
+    in_flight = 0
+
+    @app.get("/todos")
+    async def get_todos():
+        nonlocal in_flight
+        in_flight += 1
+        try:
+            # 処理能力を超えると同時実行数に比例して遅くなる
+            await asyncio.sleep(BACKEND_LATENCY * max(1.0, in_flight / BACKEND_CAPACITY))
+            return []
+        finally:
+            in_flight -= 1
+
+    controller = AdmissionController(
+        AIMDLimit(initial_limit=64, min_limit=4, max_limit=256, target_latency=0.25),
+        max_queue=64,
+        queue_timeout=0.25
+    )
+    if with_admission_control:
+        app.add_middleware(AdmissionControlMiddleware, controller=controller)
+    return app, controller
+
+
+async def run(with_admission_control: bool):
+    app, controller = _create_app(with_admission_control)
+    transport = httpx.ASGITransport(app=app)
+    latencies = []
+    statuses = {}
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        async def request():
+            start = time.perf_counter()
+            response = await client.get("/todos")
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.status_code == 200:
+                latencies.append(time.perf_counter() - start)
+
+        tasks = []
+        interval = 1 / REQUESTS_PER_SECOND
+        started = time.perf_counter()
+        sent = 0
+        while time.perf_counter() - started < DURATION:
+            # 一定レートでリクエストを送る（オープンループ）
+            due = int((time.perf_counter() - started) / interval)
+            for _ in range(due - sent):
+                tasks.append(asyncio.create_task(request()))
+            sent = max(sent, due)
+            await asyncio.sleep(0.001)
+        await asyncio.gather(*tasks)
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] if latencies else 0
+    p99 = latencies[int(len(latencies) * 0.99) - 1] if latencies else 0
+    label = "admission" if with_admission_control else "unbounded"
+    print(
+        f"{label:<10} sent={sent:>6} ok={statuses.get(200, 0):>6} "
+        f"503={statuses.get(503, 0):>6} p50={p50 * 1000:.0f}ms p99={p99 * 1000:.0f}ms"
+    )
+    if with_admission_control:
+        print(controller.get_metrics())
+
+
+async def main():
+    await run(False)
+    await run(True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""
+ルートごとのバックエンド呼び出し回数の上限の確認
+
+代表的なルートを1回ずつ呼び出し、リクエストごとのDynamoDB呼び出しの回数
+（再試行を含む）と消費キャパシティを表示する。上限（BUDGETS）を超えたルートが
+あれば終了コード1で終了するため、CIで呼び出し回数の退行を検知できる。
+ルートの処理を変えて呼び出しが増減した場合は、意図したものか確認してから上限を更新する。
+
+実行方法（backendディレクトリで、DynamoDB Localを起動した状態で）:
+    DYNAMODB_ENDPOINT=http://localhost:8001 python benchmarks/backend_call_budget.py
+
+DynamoDB Localがなくても、tests/test_backend_call_budget.py が同じ確認をmotoに対して行う
+（環境変数は BENCHMARK_ENV をテストの範囲だけで設定し、アプリケーションを読み込み直して渡す）。
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import httpx  # noqa: E402
+
+from infrastructure.profiling.backend_call_account import (  # noqa: E402
+    BackendCallBudgetExceeded,
+    assert_max_backend_calls
+)
+
+
+# 呼び出し回数に影響するバックグラウンド処理・流入制御・書き込みバッファを止める環境変数
+# （アプリケーションは読み込み時の環境変数で構成されるため、読み込む前に設定する）
+BENCHMARK_ENV = {
+    "TODO_STATS_RECONCILE_INTERVAL": "0",
+    "ADMISSION_CONTROL_ENABLED": "false",
+    "TODO_WRITE_BEHIND_ENABLED": "false",
+}
+
+# ルート -> (呼び出し回数の上限, 操作ごとの上限)
+BUDGETS = {
+    "POST /todos": (2, {"put_item": 1}),
+    "GET /todos": (1, {}),
+    "GET /todos?fields=id,title": (1, {}),
+    "GET /todos?limit=20": (1, {"query": 1}),
+    "GET /todos?limit=20&before={id}": (1, {"query": 1}),
+    "GET /todos/{id}": (1, {"get_item": 1}),
+    "PUT /todos/{id}": (3, {"get_item": 1, "put_item": 1}),
+    "DELETE /todos/{id}": (2, {"put_item": 1}),
+    "GET /todos/stats": (1, {}),
+}
+
+
+async def run(app):
+    """BENCHMARK_ENV を設定して読み込んだアプリケーションの各ルートを確認する"""
+    await app.router.startup()
+    transport = httpx.ASGITransport(app=app)
+    failures = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def check(route, method, url, **kwargs):
+            max_calls, operations = BUDGETS[route]
+            try:
+                with assert_max_backend_calls(max_calls, operations) as account:
+                    response = await client.request(method, url, **kwargs)
+            except BackendCallBudgetExceeded as e:
+                failures.append(f"{route}: {e}")
+                account = None
+            else:
+                response.raise_for_status()
+            if account is not None:
+                detail = ", ".join(f"{name}={count.calls}" for name, count in account.operations.items())
+                print(
+                    f"{route:<34}{account.calls:>4} / {max_calls:<4}"
+                    f"{account.capacity_units:>8.1f}CU  {detail}"
+                )
+            return response
+
+        todo_id = (await check("POST /todos", "POST", "/todos", json={"title": "budget"})).json()["id"]
+        await check("GET /todos", "GET", "/todos")
+        await check("GET /todos?fields=id,title", "GET", "/todos?fields=id,title")
+        await check("GET /todos?limit=20", "GET", "/todos?limit=20")
+        await check("GET /todos?limit=20&before={id}", "GET", f"/todos?limit=20&before={todo_id}")
+        await check("GET /todos/{id}", "GET", f"/todos/{todo_id}")
+        await check("PUT /todos/{id}", "PUT", f"/todos/{todo_id}", json={"completed": True})
+        await check("DELETE /todos/{id}", "DELETE", f"/todos/{todo_id}")
+        await check("GET /todos/stats", "GET", "/todos/stats")
+
+    await app.router.shutdown()
+
+    for failure in failures:
+        print(f"NG: {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    os.environ.update(BENCHMARK_ENV)
+    from main import app
+
+    asyncio.run(run(app))
@@ -0,0 +1,124 @@
+"""
+コールドスタートの時間予算の確認
+
+新しいプロセスでサーバーレス用のエントリーポイント（src/serverless.py）を読み込み、
+読み込み時間と最初のリクエスト（ヘルスチェック、TODO一覧取得）のレイテンシを計測する。
+複数回計測した中央値が予算を超えた場合、または読み込み時点でboto3などの重いモジュールが
+読み込まれている場合は終了コード1で終了するため、CIでの退行検知に使える。
+
+予算は環境変数で変更できる:
+    COLD_START_IMPORT_BUDGET_MS         読み込み時間（既定: 1500）
+    COLD_START_FIRST_REQUEST_BUDGET_MS  最初のTODO一覧取得（既定: 1000）
+
+実行方法（backendディレクトリで）:
+    DYNAMODB_ENDPOINT=http://localhost:8001 python benchmarks/cold_start_budget.py [計測回数]
+    python benchmarks/cold_start_budget.py --memory [計測回数]   # DynamoDBなしで計測
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# 最初のリクエストまでに読み込まれてはいけないモジュール
+LAZY_MODULES = (
+    "boto3",
+    "presentation.middleware.profiling",
+    "presentation.middleware.server_timing",
+    "presentation.api.legacy_todo_router",
+)
+
+IMPORT_BUDGET_MS = float(os.getenv("COLD_START_IMPORT_BUDGET_MS", "1500"))
+FIRST_REQUEST_BUDGET_MS = float(os.getenv("COLD_START_FIRST_REQUEST_BUDGET_MS", "1000"))
+
+
+def _event(path):
+    """Lambda Function URL（ペイロード形式2.0）のイベント"""
+    return {
+        "version": "2.0",
+        "routeKey": "$default",
+        "rawPath": path,
+        "rawQueryString": "",
+        "headers": {"host": "budget.lambda-url.ap-northeast-1.on.aws", "accept": "application/json"},
+        "requestContext": {
+            "http": {"method": "GET", "path": path, "protocol": "HTTP/1.1", "sourceIp": "127.0.0.1"},
+            "domainName": "budget.lambda-url.ap-northeast-1.on.aws",
+            "stage": "$default",
+        },
+        "isBase64Encoded": False,
+    }
+
+
+def measure():
+    """1回分の計測（新しいプロセスで実行される）"""
+    start = time.perf_counter()
+    sys.path.insert(0, SRC_DIR)
+    import serverless
+    import_ms = (time.perf_counter() - start) * 1000
+    loaded = [name for name in LAZY_MODULES if name in sys.modules]
+
+    timings = {}
+    for name, path in (("health", "/health"), ("todos", "/todos")):
+        start = time.perf_counter()
+        response = serverless.handler(_event(path), None)
+        timings[name] = (time.perf_counter() - start) * 1000
+        if response["statusCode"] != 200:
+            raise RuntimeError(f"{path} が {response['statusCode']} を返しました: {response.get('body')}")
+
+    print(json.dumps({"import_ms": import_ms, "loaded": loaded, **timings}))
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if arg != "--memory"]
+    runs = int(args[0]) if args else 5
+    env = dict(os.environ)
+    if "--memory" in sys.argv:
+        env["TODO_BACKEND"] = "memory"
+
+    results = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, __file__, "--run"],
+            env=env,
+            capture_output=True,
+            text=True
+        )
+        lines = result.stdout.strip().splitlines()
+        if result.returncode != 0 or not lines:
+            print(f"計測に失敗しました\n{result.stderr}")
+            sys.exit(1)
+        results.append(json.loads(lines[-1]))
+
+    import_ms = statistics.median(r["import_ms"] for r in results)
+    health_ms = statistics.median(r["health"] for r in results)
+    todos_ms = statistics.median(r["todos"] for r in results)
+    loaded = sorted({name for r in results for name in r["loaded"]})
+
+    print(f"計測回数: {runs}（中央値）")
+    print(f"読み込み          {import_ms:>8.1f}ms  （予算 {IMPORT_BUDGET_MS:.0f}ms）")
+    print(f"最初のヘルスチェック {health_ms:>8.1f}ms")
+    print(f"最初のTODO一覧取得  {todos_ms:>8.1f}ms  （予算 {FIRST_REQUEST_BUDGET_MS:.0f}ms）")
+
+    failures = []
+    if import_ms > IMPORT_BUDGET_MS:
+        failures.append(f"読み込み時間が予算を超えています: {import_ms:.1f}ms > {IMPORT_BUDGET_MS:.0f}ms")
+    if todos_ms > FIRST_REQUEST_BUDGET_MS:
+        failures.append(f"最初のリクエストが予算を超えています: {todos_ms:.1f}ms > {FIRST_REQUEST_BUDGET_MS:.0f}ms")
+    if loaded:
+        failures.append(f"読み込み時点で読み込まれています: {', '.join(loaded)}")
+
+    for failure in failures:
+        print(f"NG: {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--run":
+        measure()
+    else:
+        main()
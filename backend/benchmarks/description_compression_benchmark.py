@@ -0,0 +1,157 @@
+"""
+説明の圧縮による項目サイズとスキャン性能の比較
+
+説明の長さが異なるTODOを、圧縮なし・圧縮ありの2つのテーブルに同じ内容で
+書き込み、項目サイズ（DynamoDBの課金単位での概算）、全件スキャンのページ数と
+消費キャパシティ、スキャン（エンティティへの変換を含む）のスループットを比較する。
+スループットは説明を参照しない場合と参照する場合（展開あり）の両方を計測する。
+
+実行方法（backendディレクトリで、DynamoDB Localを起動した状態で）:
+    DYNAMODB_ENDPOINT=http://localhost:8001 python benchmarks/description_compression_benchmark.py [TODO件数]
+"""
+import asyncio
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from domain.entities.todo import Todo  # noqa: E402
+from infrastructure.database.dynamodb_client import DynamoDBClient  # noqa: E402
+from infrastructure.repositories.dynamodb_todo_repository import DynamoDBTodoRepository  # noqa: E402
+
+
+ITERATIONS = 5
+
+# 説明の長さ（文字数）ごとの割合
+DESCRIPTION_LENGTHS = [(0, 0.4), (100, 0.3), (2000, 0.2), (20000, 0.1)]
+
+WORDS = [
+    "買い物", "牛乳", "パン", "卵", "野菜", "会議", "資料", "確認", "メモ", "連絡",
+    "meeting", "notes", "follow", "up", "draft", "review", "budget", "plan", "TODO", "memo",
+]
+
+
+def _make_description(rng, length):
+    if length == 0:
+        return None
+    words = []
+    size = 0
+    while size < length:
+        word = rng.choice(WORDS) + (f" {rng.randint(0, 9999)}" if rng.random() < 0.2 else "")
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)[:length]
+
+
+def _make_todos(count):
+    rng = random.Random(42)
+    now = datetime.now()
+    todos = []
+    for i in range(count):
+        length = rng.choices(
+            [length for length, _ in DESCRIPTION_LENGTHS],
+            weights=[weight for _, weight in DESCRIPTION_LENGTHS]
+        )[0]
+        todos.append(Todo(
+            id=str(uuid.uuid4()),
+            title=f"TODO #{i}",
+            description=_make_description(rng, length),
+            completed=i % 3 == 0,
+            created_at=now,
+            updated_at=now
+        ))
+    return todos
+
+
+def _item_size(item):
+    """DynamoDBの項目サイズの概算（属性名＋値のバイト数）"""
+    size = 0
+    for name, value in item.items():
+        size += len(name.encode("utf-8"))
+        if value is None or isinstance(value, bool):
+            size += 1
+        elif isinstance(value, (int, float)):
+            size += len(str(value)) // 2 + 1
+        elif isinstance(value, bytes):
+            size += len(value)
+        else:
+            size += len(str(value).encode("utf-8"))
+    return size
+
+
+def _create_table(client, table_name):
+    dynamodb = client.get_resource()
+    try:
+        dynamodb.Table(table_name).delete()
+        dynamodb.Table(table_name).wait_until_not_exists()
+    except Exception:
+        pass
+    table = dynamodb.create_table(
+        TableName=table_name,
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST"
+    )
+    table.wait_until_exists()
+    return table
+
+
+def _scan_pages(table):
+    """全件スキャンのページ数と消費キャパシティ"""
+    pages = 0
+    capacity = 0.0
+    scan_kwargs = {"ReturnConsumedCapacity": "TOTAL"}
+    while True:
+        response = table.scan(**scan_kwargs)
+        pages += 1
+        capacity += response.get("ConsumedCapacity", {}).get("CapacityUnits", 0.0)
+        if "LastEvaluatedKey" not in response:
+            return pages, capacity
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+async def run(label, client, todos, threshold):
+    repository = DynamoDBTodoRepository(client, description_compression_threshold=threshold)
+    repository.table_name = f"TodosCompressionBenchmark-{label}"
+    table = _create_table(client, repository.table_name)
+
+    sizes = [_item_size(repository._entity_to_item(todo)) for todo in todos]
+    await repository.batch_write(todos, [])
+    pages, capacity = _scan_pages(table)
+
+    timings = {}
+    for touch_description in (False, True):
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            for todo in await repository.find_all():
+                if touch_description:
+                    todo.description
+        timings[touch_description] = len(todos) * ITERATIONS / (time.perf_counter() - start)
+
+    table.delete()
+    print(
+        f"{label:<12}{sum(sizes) / len(sizes):>10.0f}{max(sizes):>10}{pages:>7}{capacity:>10.1f}"
+        f"{timings[False]:>14.0f}{timings[True]:>14.0f}"
+    )
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    client = DynamoDBClient()
+    todos = _make_todos(count)
+
+    print(f"TODO件数: {count}")
+    print(
+        f"{'table':<12}{'avg bytes':>10}{'max bytes':>10}{'pages':>7}{'RCU':>10}"
+        f"{'items/s':>14}{'items/s(desc)':>14}"
+    )
+    await run("plain", client, todos, None)
+    await run("compressed", client, todos, 1024)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
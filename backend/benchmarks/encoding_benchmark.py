@@ -0,0 +1,105 @@
+"""
+レスポンスエンコーディングのベンチマーク
+
+TODO一覧レスポンスをJSON / MessagePack と gzip / brotli の組み合わせで
+エンコードし、転送量とリクエストあたりのCPU時間（エンコード・デコード）を比較する。
+
+実行方法（backendディレクトリで）:
+    python benchmarks/encoding_benchmark.py [TODO件数]
+"""
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import brotli  # noqa: E402
+import msgpack  # noqa: E402
+
+from presentation.schemas.todo_schema import TodoResponse  # noqa: E402
+
+
+ITERATIONS = 50
+
+
+def _make_responses(count):
+    now = datetime.now()
+    return [
+        TodoResponse(
+            id=f"123e4567-e89b-12d3-a456-{i:012d}",
+            title=f"買い物に行く #{i}",
+            description="牛乳とパンを買う。ついでに卵と野菜も。" if i % 3 else None,
+            completed=i % 4 == 0,
+            created_at=now - timedelta(minutes=i),
+            updated_at=now
+        )
+        for i in range(count)
+    ]
+
+
+def _encode_json(responses):
+    return json.dumps(
+        [response.model_dump(mode="json") for response in responses],
+        ensure_ascii=False,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _encode_msgpack(responses):
+    return msgpack.packb(
+        [response.model_dump(mode="json") for response in responses],
+        use_bin_type=True
+    )
+
+
+ENCODINGS = {
+    "json": (_encode_json, lambda body: json.loads(body)),
+    "json+gzip": (
+        lambda r: gzip.compress(_encode_json(r), compresslevel=6),
+        lambda body: json.loads(gzip.decompress(body)),
+    ),
+    "json+br": (
+        lambda r: brotli.compress(_encode_json(r), quality=4),
+        lambda body: json.loads(brotli.decompress(body)),
+    ),
+    "msgpack": (_encode_msgpack, lambda body: msgpack.unpackb(body)),
+    "msgpack+gzip": (
+        lambda r: gzip.compress(_encode_msgpack(r), compresslevel=6),
+        lambda body: msgpack.unpackb(gzip.decompress(body)),
+    ),
+    "msgpack+br": (
+        lambda r: brotli.compress(_encode_msgpack(r), quality=4),
+        lambda body: msgpack.unpackb(brotli.decompress(body)),
+    ),
+}
+
+
+def _cpu_per_call(fn, arg):
+    start = time.process_time()
+    for _ in range(ITERATIONS):
+        result = fn(arg)
+    return (time.process_time() - start) / ITERATIONS, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    responses = _make_responses(count)
+
+    print(f"TODO件数: {count}")
+    print(f"{'encoding':<14}{'bytes':>10}{'ratio':>8}{'encode ms':>12}{'decode ms':>12}")
+    baseline = None
+    for name, (encode, decode) in ENCODINGS.items():
+        encode_time, body = _cpu_per_call(encode, responses)
+        decode_time, _ = _cpu_per_call(decode, body)
+        baseline = baseline or len(body)
+        print(
+            f"{name:<14}{len(body):>10}{len(body) / baseline:>8.2f}"
+            f"{encode_time * 1000:>12.2f}{decode_time * 1000:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+本番相当のバックエンド条件での負荷テスト
+
+DynamoDBの代わりにインメモリのバックエンドを使い、遅延分布・スロットリング・
+タイムアウト・一括書き込みの部分失敗を注入した状態でAPIに一定の同時実行数で
+リクエストを送り続ける。シナリオごとにスループット、p50/p99レイテンシ、
+503の割合を表示し、同時実行数の上限や再試行の設定が妥当か確認する。
+
+各シナリオは環境変数で設定した別プロセスで実行する。設定（ADMISSION_* 、
+REPOSITORY_MAX_ATTEMPTS 、TODO_WRITE_BEHIND_ENABLED など）は
+環境変数で上書きできる。
+
+実行方法（backendディレクトリで）:
+    python benchmarks/fault_injection_load.py [同時実行数] [秒数]
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# シナリオ名 -> 注入する遅延・障害の設定
+SCENARIOS = {
+    "healthy": {"FAULT_LATENCY_MEDIAN_MS": "5", "FAULT_LATENCY_P99_MS": "25"},
+    "slow-tail": {"FAULT_LATENCY_MEDIAN_MS": "8", "FAULT_LATENCY_P99_MS": "250"},
+    "throttled": {
+        "FAULT_LATENCY_MEDIAN_MS": "5",
+        "FAULT_LATENCY_P99_MS": "25",
+        "FAULT_THROTTLE_RATE": "0.1",
+    },
+    "timeouts": {
+        "FAULT_LATENCY_MEDIAN_MS": "5",
+        "FAULT_LATENCY_P99_MS": "25",
+        "FAULT_TIMEOUT_RATE": "0.01",
+        "FAULT_TIMEOUT_SECONDS": "1",
+    },
+}
+
+# 一覧取得・作成・更新の比率（読み込み中心）
+MIX = ["GET"] * 8 + ["POST", "PUT"]
+
+
+async def run_scenario(concurrency, duration):
+    sys.path.insert(0, SRC_DIR)
+    import httpx
+    import main
+
+    await main.app.router.startup()
+    transport = httpx.ASGITransport(app=main.app)
+    latencies = []
+    statuses = {}
+    todo_ids = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        for i in range(20):
+            response = await client.post("/todos", json={"title": f"seed {i}"})
+            if response.status_code == 201:
+                todo_ids.append(response.json()["id"])
+
+        deadline = time.perf_counter() + duration
+
+        async def worker(index):
+            count = index
+            while time.perf_counter() < deadline:
+                method = MIX[count % len(MIX)]
+                count += 1
+                start = time.perf_counter()
+                if method == "GET":
+                    response = await client.get("/todos")
+                elif method == "POST" or not todo_ids:
+                    response = await client.post("/todos", json={"title": "load"})
+                else:
+                    todo_id = todo_ids[count % len(todo_ids)]
+                    response = await client.put(f"/todos/{todo_id}", json={"completed": count % 2 == 0})
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+                if response.status_code < 500:
+                    latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        metrics = (await client.get("/metrics")).json()
+
+    await main.app.router.shutdown()
+
+    latencies.sort()
+    total = sum(statuses.values())
+    print(json.dumps({
+        "throughput": round(total / duration, 1),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 1) if latencies else None,
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 1) if latencies else None,
+        "error_rate": round(sum(n for code, n in statuses.items() if code >= 500) / max(total, 1), 4),
+        "admission_limit": metrics["admission_control"]["limit"],
+        "circuit": metrics["resilience"]["circuit_breaker"].get("state"),
+        "injected": metrics.get("fault_injection"),
+    }))
+
+
+def main():
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print(f"同時実行数: {concurrency} / {duration}秒")
+    for name, profile in SCENARIOS.items():
+        env = {
+            **os.environ,
+            "TODO_BACKEND": "memory",
+            "FAULT_INJECTION_ENABLED": "true",
+            "TODO_STATS_RECONCILE_INTERVAL": "0",
+            **profile,
+        }
+        result = subprocess.run(
+            [sys.executable, __file__, "--run", str(concurrency), str(duration)],
+            env=env,
+            capture_output=True,
+            text=True
+        )
+        lines = result.stdout.strip().splitlines()
+        if result.returncode != 0 or not lines:
+            print(f"{name:<10} 失敗しました\n{result.stderr}")
+            continue
+        print(f"{name:<10} {lines[-1]}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--run":
+        asyncio.run(run_scenario(int(sys.argv[2]), float(sys.argv[3])))
+    else:
+        main()
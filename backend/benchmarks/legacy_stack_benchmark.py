@@ -0,0 +1,119 @@
+"""
+旧API（backend/main.py）とクリーンアーキテクチャ版（src/main.py の互換ルーター）の比較
+
+同じDynamoDBに対して両方のアプリで作成・一覧取得・更新・削除を繰り返し、
+リクエストあたりのレイテンシを比較する。旧APIはリクエストごとにboto3のリソースを
+作成するため、その分のコストが差として現れる。
+
+実行方法（backendディレクトリで、DynamoDB Localを起動した状態で）:
+    DYNAMODB_ENDPOINT=http://localhost:8001 python benchmarks/legacy_stack_benchmark.py [繰り返し回数]
+"""
+import asyncio
+import importlib.util
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+SRC_DIR = os.path.join(BACKEND_DIR, "src")
+
+# 計測に影響するバックグラウンド処理を止め、互換ルーターを有効にする
+os.environ.setdefault("TODO_STATS_RECONCILE_INTERVAL", "0")
+os.environ.setdefault("ADMISSION_CONTROL_ENABLED", "false")
+os.environ["LEGACY_API_ENABLED"] = "true"
+
+import httpx  # noqa: E402
+
+
+# 一覧取得の前に作成しておくTODOの件数
+SEED_TODOS = 100
+
+
+def _load_module(name, path, search_path):
+    """同名のmain.pyを区別して読み込む"""
+    sys.path.insert(0, search_path)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _percentile(samples, ratio):
+    samples = sorted(samples)
+    return samples[max(0, int(len(samples) * ratio) - 1)] * 1000
+
+
+def _remove_tombstones():
+    """
+    削除済みの記録を消す
+
+    旧APIは削除済みの記録を知らず一覧取得で失敗するため、前回の実行で
+    クリーンアーキテクチャ版が残した記録を旧APIの計測前に消しておく
+    """
+    from dependencies import get_dynamodb_client
+
+    table = get_dynamodb_client().get_table("Todos")
+    scan_kwargs = {"FilterExpression": "attribute_exists(deleted)", "ProjectionExpression": "id"}
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            table.delete_item(Key={"id": item["id"]})
+        if "LastEvaluatedKey" not in response:
+            return
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+async def run(label, app, iterations):
+    latencies = {"POST": [], "GET": [], "PUT": [], "DELETE": []}
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def timed(method, url, **kwargs):
+            start = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies[method].append(time.perf_counter() - start)
+            response.raise_for_status()
+            return response
+
+        seeded = [
+            (await client.post("/todos", json={"title": f"seed {i}"})).json()["id"]
+            for i in range(SEED_TODOS)
+        ]
+
+        for i in range(iterations):
+            todo_id = (await timed("POST", "/todos", json={"title": f"{label} {i}"})).json()["id"]
+            await timed("GET", "/todos")
+            await timed("PUT", f"/todos/{todo_id}", json={"completed": True})
+            await timed("DELETE", f"/todos/{todo_id}")
+
+        for todo_id in seeded:
+            await client.delete(f"/todos/{todo_id}")
+
+    for method, samples in latencies.items():
+        print(
+            f"{label:<8}{method:<8}p50={_percentile(samples, 0.5):>8.2f}ms "
+            f"p99={_percentile(samples, 0.99):>8.2f}ms"
+        )
+
+
+async def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+    legacy = _load_module("legacy_main", os.path.join(BACKEND_DIR, "main.py"), BACKEND_DIR)
+    legacy.create_todo_table()
+
+    clean = _load_module("clean_main", os.path.join(SRC_DIR, "main.py"), SRC_DIR)
+    await clean.app.router.startup()
+
+    _remove_tombstones()
+
+    print(f"繰り返し回数: {iterations}（一覧取得の対象 {SEED_TODOS}件以上）")
+    try:
+        await run("legacy", legacy.app, iterations)
+        await run("clean", clean.app, iterations)
+    finally:
+        await clean.app.router.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
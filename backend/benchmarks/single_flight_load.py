@@ -0,0 +1,99 @@
+"""
+読み込みリクエスト集約の負荷テスト
+
+バースト的に同時発生する一覧取得・単体取得リクエストを再現し、
+集約の有無でバックエンド呼び出し回数とレイテンシを比較する。
+
+実行方法（backendディレクトリで）:
+    python benchmarks/single_flight_load.py
+"""
+import asyncio
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from application.single_flight import SingleFlight  # noqa: E402
+from application.use_cases.get_todos import GetTodosUseCase, GetTodoByIdUseCase  # noqa: E402
+from domain.entities.todo import Todo  # noqa: E402
+
+
+# バックエンド1回あたりの応答時間（秒）
+BACKEND_LATENCY = 0.02
+# バーストの回数と1バーストあたりの同時リクエスト数
+BURSTS = 20
+CONCURRENCY = 200
+
+
+class SlowRepository:
+    """呼び出し回数を数える遅いリポジトリ"""
+
+    def __init__(self):
+        self.calls = 0
+        now = datetime.now()
+        self.todos = [
+            Todo(id=str(i), title=f"todo {i}", description=None,
+                 completed=False, created_at=now, updated_at=now)
+            for i in range(100)
+        ]
+
+    async def find_all(self):
+        self.calls += 1
+        await asyncio.sleep(BACKEND_LATENCY)
+        return list(self.todos)
+
+    async def find_by_id(self, todo_id):
+        self.calls += 1
+        await asyncio.sleep(BACKEND_LATENCY)
+        return self.todos[int(todo_id)]
+
+
+async def _timed(coro):
+    start = time.perf_counter()
+    await coro
+    return time.perf_counter() - start
+
+
+async def run(single_flight):
+    repository = SlowRepository()
+    latencies = []
+
+    for burst in range(BURSTS):
+        requests = []
+        for i in range(CONCURRENCY):
+            # 半分は一覧、残りは人気のある数件への単体取得
+            if i % 2 == 0:
+                use_case = GetTodosUseCase(repository, single_flight)
+                requests.append(_timed(use_case.execute()))
+            else:
+                use_case = GetTodoByIdUseCase(repository, single_flight)
+                requests.append(_timed(use_case.execute(str(i % 5))))
+        latencies.extend(await asyncio.gather(*requests))
+
+    return repository.calls, latencies
+
+
+def _report(label, calls, latencies):
+    latencies = sorted(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{label:<14} requests={len(latencies):>6} backend_calls={calls:>6} "
+        f"p50={statistics.median(latencies) * 1000:.1f}ms p99={p99 * 1000:.1f}ms"
+    )
+
+
+async def main():
+    calls, latencies = await run(None)
+    _report("without", calls, latencies)
+
+    single_flight = SingleFlight()
+    calls, latencies = await run(single_flight)
+    _report("single-flight", calls, latencies)
+    print(single_flight.get_metrics())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
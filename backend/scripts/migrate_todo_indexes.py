@@ -0,0 +1,166 @@
+"""
+以前のバージョンで保存したTODOをインデックスに含めるための移行
+
+差分同期（updated_at-index）と作成順の一覧取得（order_key-index）のインデックスは
+sync_pk を、保持期限の取得（expires_at-index）のインデックスは expiry_pk を
+パーティションキーとするため、これらを持たないTODOは各インデックスに含まれない。
+アプリケーションは起動時にインデックスを作成・待機しない（使えるようになるまでは
+インデックスを使う読み込みをスキャンで代替する）ため、インデックスの作成もこのスクリプトで行う。
+インデックスがなければ1つずつ作成して使えるようになるまで待ち、その後、
+以下が不足しているTODOを1件ずつ更新する:
+  - sync_pk（インデックスのパーティションキー）
+  - order_key（作成順のキー）
+  - expiry_pk（保持期限のあるTODOのみ。保持期限のインデックスのパーティションキー）
+  - created_at / updated_at のUTCでの保存形式（以前はタイムゾーンのないローカル時刻）
+
+更新は、読み込んだ時点から変更されていない（updated_at が同じ）TODOに対してのみ行うため、
+アプリケーションを動かしたまま実行できる。既に移行済みのTODOはスキャンの条件で除くため、
+何度実行してもよく、途中で止まった場合はもう一度実行すれば残りを移行する。
+--checkpoint を指定すると読み終えた位置をファイルに記録し、次回はその位置から再開する。
+
+実行方法（backendディレクトリで）:
+    DYNAMODB_ENDPOINT=http://localhost:8001 python scripts/migrate_todo_indexes.py
+    python scripts/migrate_todo_indexes.py --checkpoint migrate.checkpoint --page-size 200
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from botocore.exceptions import ClientError  # noqa: E402
+
+from domain.entities.todo_order import todo_order_key  # noqa: E402
+from infrastructure.database.dynamodb_client import (  # noqa: E402
+    ORDER_KEY_ATTRIBUTE,
+    SYNC_PARTITION_KEY,
+    EXPIRY_PARTITION_KEY_ATTRIBUTE,
+    TTL_ATTRIBUTE_NAME,
+    DynamoDBClient
+)
+from infrastructure.database.timestamps import from_storage_timestamp, to_storage_timestamp  # noqa: E402
+
+# UTCで保存した日時の末尾
+UTC_SUFFIX = "+00:00"
+
+
+def _load_checkpoint(path):
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return None
+
+
+def _save_checkpoint(path, start_key):
+    if not path:
+        return
+    if start_key is None:
+        if os.path.exists(path):
+            os.unlink(path)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(start_key, f)
+
+
+def migrate_item(table, item) -> bool:
+    """
+    1件のTODOを移行する
+
+    Returns:
+        更新した場合はTrue（読み込んだ後に変更・削除されていた場合はFalse）
+    """
+    created_at = from_storage_timestamp(item['created_at'])
+    update_expression = (
+        'SET sync_pk = :sync_pk, #order_key = :order_key, '
+        'created_at = :created_at, updated_at = :updated_at'
+    )
+    names = {'#order_key': ORDER_KEY_ATTRIBUTE}
+    values = {
+        ':sync_pk': SYNC_PARTITION_KEY,
+        ':order_key': todo_order_key(item['id'], created_at),
+        ':created_at': to_storage_timestamp(created_at),
+        ':updated_at': to_storage_timestamp(from_storage_timestamp(item['updated_at'])),
+        ':seen': item['updated_at'],
+    }
+    if TTL_ATTRIBUTE_NAME in item:
+        update_expression += ', #expiry_pk = :sync_pk'
+        names['#expiry_pk'] = EXPIRY_PARTITION_KEY_ATTRIBUTE
+    try:
+        table.update_item(
+            Key={'id': item['id']},
+            UpdateExpression=update_expression,
+            ConditionExpression='updated_at = :seen AND attribute_not_exists(deleted)',
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values
+        )
+        return True
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+            raise
+        # アプリケーションが保存し直したTODOは既に新しい形式になっている
+        return False
+
+
+def migrate(table, page_size: int, checkpoint: str = None) -> dict:
+    """移行が必要なTODOをページ単位でスキャンして移行する"""
+    scan_kwargs = {
+        'FilterExpression': (
+            'attribute_exists(created_at) AND attribute_exists(updated_at) '
+            'AND attribute_not_exists(deleted) AND ('
+            'attribute_not_exists(sync_pk) OR attribute_not_exists(#order_key) '
+            'OR (attribute_exists(#ttl) AND attribute_not_exists(#expiry_pk)) '
+            'OR NOT contains(updated_at, :utc) OR NOT contains(created_at, :utc))'
+        ),
+        'ProjectionExpression': 'id, created_at, updated_at, #ttl',
+        'ExpressionAttributeNames': {
+            '#order_key': ORDER_KEY_ATTRIBUTE,
+            '#ttl': TTL_ATTRIBUTE_NAME,
+            '#expiry_pk': EXPIRY_PARTITION_KEY_ATTRIBUTE,
+        },
+        'ExpressionAttributeValues': {':utc': UTC_SUFFIX},
+        'Limit': page_size,
+    }
+    start_key = _load_checkpoint(checkpoint)
+    if start_key is not None:
+        print(f"前回の続きから再開します: {start_key}")
+        scan_kwargs['ExclusiveStartKey'] = start_key
+
+    result = {"scanned": 0, "migrated": 0, "skipped": 0}
+    while True:
+        response = table.scan(**scan_kwargs)
+        result["scanned"] += response.get('ScannedCount', 0)
+        for item in response.get('Items', []):
+            if migrate_item(table, item):
+                result["migrated"] += 1
+            else:
+                result["skipped"] += 1
+
+        start_key = response.get('LastEvaluatedKey')
+        _save_checkpoint(checkpoint, start_key)
+        if start_key is None:
+            return result
+        scan_kwargs['ExclusiveStartKey'] = start_key
+        print(f"スキャン {result['scanned']}件 / 移行 {result['migrated']}件")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="以前のバージョンで保存したTODOをインデックスに含める")
+    parser.add_argument("--page-size", type=int, default=100, help="1回のスキャンで読み込む件数")
+    parser.add_argument("--checkpoint", help="読み終えた位置を記録するファイル（中断後の再開に使う）")
+    args = parser.parse_args()
+
+    dynamodb_client = DynamoDBClient()
+    table = dynamodb_client.get_table("Todos")
+    table.load()
+    dynamodb_client.ensure_todo_indexes(table)
+
+    result = migrate(table, args.page_size, args.checkpoint)
+    print(
+        f"完了しました: スキャン {result['scanned']}件 / 移行 {result['migrated']}件 / "
+        f"変更済みのため省略 {result['skipped']}件"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Application層: ユースケースの例外
+"""
+
+
+class IdempotencyKeyConflictError(Exception):
+    """同じ冪等キーで異なる内容のリクエストが送られた"""
+    pass
+
+
+class IdempotencyKeyInProgressError(Exception):
+    """同じ冪等キーのリクエストが処理中"""
+    pass
+
+
+class TodoCursorNotFoundError(Exception):
+    """ページの位置として指定したTODOが見つからない"""
+    pass
+
+
+class ImportJobNotFoundError(Exception):
+    """本文を受け取るインポートジョブが見つからない"""
+    pass
+
+
+class ImportJobAlreadyStartedError(Exception):
+    """インポートジョブが既に本文を受け取っている"""
+    pass
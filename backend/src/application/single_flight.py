@@ -0,0 +1,76 @@
+"""
+Application層: 同時実行される同一リクエストの集約
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+
+T = TypeVar("T")
+
+
+class _Call:
+    """実行中の呼び出し"""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    同じキーの呼び出しが同時に実行された場合に、1回の実行結果を共有する
+
+    実行中の呼び出しに後から参加した呼び出し元は、新たに処理を実行せず
+    同じ結果（または例外）を受け取る。完了後の呼び出しは新たに実行される。
+    呼び出し元がキャンセルされても他の呼び出し元には影響せず、
+    全ての呼び出し元がいなくなった場合のみ処理をキャンセルする。
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._metrics = {
+            "calls": 0,
+            "executions": 0,
+            "shared": 0,
+        }
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        キーごとに処理を1回だけ実行し、その結果を返す
+
+        Args:
+            key: 同一リクエストを識別するキー
+            fn: 実行する処理
+
+        Returns:
+            処理の結果
+        """
+        self._metrics["calls"] += 1
+
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            self._metrics["executions"] += 1
+        else:
+            self._metrics["shared"] += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # 待っている呼び出し元がいなくなったので処理を中断
+                self._forget(key, call)
+                call.task.cancel()
+
+    def _forget(self, key: Hashable, call: _Call) -> None:
+        """完了した呼び出しを削除"""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """集約のメトリクスを取得"""
+        return {**self._metrics, "in_flight": len(self._calls)}
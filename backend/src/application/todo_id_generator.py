@@ -0,0 +1,63 @@
+"""
+Application層: 作成時刻順に並ぶTODO IDの生成
+"""
+import os
+import threading
+import time
+import uuid
+from typing import Tuple
+
+
+class TodoIdGenerator:
+    """
+    UUIDv7（RFC 9562）形式のIDを生成する
+
+    先頭48ビットがUNIX時刻（ミリ秒）のため、文字列として比較すると作成順に並ぶ。
+    同じミリ秒内に生成したIDは、続く12ビットをカウンターとして増やすことで
+    プロセス内では必ず生成順に並ぶようにする（カウンターが尽きた場合は時刻を1ミリ秒進める）。
+    """
+
+    # 同じミリ秒内のカウンターの初期値の上限（残りを増分に使う）
+    _COUNTER_SEED_LIMIT = 1 << 11
+    _COUNTER_MAX = (1 << 12) - 1
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_milliseconds = 0
+        self._counter = 0
+
+    def _next_timestamp(self) -> Tuple[int, int]:
+        """(ミリ秒, カウンター)を取得"""
+        milliseconds = time.time_ns() // 1_000_000
+        with self._lock:
+            if milliseconds > self._last_milliseconds:
+                self._last_milliseconds = milliseconds
+                self._counter = int.from_bytes(os.urandom(2), "big") % self._COUNTER_SEED_LIMIT
+            elif self._counter < self._COUNTER_MAX:
+                # 同じミリ秒内（または時計が戻った場合）は直前の時刻のまま数を増やす
+                self._counter += 1
+            else:
+                self._last_milliseconds += 1
+                self._counter = 0
+            return self._last_milliseconds, self._counter
+
+    def generate(self) -> str:
+        """新しいIDを生成"""
+        milliseconds, counter = self._next_timestamp()
+        random_bits = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+        value = (
+            (milliseconds & ((1 << 48) - 1)) << 80
+            | 0x7 << 76
+            | counter << 64
+            | 0b10 << 62
+            | random_bits
+        )
+        return str(uuid.UUID(int=value))
+
+
+_generator = TodoIdGenerator()
+
+
+def new_todo_id() -> str:
+    """新しいTODO IDを生成（作成時刻順に並ぶ）"""
+    return _generator.generate()
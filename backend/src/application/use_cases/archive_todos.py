@@ -0,0 +1,108 @@
+"""
+Application層: TODOアーカイブユースケース
+"""
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from domain.entities.todo import Todo
+from domain.events.todo_event import TODO_DELETED, TodoEvent, TodoEventPublisher
+from domain.repositories.todo_archive_repository import TodoArchiveRepository
+from domain.repositories.todo_repository import TodoRepository
+from domain.repositories.todo_stats_repository import TodoStatsRepository
+
+
+class ArchiveExpiringTodosUseCase:
+    """保持期間が切れるTODOをアーカイブに移すユースケース"""
+
+    def __init__(
+        self,
+        todo_repository: TodoRepository,
+        archive_repository: TodoArchiveRepository,
+        event_publisher: Optional[TodoEventPublisher] = None,
+        lead_time: timedelta = timedelta(hours=1),
+        batch_size: int = 100,
+        stats_repository: Optional[TodoStatsRepository] = None
+    ):
+        self.todo_repository = todo_repository
+        self.archive_repository = archive_repository
+        self.event_publisher = event_publisher
+        self.stats_repository = stats_repository
+        # DynamoDBのTTLで削除される前にアーカイブするための猶予
+        self.lead_time = lead_time
+        self.batch_size = batch_size
+
+    async def execute(self) -> int:
+        """
+        保持期間が切れる（まもなく切れる）TODOをアーカイブに移す
+
+        取得してから削除するまでの間に未完了に戻されたTODOや、他のプロセスが
+        先にアーカイブしたTODOを移さないよう、完了済みで保持期限が取得時のままの
+        TODOだけを条件付きで削除し、削除できたものだけをアーカイブに書き込む。
+        アーカイブへの書き込みに失敗した場合は削除したTODOを元に戻す。
+
+        Returns:
+            アーカイブしたTODOの件数
+        """
+        todos = await self.todo_repository.find_expiring_before(datetime.now() + self.lead_time)
+
+        archived = 0
+        for start in range(0, len(todos), self.batch_size):
+            batch = [
+                todo for todo in todos[start:start + self.batch_size]
+                if await self.todo_repository.delete_expiring(todo.id, todo.expires_at)
+            ]
+            if not batch:
+                continue
+
+            try:
+                await self.archive_repository.append(batch)
+            except Exception:
+                for todo in batch:
+                    await self.todo_repository.save(todo)
+                raise
+
+            if self.event_publisher is not None:
+                for todo in batch:
+                    await self.event_publisher.publish(
+                        TodoEvent(type=TODO_DELETED, todo_id=todo.id)
+                    )
+            archived += len(batch)
+
+            # アーカイブしたTODOを件数の集計から除く
+            if self.stats_repository is not None:
+                try:
+                    await self.stats_repository.increment(
+                        total=-len(batch),
+                        completed=-sum(1 for todo in batch if todo.completed)
+                    )
+                except Exception as e:
+                    print(f"TODO集計の更新に失敗しました: {str(e)}")
+
+        return archived
+
+
+class GetArchivedTodosUseCase:
+    """アーカイブされたTODO取得のユースケース"""
+
+    def __init__(self, archive_repository: TodoArchiveRepository):
+        self.archive_repository = archive_repository
+
+    async def execute(
+        self,
+        todo_id: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[Todo]:
+        """
+        アーカイブされたTODOを新しい順に取得する
+
+        Args:
+            todo_id: 絞り込むTODO ID（任意）
+            limit: 取得する最大件数
+            offset: 読み飛ばす件数
+
+        Returns:
+            TODOのリスト
+        """
+        todos = await self.archive_repository.find(todo_id=todo_id, limit=limit, offset=offset)
+        return todos
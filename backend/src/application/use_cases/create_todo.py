@@ -3,22 +3,42 @@ Application層: TODO作成ユースケース
 """
 from datetime import datetime
 from typing import Optional
-import uuid
+import hashlib
+import json
 
+from application.exceptions import IdempotencyKeyConflictError, IdempotencyKeyInProgressError
+from application.todo_id_generator import new_todo_id
 from domain.entities.todo import Todo
+from domain.events.todo_event import TODO_CREATED, TodoEvent, TodoEventPublisher
+from domain.repositories.idempotency_repository import IdempotencyRepository
 from domain.repositories.todo_repository import TodoRepository
+from domain.repositories.todo_stats_repository import TodoStatsRepository
+
+
+# 処理結果を冪等キーに記録する際の最大試行回数
+COMPLETE_MAX_ATTEMPTS = 2
 
 
 class CreateTodoUseCase:
     """TODO作成のユースケース"""
 
-    def __init__(self, todo_repository: TodoRepository):
+    def __init__(
+        self,
+        todo_repository: TodoRepository,
+        event_publisher: Optional[TodoEventPublisher] = None,
+        idempotency_repository: Optional[IdempotencyRepository] = None,
+        stats_repository: Optional[TodoStatsRepository] = None
+    ):
         self.todo_repository = todo_repository
+        self.event_publisher = event_publisher
+        self.idempotency_repository = idempotency_repository
+        self.stats_repository = stats_repository
 
     async def execute(
         self,
         title: str,
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        idempotency_key: Optional[str] = None
     ) -> Todo:
         """
         新しいTODOを作成する
@@ -26,17 +46,76 @@ class CreateTodoUseCase:
         Args:
             title: TODOのタイトル
             description: TODOの説明（任意）
+            idempotency_key: 冪等キー（任意）。同じキーでの再送には
+                新たに作成せず最初に作成したTODOを返す
 
         Returns:
             作成されたTODO
 
         Raises:
             ValueError: バリデーションエラー
+            IdempotencyKeyConflictError: 同じ冪等キーで異なる内容が送られた
+            IdempotencyKeyInProgressError: 同じ冪等キーのリクエストが処理中
+        """
+        if idempotency_key is None or self.idempotency_repository is None:
+            return await self._create(title, description)
+
+        request_hash = self._request_hash(title, description)
+
+        # 冪等キーを登録できなければ、以前のリクエストの結果を返す
+        claim_token = await self.idempotency_repository.claim(idempotency_key, request_hash)
+        if claim_token is None:
+            return await self._replay(idempotency_key, request_hash)
+
+        try:
+            todo = await self._create(title, description)
+        except Exception:
+            # 失敗した場合は同じキーで再試行できるようにする
+            await self.idempotency_repository.release(idempotency_key, claim_token)
+            raise
+
+        await self._complete(idempotency_key, claim_token, todo)
+        return todo
+
+    async def _complete(self, idempotency_key: str, claim_token: str, todo: Todo) -> None:
         """
+        処理結果を冪等キーに記録する
+
+        TODOは既に保存済みのため、記録に失敗しても作成は成功として返す
+        （エラーを返すとクライアントが再送し、リース期限後に重複して作成されるため）。
+        """
+        for attempt in range(1, COMPLETE_MAX_ATTEMPTS + 1):
+            try:
+                if not await self.idempotency_repository.complete(idempotency_key, claim_token, todo):
+                    print(f"冪等キーの記録を他のリクエストが登録し直しました: {idempotency_key}")
+                return
+            except Exception as e:
+                print(f"冪等キーの記録に失敗しました（{attempt}/{COMPLETE_MAX_ATTEMPTS}回目）: {str(e)}")
+
+    @staticmethod
+    def _request_hash(title: str, description: Optional[str]) -> str:
+        """リクエスト内容のハッシュを計算"""
+        payload = json.dumps({"title": title, "description": description}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _replay(self, idempotency_key: str, request_hash: str) -> Todo:
+        """以前のリクエストで作成したTODOを返す"""
+        record = await self.idempotency_repository.find(idempotency_key)
+
+        if record is not None and record.request_hash != request_hash:
+            raise IdempotencyKeyConflictError("同じ冪等キーで異なる内容のリクエストが送られました")
+
+        if record is None or not record.completed:
+            raise IdempotencyKeyInProgressError("同じ冪等キーのリクエストを処理中です")
+
+        return record.todo
+
+    async def _create(self, title: str, description: Optional[str]) -> Todo:
+        """TODOを作成して保存する"""
         # 新しいTODOエンティティを作成
         now = datetime.now()
         todo = Todo(
-            id=str(uuid.uuid4()),
+            id=new_todo_id(),
             title=title,
             description=description,
             completed=False,
@@ -47,4 +126,17 @@ class CreateTodoUseCase:
         # リポジトリに保存
         saved_todo = await self.todo_repository.save(todo)
 
+        # 件数の集計を更新（失敗しても作成は成功とし、ずれは定期的な再集計で補正する）
+        if self.stats_repository is not None:
+            try:
+                await self.stats_repository.increment(total=1)
+            except Exception as e:
+                print(f"TODO集計の更新に失敗しました: {str(e)}")
+
+        # 変更イベントを配信
+        if self.event_publisher is not None:
+            await self.event_publisher.publish(
+                TodoEvent(type=TODO_CREATED, todo_id=saved_todo.id, todo=saved_todo)
+            )
+
         return saved_todo
@@ -1,14 +1,25 @@
 """
 Application層: TODO削除ユースケース
 """
+from typing import Optional
+
+from domain.events.todo_event import TODO_DELETED, TodoEvent, TodoEventPublisher
 from domain.repositories.todo_repository import TodoRepository
+from domain.repositories.todo_stats_repository import TodoStatsRepository
 
 
 class DeleteTodoUseCase:
     """TODO削除のユースケース"""
 
-    def __init__(self, todo_repository: TodoRepository):
+    def __init__(
+        self,
+        todo_repository: TodoRepository,
+        event_publisher: Optional[TodoEventPublisher] = None,
+        stats_repository: Optional[TodoStatsRepository] = None
+    ):
         self.todo_repository = todo_repository
+        self.event_publisher = event_publisher
+        self.stats_repository = stats_repository
 
     async def execute(self, todo_id: str) -> bool:
         """
@@ -20,13 +31,26 @@ class DeleteTodoUseCase:
         Returns:
             削除成功の場合True、TODOが存在しない場合False
         """
-        # TODOの存在確認
-        exists = await self.todo_repository.exists(todo_id)
+        # 削除実行（存在するTODOを削除した場合のみ、削除前の内容が返る）
+        todo = await self.todo_repository.delete(todo_id)
 
-        if not exists:
+        if todo is None:
             return False
 
-        # 削除実行
-        result = await self.todo_repository.delete(todo_id)
-
-        return result
+        # 件数の集計を更新（削除したリクエストだけが、削除前の完了状態で減らす）
+        if self.stats_repository is not None:
+            try:
+                await self.stats_repository.increment(
+                    total=-1,
+                    completed=-1 if todo.completed else 0
+                )
+            except Exception as e:
+                print(f"TODO集計の更新に失敗しました: {str(e)}")
+
+        # 変更イベントを配信
+        if self.event_publisher is not None:
+            await self.event_publisher.publish(
+                TodoEvent(type=TODO_DELETED, todo_id=todo_id)
+            )
+
+        return True
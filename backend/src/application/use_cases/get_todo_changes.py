@@ -0,0 +1,50 @@
+"""
+Application層: TODO差分取得ユースケース
+"""
+from datetime import datetime, timedelta
+from typing import Optional
+
+from domain.entities.todo_changes import TodoChanges
+from domain.repositories.todo_repository import TodoRepository
+
+
+class GetTodoChangesUseCase:
+    """TODO差分取得のユースケース"""
+
+    def __init__(
+        self,
+        todo_repository: TodoRepository,
+        tombstone_retention: timedelta = timedelta(days=7),
+        overlap: timedelta = timedelta(seconds=5)
+    ):
+        self.todo_repository = todo_repository
+        self.tombstone_retention = tombstone_retention
+        # 基準時刻より前にさかのぼって取得する期間
+        # （インデックスへの反映の遅れや、同じ時刻の書き込みを取りこぼさないため）
+        self.overlap = overlap
+
+    async def execute(self, since: datetime) -> Optional[TodoChanges]:
+        """
+        指定時刻より後に作成・更新・削除されたTODOを取得する
+
+        基準時刻より overlap だけ前から取得するため、前回と同じ変更が重複して
+        含まれることがある。クライアントはIDと更新日時で重複を除いて反映する。
+
+        Args:
+            since: 前回取得時の基準時刻
+
+        Returns:
+            TODO差分（削除の記録が保持期間を過ぎていて差分を返せない場合はNone）
+        """
+        # 保存されている時刻はタイムゾーンなしのローカル時刻
+        if since.tzinfo is not None:
+            since = since.astimezone().replace(tzinfo=None)
+
+        # 削除の記録が消えている可能性があるため、全件の再取得が必要
+        if since < datetime.now() - self.tombstone_retention:
+            return None
+
+        changes = await self.todo_repository.find_changes_since(since - self.overlap)
+        # 重複期間の分だけ基準時刻が戻らないようにする
+        changes.watermark = max(changes.watermark, since)
+        return changes
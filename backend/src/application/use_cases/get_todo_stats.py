@@ -0,0 +1,45 @@
+"""
+Application層: TODO集計ユースケース
+"""
+from domain.entities.todo_stats import TodoStats
+from domain.repositories.todo_repository import TodoRepository
+from domain.repositories.todo_stats_repository import TodoStatsRepository
+
+
+class GetTodoStatsUseCase:
+    """TODO件数の集計取得のユースケース"""
+
+    def __init__(self, stats_repository: TodoStatsRepository):
+        self.stats_repository = stats_repository
+
+    async def execute(self) -> TodoStats:
+        """
+        TODOの件数の集計を取得する
+
+        Returns:
+            全件数・完了件数の集計
+        """
+        stats = await self.stats_repository.get()
+        return stats
+
+
+class ReconcileTodoStatsUseCase:
+    """TODO件数の集計を実際の件数で補正するユースケース"""
+
+    def __init__(self, todo_repository: TodoRepository, stats_repository: TodoStatsRepository):
+        self.todo_repository = todo_repository
+        self.stats_repository = stats_repository
+
+    async def execute(self) -> TodoStats:
+        """
+        テーブルを数え直して集計を置き換える
+
+        数え直している間に行われた作成・削除は反映されない場合があるが、
+        次回の補正で解消される
+
+        Returns:
+            数え直した集計
+        """
+        stats = await self.todo_repository.count()
+        await self.stats_repository.overwrite(stats)
+        return stats
@@ -1,34 +1,109 @@
 """
 Application層: TODO取得ユースケース
 """
-from typing import List, Optional
+import functools
+from typing import FrozenSet, List, Optional, Union
 
+from application.exceptions import TodoCursorNotFoundError
+from application.single_flight import SingleFlight
+from domain.entities.partial_todo import PartialTodo
 from domain.entities.todo import Todo
+from domain.entities.todo_order import is_time_ordered_id, todo_order_key
 from domain.repositories.todo_repository import TodoRepository
 
 
 class GetTodosUseCase:
     """TODO一覧取得のユースケース"""
 
-    def __init__(self, todo_repository: TodoRepository):
+    def __init__(
+        self,
+        todo_repository: TodoRepository,
+        single_flight: Optional[SingleFlight] = None
+    ):
         self.todo_repository = todo_repository
+        self.single_flight = single_flight
 
-    async def execute(self) -> List[Todo]:
+    async def execute(
+        self,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> Union[List[Todo], List[PartialTodo]]:
         """
         全てのTODOを取得する
 
+        Args:
+            fields: 取得する項目（任意）。指定した場合はその項目だけを持つPartialTodoを返す
+
         Returns:
             TODOのリスト
         """
-        todos = await self.todo_repository.find_all()
+        if fields is None:
+            key = ("find_all",)
+            fn = self.todo_repository.find_all
+        else:
+            key = ("find_all_partial", frozenset(fields))
+            fn = functools.partial(self.todo_repository.find_all_partial, frozenset(fields))
+
+        if self.single_flight is None:
+            return await fn()
+
+        # 同時に実行された一覧取得は1回のスキャン結果を共有する（取得する項目ごと）
+        todos = await self.single_flight.do(key, fn)
         return todos
 
 
+class GetTodoPageUseCase:
+    """作成順のTODO一覧（ページ単位）取得のユースケース"""
+
+    def __init__(self, todo_repository: TodoRepository):
+        self.todo_repository = todo_repository
+
+    async def execute(
+        self,
+        limit: int,
+        before: Optional[str] = None,
+        after: Optional[str] = None
+    ) -> List[Todo]:
+        """
+        TODOを新しい順に取得する
+
+        Args:
+            limit: 最大件数
+            before: このIDのTODOより前に作成されたTODOを取得する（次のページ）
+            after: このIDのTODOより後に作成されたTODOを取得する（前のページ）
+
+        Returns:
+            TODOのリスト（新しい順）
+
+        Raises:
+            TodoCursorNotFoundError: before / after に指定したTODOが見つからない
+        """
+        before_key = await self._order_key(before) if before is not None else None
+        after_key = await self._order_key(after) if after is not None else None
+        return await self.todo_repository.find_page(limit, before_key, after_key)
+
+    async def _order_key(self, todo_id: str) -> str:
+        """IDを作成順のキーに変換"""
+        # 作成時刻順のIDはそのままキーになるため、取得は不要
+        if is_time_ordered_id(todo_id):
+            return todo_order_key(todo_id, None)
+
+        # 以前のランダムなIDは作成日時からキーを求める
+        todo = await self.todo_repository.find_by_id(todo_id)
+        if todo is None:
+            raise TodoCursorNotFoundError(f"TODO {todo_id} が見つかりません")
+        return todo_order_key(todo.id, todo.created_at)
+
+
 class GetTodoByIdUseCase:
     """TODO単体取得のユースケース"""
 
-    def __init__(self, todo_repository: TodoRepository):
+    def __init__(
+        self,
+        todo_repository: TodoRepository,
+        single_flight: Optional[SingleFlight] = None
+    ):
         self.todo_repository = todo_repository
+        self.single_flight = single_flight
 
     async def execute(self, todo_id: str) -> Optional[Todo]:
         """
@@ -40,5 +115,12 @@ class GetTodoByIdUseCase:
         Returns:
             TODO（存在しない場合はNone）
         """
-        todo = await self.todo_repository.find_by_id(todo_id)
+        if self.single_flight is None:
+            return await self.todo_repository.find_by_id(todo_id)
+
+        # 同じIDへの同時リクエストは1回の取得結果を共有する
+        todo = await self.single_flight.do(
+            ("find_by_id", todo_id),
+            lambda: self.todo_repository.find_by_id(todo_id)
+        )
         return todo
@@ -0,0 +1,230 @@
+"""
+Application層: TODO一括インポートユースケース
+"""
+import asyncio
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Set
+
+from application.exceptions import ImportJobAlreadyStartedError, ImportJobNotFoundError
+from application.todo_id_generator import new_todo_id
+from domain.entities.import_job import (
+    IMPORT_JOB_COMPLETED,
+    IMPORT_JOB_FAILED,
+    IMPORT_JOB_PENDING,
+    IMPORT_JOB_RUNNING,
+    ImportJob,
+    ImportRowError
+)
+from domain.entities.todo import Todo
+from domain.repositories.import_job_repository import ImportJobRepository
+from domain.repositories.todo_repository import TodoRepository
+from domain.repositories.todo_stats_repository import TodoStatsRepository
+
+
+@dataclass
+class ImportRow:
+    """インポートする1行（検証に失敗した行はerrorを持つ）"""
+    row: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    error: Optional[str] = None
+
+
+class ImportTodosUseCase:
+    """
+    TODO一括インポートのユースケース
+
+    ジョブを先に作成してIDを返し、本文はそのジョブに対して別途受け取る。
+    行を少しずつ読み込み、一定件数ごとにまとめて保存する。同時に保存する
+    バッチの数に上限を設けるため、読み込みが保存より先に進みすぎることはなく、
+    メモリ使用量は入力の大きさによらず一定に保たれる。
+    """
+
+    # 実行中のジョブのタスク（完了前にガベージコレクションされないよう保持する）
+    _running: Set[asyncio.Task] = set()
+
+    def __init__(
+        self,
+        todo_repository: TodoRepository,
+        job_repository: ImportJobRepository,
+        stats_repository: Optional[TodoStatsRepository] = None,
+        batch_size: int = 25,
+        max_concurrency: int = 4,
+        max_errors: int = 100
+    ):
+        self.todo_repository = todo_repository
+        self.job_repository = job_repository
+        self.stats_repository = stats_repository
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        # ジョブに記録する失敗した行の最大件数
+        self.max_errors = max_errors
+
+    async def create(self) -> ImportJob:
+        """
+        本文を受け取る前のインポートジョブを作成する
+
+        本文の受信中もジョブIDで進捗を確認できるよう、先にIDを返すために使う。
+        """
+        job = ImportJob(id=str(uuid.uuid4()))
+        await self.job_repository.save(job)
+        return job
+
+    async def start(self, job_id: str, rows: AsyncIterator[ImportRow]) -> ImportJob:
+        """
+        作成済みのジョブでインポートを開始する
+
+        入力を読み終えるまで待ち、保存は読み込みと並行してバッチごとに進める。
+        同時に保存するバッチが上限に達している間は読み込みを止めるため、
+        受信側にも背圧がかかる。進捗は読み込み中もジョブに反映され、
+        読み終えた時点で戻り、残りの保存はバックグラウンドで続ける。
+
+        Args:
+            job_id: create() で作成したジョブのID
+            rows: インポートする行（受信中の本文から順に解析する非同期イテレーター）
+
+        Returns:
+            開始したジョブ
+
+        Raises:
+            ImportJobNotFoundError: ジョブが見つからない
+            ImportJobAlreadyStartedError: ジョブが既に本文を受け取っている
+            入力の読み込み中に発生した例外（ジョブは失敗として記録する）
+        """
+        job = await self.job_repository.find_by_id(job_id)
+        if job is None:
+            raise ImportJobNotFoundError(f"インポートジョブ {job_id} が見つかりません")
+        if job.status != IMPORT_JOB_PENDING:
+            raise ImportJobAlreadyStartedError(f"インポートジョブ {job_id} は既に開始しています")
+
+        job.status = IMPORT_JOB_RUNNING
+        job.started_at = datetime.now()
+        await self.job_repository.save(job)
+        in_flight: Set[asyncio.Task] = set()
+
+        try:
+            batch: List[ImportRow] = []
+            async for row in rows:
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    in_flight = await self._submit(job, batch, in_flight)
+                    batch = []
+            if batch:
+                in_flight = await self._submit(job, batch, in_flight)
+        except BaseException as e:
+            # 受信の中断（切断によるキャンセルを含む）や上限超過の場合は保存中のバッチも止める
+            for task in in_flight:
+                task.cancel()
+            job.status = IMPORT_JOB_FAILED
+            job.error = str(e) or type(e).__name__
+            job.finished_at = datetime.now()
+            await self.job_repository.save(job)
+            print(f"TODOのインポートに失敗しました: {job.error}")
+            raise
+
+        task = asyncio.create_task(self._finish(job, in_flight))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+        return job
+
+    async def _submit(
+        self,
+        job: ImportJob,
+        batch: List[ImportRow],
+        in_flight: Set[asyncio.Task]
+    ) -> Set[asyncio.Task]:
+        """1バッチ分の保存を開始（同時に保存するバッチが上限に達している場合は空くまで待つ）"""
+        todos = self._to_todos(job, batch)
+        if not todos:
+            return in_flight
+        if len(in_flight) >= self.max_concurrency:
+            _, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        in_flight.add(asyncio.create_task(self._save_batch(job, todos)))
+        return in_flight
+
+    async def _finish(self, job: ImportJob, in_flight: Set[asyncio.Task]) -> None:
+        """残りの保存を待ってジョブを完了にする"""
+        try:
+            if in_flight:
+                await asyncio.wait(in_flight)
+            job.status = IMPORT_JOB_COMPLETED
+        except Exception as e:
+            job.status = IMPORT_JOB_FAILED
+            job.error = str(e)
+            print(f"TODOのインポートに失敗しました: {str(e)}")
+        finally:
+            job.finished_at = datetime.now()
+            await self.job_repository.save(job)
+
+    def _record_error(self, job: ImportJob, row: int, message: str) -> None:
+        """失敗した行を記録"""
+        job.failed += 1
+        if len(job.errors) < self.max_errors:
+            job.errors.append(ImportRowError(row=row, message=message))
+
+    def _to_todos(self, job: ImportJob, batch: List[ImportRow]) -> Dict[int, Todo]:
+        """行をTodoエンティティに変換（行番号 -> TODO）"""
+        todos: Dict[int, Todo] = {}
+        now = datetime.now()
+        for row in batch:
+            job.processed += 1
+            if row.error is not None:
+                self._record_error(job, row.row, row.error)
+                continue
+            try:
+                todos[row.row] = Todo(
+                    id=new_todo_id(),
+                    title=row.title,
+                    description=row.description,
+                    completed=False,
+                    created_at=now,
+                    updated_at=now
+                )
+            except ValueError as e:
+                self._record_error(job, row.row, str(e))
+        return todos
+
+    async def _save_batch(self, job: ImportJob, todos: Dict[int, Todo]) -> None:
+        """1バッチ分のTODOを保存"""
+        try:
+            failed_ids = set(await self.todo_repository.save_many(list(todos.values())))
+        except Exception as e:
+            for row in todos:
+                self._record_error(job, row, f"保存に失敗しました: {str(e)}")
+            return
+
+        for row, todo in todos.items():
+            if todo.id in failed_ids:
+                self._record_error(job, row, "保存に失敗しました")
+
+        imported = len(todos) - len(failed_ids)
+        job.imported += imported
+
+        # 件数の集計を更新（失敗しても定期的な再集計で補正される）
+        if self.stats_repository is not None and imported:
+            try:
+                await self.stats_repository.increment(total=imported)
+            except Exception as e:
+                print(f"TODO集計の更新に失敗しました: {str(e)}")
+
+
+class GetImportJobUseCase:
+    """インポートジョブ取得のユースケース"""
+
+    def __init__(self, job_repository: ImportJobRepository):
+        self.job_repository = job_repository
+
+    async def execute(self, job_id: str) -> Optional[ImportJob]:
+        """
+        インポートジョブの進捗を取得する
+
+        Args:
+            job_id: ジョブID
+
+        Returns:
+            ジョブ（存在しない場合はNone）
+        """
+        job = await self.job_repository.find_by_id(job_id)
+        return job
@@ -1,17 +1,30 @@
 """
 Application層: TODO更新ユースケース
 """
+from datetime import timedelta
 from typing import Optional
 
 from domain.entities.todo import Todo
+from domain.events.todo_event import TODO_UPDATED, TodoEvent, TodoEventPublisher
 from domain.repositories.todo_repository import TodoRepository
+from domain.repositories.todo_stats_repository import TodoStatsRepository
 
 
 class UpdateTodoUseCase:
     """TODO更新のユースケース"""
 
-    def __init__(self, todo_repository: TodoRepository):
+    def __init__(
+        self,
+        todo_repository: TodoRepository,
+        event_publisher: Optional[TodoEventPublisher] = None,
+        completed_retention: Optional[timedelta] = None,
+        stats_repository: Optional[TodoStatsRepository] = None
+    ):
         self.todo_repository = todo_repository
+        self.event_publisher = event_publisher
+        # 完了したTODOを保持する期間（Noneの場合は無期限）
+        self.completed_retention = completed_retention
+        self.stats_repository = stats_repository
 
     async def execute(
         self,
@@ -41,6 +54,8 @@ class UpdateTodoUseCase:
         if todo is None:
             return None
 
+        was_completed = todo.completed
+
         # エンティティのメソッドを使用して更新
         if title is not None:
             todo.update_title(title)
@@ -50,11 +65,24 @@ class UpdateTodoUseCase:
 
         if completed is not None:
             if completed:
-                todo.mark_as_completed()
+                todo.mark_as_completed(self.completed_retention)
             else:
                 todo.mark_as_incomplete()
 
         # 更新をリポジトリに保存
         updated_todo = await self.todo_repository.save(todo)
 
+        # 完了状態が変わった場合は件数の集計を更新
+        if self.stats_repository is not None and updated_todo.completed != was_completed:
+            try:
+                await self.stats_repository.increment(completed=1 if updated_todo.completed else -1)
+            except Exception as e:
+                print(f"TODO集計の更新に失敗しました: {str(e)}")
+
+        # 変更イベントを配信
+        if self.event_publisher is not None:
+            await self.event_publisher.publish(
+                TodoEvent(type=TODO_UPDATED, todo_id=updated_todo.id, todo=updated_todo)
+            )
+
         return updated_todo
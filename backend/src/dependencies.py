@@ -2,15 +2,38 @@
 依存性注入の設定
 FastAPIのDependsと組み合わせて使用
 """
-from typing import Annotated
+import os
+from datetime import timedelta
+from typing import Annotated, Optional
 from fastapi import Depends
 
 from infrastructure.database.dynamodb_client import DynamoDBClient
-from infrastructure.repositories.dynamodb_todo_repository import DynamoDBTodoRepository
+from infrastructure.repositories.write_behind_todo_repository import WriteBehindTodoRepository
+from infrastructure.repositories.fault_injecting_todo_repository import FaultInjectingTodoRepository
+from infrastructure.repositories.in_memory_todo_repository import InMemoryTodoRepository
+from infrastructure.repositories.in_memory_todo_stats_repository import InMemoryTodoStatsRepository
+from infrastructure.repositories.in_memory_idempotency_repository import InMemoryIdempotencyRepository
+from infrastructure.repositories.in_memory_import_job_repository import InMemoryImportJobRepository
+from infrastructure.fault_injection.fault_injector import FaultInjector, FaultProfile
+from infrastructure.archive.file_todo_archive_repository import FileTodoArchiveRepository
+from infrastructure.profiling.profile_store import ProfileStore
+from infrastructure.resilience.circuit_breaker import CircuitBreaker
+from infrastructure.resilience.resilient_caller import ResilientCaller
+from infrastructure.events.in_memory_todo_event_broker import InMemoryTodoEventBroker
+from domain.events.todo_event import TodoEventPublisher
+from domain.repositories.idempotency_repository import IdempotencyRepository
+from domain.repositories.import_job_repository import ImportJobRepository
+from domain.repositories.todo_archive_repository import TodoArchiveRepository
 from domain.repositories.todo_repository import TodoRepository
+from domain.repositories.todo_stats_repository import TodoStatsRepository
 
+from application.single_flight import SingleFlight
 from application.use_cases.create_todo import CreateTodoUseCase
-from application.use_cases.get_todos import GetTodosUseCase, GetTodoByIdUseCase
+from application.use_cases.get_todos import GetTodosUseCase, GetTodoByIdUseCase, GetTodoPageUseCase
+from application.use_cases.get_todo_changes import GetTodoChangesUseCase
+from application.use_cases.get_todo_stats import GetTodoStatsUseCase, ReconcileTodoStatsUseCase
+from application.use_cases.import_todos import GetImportJobUseCase, ImportTodosUseCase
+from application.use_cases.archive_todos import ArchiveExpiringTodosUseCase, GetArchivedTodosUseCase
 from application.use_cases.update_todo import UpdateTodoUseCase
 from application.use_cases.delete_todo import DeleteTodoUseCase
 
@@ -18,6 +41,100 @@ from application.use_cases.delete_todo import DeleteTodoUseCase
 # DynamoDBクライアントのシングルトン
 _dynamodb_client = None
 
+# 再試行・サーキットブレーカーのシングルトン（ワーカー内で状態を共有する）
+_resilient_caller = None
+
+# 書き込みバッファ付きリポジトリのシングルトン
+_write_behind_repository = None
+
+# 読み込みリクエスト集約のシングルトン
+_single_flight = None
+
+# TODO変更イベント配信のシングルトン
+_todo_event_broker = None
+
+# プロファイル保存先のシングルトン
+_profile_store = None
+
+# インポートジョブのシングルトン
+_import_job_repository = None
+
+# 遅延・障害注入のシングルトン
+_fault_injector = None
+
+# インメモリバックエンドのシングルトン（TODO_BACKEND=memory の場合のみ使用）
+_in_memory_todo_repository = None
+_in_memory_todo_stats_repository = None
+_in_memory_idempotency_repository = None
+
+
+def _env_flag(name: str, default: str = "false") -> bool:
+    """環境変数を真偽値として取得"""
+    return os.getenv(name, default).lower() in ("1", "true", "yes", "on")
+
+
+def _tombstone_retention() -> timedelta:
+    """削除の記録を保持する期間を取得"""
+    return timedelta(days=float(os.getenv("TODO_TOMBSTONE_RETENTION_DAYS", "7")))
+
+
+def _completed_retention() -> Optional[timedelta]:
+    """
+    完了したTODOを保持する期間を取得（未設定の場合は無期限）
+
+    保持期限を過ぎたTODOはTTLで削除され、差分同期にも削除として現れないため、
+    期限前にアーカイブ（削除の記録を残して移す）処理が動く場合のみ保持期限を設ける。
+    """
+    if not is_archive_enabled():
+        return None
+    return timedelta(days=float(os.environ["TODO_COMPLETED_RETENTION_DAYS"]))
+
+
+def is_archive_enabled() -> bool:
+    """
+    完了済みTODOのアーカイブを運用しているか（既定では無効、保持期間の設定が必要）
+
+    全てのプロセスで有効にして保持期限を設け、アーカイブ自体は TODO_ARCHIVE_INTERVAL を
+    設定した1つのプロセスだけで定期実行する。
+    """
+    return bool(os.getenv("TODO_COMPLETED_RETENTION_DAYS")) and _env_flag("TODO_ARCHIVE_ENABLED", "false")
+
+
+def _idempotency_key_ttl() -> timedelta:
+    """冪等キーの記録を保持する期間を取得"""
+    return timedelta(hours=float(os.getenv("IDEMPOTENCY_KEY_TTL_HOURS", "24")))
+
+
+def _description_compression_threshold() -> Optional[int]:
+    """説明を圧縮して保存する最小バイト数を取得（0の場合は圧縮しない）"""
+    threshold = int(os.getenv("TODO_DESCRIPTION_COMPRESSION_THRESHOLD", "1024"))
+    return threshold if threshold > 0 else None
+
+
+def is_in_memory_backend() -> bool:
+    """DynamoDBの代わりにインメモリのバックエンドを使用するか"""
+    return os.getenv("TODO_BACKEND", "dynamodb").lower() == "memory"
+
+
+def should_create_tables() -> bool:
+    """起動時にDynamoDBテーブルの確認・作成を行うか（インメモリのバックエンドでは行わない）"""
+    return not is_in_memory_backend() and _env_flag("DYNAMODB_CREATE_TABLES", "true")
+
+
+def get_fault_injector() -> Optional[FaultInjector]:
+    """遅延・障害注入を取得（無効の場合はNone）"""
+    global _fault_injector
+    if _fault_injector is None and _env_flag("FAULT_INJECTION_ENABLED"):
+        _fault_injector = FaultInjector(FaultProfile(
+            latency_median=float(os.getenv("FAULT_LATENCY_MEDIAN_MS", "5")) / 1000,
+            latency_p99=float(os.getenv("FAULT_LATENCY_P99_MS", "25")) / 1000,
+            throttle_rate=float(os.getenv("FAULT_THROTTLE_RATE", "0")),
+            timeout_rate=float(os.getenv("FAULT_TIMEOUT_RATE", "0")),
+            timeout=float(os.getenv("FAULT_TIMEOUT_SECONDS", os.getenv("DYNAMODB_READ_TIMEOUT", "5"))),
+            batch_failure_rate=float(os.getenv("FAULT_BATCH_FAILURE_RATE", "0"))
+        ))
+    return _fault_injector
+
 
 def get_dynamodb_client() -> DynamoDBClient:
     """DynamoDBクライアントを取得"""
@@ -27,44 +144,289 @@ def get_dynamodb_client() -> DynamoDBClient:
     return _dynamodb_client
 
 
+def get_resilient_caller() -> ResilientCaller:
+    """再試行・サーキットブレーカーを取得"""
+    global _resilient_caller
+    if _resilient_caller is None:
+        _resilient_caller = ResilientCaller(
+            breaker=CircuitBreaker(
+                failure_threshold=int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5")),
+                reset_timeout=float(os.getenv("CIRCUIT_BREAKER_RESET_TIMEOUT", "10"))
+            ),
+            max_attempts=int(os.getenv("REPOSITORY_MAX_ATTEMPTS", "3")),
+            budget_ratio=float(os.getenv("REPOSITORY_RETRY_BUDGET_RATIO", "0.1"))
+        )
+    return _resilient_caller
+
+
+def _create_todo_repository(
+    dynamodb_client: DynamoDBClient,
+    resilient_caller: ResilientCaller
+) -> TodoRepository:
+    """バックエンドのTODOリポジトリを作成（設定に応じて遅延・障害を注入する）"""
+    global _in_memory_todo_repository
+    if is_in_memory_backend():
+        if _in_memory_todo_repository is None:
+            _in_memory_todo_repository = InMemoryTodoRepository(_tombstone_retention())
+        repository = _in_memory_todo_repository
+    else:
+        # DynamoDBのリポジトリはboto3を読み込むため、使うときに読み込む
+        from infrastructure.repositories.dynamodb_todo_repository import DynamoDBTodoRepository
+
+        repository = DynamoDBTodoRepository(
+            dynamodb_client,
+            _tombstone_retention(),
+            resilient_caller,
+            description_compression_threshold=_description_compression_threshold()
+        )
+
+    fault_injector = get_fault_injector()
+    if fault_injector is not None:
+        repository = FaultInjectingTodoRepository(repository, fault_injector, resilient_caller)
+    return repository
+
+
+def get_write_behind_repository() -> Optional[WriteBehindTodoRepository]:
+    """書き込みバッファ付きリポジトリを取得（無効の場合はNone）"""
+    global _write_behind_repository
+    if _write_behind_repository is None and _env_flag("TODO_WRITE_BEHIND_ENABLED"):
+        _write_behind_repository = WriteBehindTodoRepository(
+            _create_todo_repository(get_dynamodb_client(), get_resilient_caller()),
+            flush_interval=float(os.getenv("TODO_WRITE_BEHIND_FLUSH_INTERVAL", "0.5")),
+            max_pending=int(os.getenv("TODO_WRITE_BEHIND_MAX_PENDING", "500"))
+        )
+    return _write_behind_repository
+
+
 def get_todo_repository(
-    dynamodb_client: DynamoDBClient = Depends(get_dynamodb_client)
+    dynamodb_client: DynamoDBClient = Depends(get_dynamodb_client),
+    resilient_caller: ResilientCaller = Depends(get_resilient_caller)
 ) -> TodoRepository:
     """TODOリポジトリを取得"""
-    return DynamoDBTodoRepository(dynamodb_client)
+    write_behind_repository = get_write_behind_repository()
+    if write_behind_repository is not None:
+        return write_behind_repository
+    return _create_todo_repository(dynamodb_client, resilient_caller)
+
+
+def get_single_flight() -> Optional[SingleFlight]:
+    """読み込みリクエスト集約を取得（無効の場合はNone）"""
+    global _single_flight
+    if _single_flight is None and _env_flag("TODO_SINGLE_FLIGHT_ENABLED", "true"):
+        _single_flight = SingleFlight()
+    return _single_flight
+
+
+def get_todo_event_publisher() -> TodoEventPublisher:
+    """TODO変更イベント配信を取得"""
+    global _todo_event_broker
+    if _todo_event_broker is None:
+        _todo_event_broker = InMemoryTodoEventBroker(
+            max_queue_size=int(os.getenv("TODO_EVENT_QUEUE_SIZE", "100"))
+        )
+    return _todo_event_broker
+
+
+def get_idempotency_repository(
+    dynamodb_client: DynamoDBClient = Depends(get_dynamodb_client),
+    resilient_caller: ResilientCaller = Depends(get_resilient_caller)
+) -> IdempotencyRepository:
+    """冪等キーリポジトリを取得"""
+    global _in_memory_idempotency_repository
+    if is_in_memory_backend():
+        if _in_memory_idempotency_repository is None:
+            _in_memory_idempotency_repository = InMemoryIdempotencyRepository(ttl=_idempotency_key_ttl())
+        return _in_memory_idempotency_repository
+
+    from infrastructure.repositories.dynamodb_idempotency_repository import DynamoDBIdempotencyRepository
+
+    return DynamoDBIdempotencyRepository(
+        dynamodb_client,
+        ttl=_idempotency_key_ttl(),
+        resilient_caller=resilient_caller,
+        description_compression_threshold=_description_compression_threshold()
+    )
+
+
+def get_todo_stats_repository(
+    dynamodb_client: DynamoDBClient = Depends(get_dynamodb_client),
+    resilient_caller: ResilientCaller = Depends(get_resilient_caller)
+) -> TodoStatsRepository:
+    """TODO集計リポジトリを取得"""
+    global _in_memory_todo_stats_repository
+    if is_in_memory_backend():
+        if _in_memory_todo_stats_repository is None:
+            _in_memory_todo_stats_repository = InMemoryTodoStatsRepository()
+        return _in_memory_todo_stats_repository
+
+    from infrastructure.repositories.dynamodb_todo_stats_repository import DynamoDBTodoStatsRepository
+
+    return DynamoDBTodoStatsRepository(
+        dynamodb_client,
+        shards=int(os.getenv("TODO_STATS_SHARDS", "8")),
+        resilient_caller=resilient_caller
+    )
+
+
+def get_import_job_repository() -> ImportJobRepository:
+    """インポートジョブリポジトリを取得"""
+    global _import_job_repository
+    if _import_job_repository is None:
+        _import_job_repository = InMemoryImportJobRepository(
+            max_jobs=int(os.getenv("TODO_IMPORT_MAX_JOBS", "100"))
+        )
+    return _import_job_repository
+
+
+def get_todo_archive_repository() -> TodoArchiveRepository:
+    """TODOアーカイブリポジトリを取得"""
+    return FileTodoArchiveRepository(os.getenv("TODO_ARCHIVE_DIR", "./archive"))
+
+
+def get_profiling_token() -> Optional[str]:
+    """プロファイリングを要求するためのトークンを取得（未設定の場合はNone）"""
+    return os.getenv("PROFILING_TOKEN") or None
+
+
+def get_profile_store() -> ProfileStore:
+    """プロファイル保存先を取得"""
+    global _profile_store
+    if _profile_store is None:
+        _profile_store = ProfileStore(
+            os.getenv("PROFILING_DIR", "./profiles"),
+            max_profiles=int(os.getenv("PROFILING_MAX_PROFILES", "50"))
+        )
+    return _profile_store
 
 
 # ユースケースの依存性注入
 def get_create_todo_use_case(
-    todo_repository: TodoRepository = Depends(get_todo_repository)
+    todo_repository: TodoRepository = Depends(get_todo_repository),
+    event_publisher: TodoEventPublisher = Depends(get_todo_event_publisher),
+    idempotency_repository: IdempotencyRepository = Depends(get_idempotency_repository),
+    stats_repository: TodoStatsRepository = Depends(get_todo_stats_repository)
 ) -> CreateTodoUseCase:
     """TODO作成ユースケースを取得"""
-    return CreateTodoUseCase(todo_repository)
+    return CreateTodoUseCase(
+        todo_repository,
+        event_publisher,
+        idempotency_repository,
+        stats_repository
+    )
 
 
 def get_get_todos_use_case(
-    todo_repository: TodoRepository = Depends(get_todo_repository)
+    todo_repository: TodoRepository = Depends(get_todo_repository),
+    single_flight: Optional[SingleFlight] = Depends(get_single_flight)
 ) -> GetTodosUseCase:
     """TODO一覧取得ユースケースを取得"""
-    return GetTodosUseCase(todo_repository)
+    return GetTodosUseCase(todo_repository, single_flight)
 
 
-def get_get_todo_by_id_use_case(
+def get_get_todo_page_use_case(
     todo_repository: TodoRepository = Depends(get_todo_repository)
+) -> GetTodoPageUseCase:
+    """作成順のTODO一覧取得ユースケースを取得"""
+    return GetTodoPageUseCase(todo_repository)
+
+
+def get_get_todo_by_id_use_case(
+    todo_repository: TodoRepository = Depends(get_todo_repository),
+    single_flight: Optional[SingleFlight] = Depends(get_single_flight)
 ) -> GetTodoByIdUseCase:
     """TODO単体取得ユースケースを取得"""
-    return GetTodoByIdUseCase(todo_repository)
+    return GetTodoByIdUseCase(todo_repository, single_flight)
 
 
-def get_update_todo_use_case(
+def get_get_todo_changes_use_case(
     todo_repository: TodoRepository = Depends(get_todo_repository)
+) -> GetTodoChangesUseCase:
+    """TODO差分取得ユースケースを取得"""
+    return GetTodoChangesUseCase(
+        todo_repository,
+        _tombstone_retention(),
+        overlap=timedelta(seconds=float(os.getenv("TODO_CHANGES_OVERLAP_SECONDS", "5")))
+    )
+
+
+def get_update_todo_use_case(
+    todo_repository: TodoRepository = Depends(get_todo_repository),
+    event_publisher: TodoEventPublisher = Depends(get_todo_event_publisher),
+    stats_repository: TodoStatsRepository = Depends(get_todo_stats_repository)
 ) -> UpdateTodoUseCase:
     """TODO更新ユースケースを取得"""
-    return UpdateTodoUseCase(todo_repository)
+    return UpdateTodoUseCase(
+        todo_repository,
+        event_publisher,
+        _completed_retention(),
+        stats_repository
+    )
 
 
 def get_delete_todo_use_case(
-    todo_repository: TodoRepository = Depends(get_todo_repository)
+    todo_repository: TodoRepository = Depends(get_todo_repository),
+    event_publisher: TodoEventPublisher = Depends(get_todo_event_publisher),
+    stats_repository: TodoStatsRepository = Depends(get_todo_stats_repository)
 ) -> DeleteTodoUseCase:
     """TODO削除ユースケースを取得"""
-    return DeleteTodoUseCase(todo_repository)
+    return DeleteTodoUseCase(todo_repository, event_publisher, stats_repository)
+
+
+def get_archive_expiring_todos_use_case(
+    todo_repository: TodoRepository = Depends(get_todo_repository),
+    archive_repository: TodoArchiveRepository = Depends(get_todo_archive_repository),
+    event_publisher: TodoEventPublisher = Depends(get_todo_event_publisher),
+    stats_repository: TodoStatsRepository = Depends(get_todo_stats_repository)
+) -> ArchiveExpiringTodosUseCase:
+    """TODOアーカイブユースケースを取得"""
+    return ArchiveExpiringTodosUseCase(
+        todo_repository,
+        archive_repository,
+        event_publisher,
+        lead_time=timedelta(hours=float(os.getenv("TODO_ARCHIVE_LEAD_HOURS", "1"))),
+        stats_repository=stats_repository
+    )
+
+
+def get_get_archived_todos_use_case(
+    archive_repository: TodoArchiveRepository = Depends(get_todo_archive_repository)
+) -> GetArchivedTodosUseCase:
+    """アーカイブ済みTODO取得ユースケースを取得"""
+    return GetArchivedTodosUseCase(archive_repository)
+
+
+def get_get_todo_stats_use_case(
+    stats_repository: TodoStatsRepository = Depends(get_todo_stats_repository)
+) -> GetTodoStatsUseCase:
+    """TODO集計取得ユースケースを取得"""
+    return GetTodoStatsUseCase(stats_repository)
+
+
+def get_reconcile_todo_stats_use_case(
+    todo_repository: TodoRepository = Depends(get_todo_repository),
+    stats_repository: TodoStatsRepository = Depends(get_todo_stats_repository)
+) -> ReconcileTodoStatsUseCase:
+    """TODO集計補正ユースケースを取得"""
+    return ReconcileTodoStatsUseCase(todo_repository, stats_repository)
+
+
+def get_import_todos_use_case(
+    todo_repository: TodoRepository = Depends(get_todo_repository),
+    job_repository: ImportJobRepository = Depends(get_import_job_repository),
+    stats_repository: TodoStatsRepository = Depends(get_todo_stats_repository)
+) -> ImportTodosUseCase:
+    """TODO一括インポートユースケースを取得"""
+    return ImportTodosUseCase(
+        todo_repository,
+        job_repository,
+        stats_repository,
+        batch_size=int(os.getenv("TODO_IMPORT_BATCH_SIZE", "25")),
+        max_concurrency=int(os.getenv("TODO_IMPORT_CONCURRENCY", "4"))
+    )
+
+
+def get_get_import_job_use_case(
+    job_repository: ImportJobRepository = Depends(get_import_job_repository)
+) -> GetImportJobUseCase:
+    """インポートジョブ取得ユースケースを取得"""
+    return GetImportJobUseCase(job_repository)
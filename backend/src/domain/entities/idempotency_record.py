@@ -0,0 +1,22 @@
+"""
+Domain層: 冪等キーの記録
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from domain.entities.todo import Todo
+
+
+@dataclass
+class IdempotencyRecord:
+    """冪等キーごとの処理結果"""
+    key: str
+    # 同じキーで異なる内容のリクエストが送られていないか確認するためのハッシュ
+    request_hash: str
+    # 処理が完了していれば作成されたTODO、処理中はNone
+    todo: Optional[Todo] = None
+
+    @property
+    def completed(self) -> bool:
+        """処理が完了しているか"""
+        return self.todo is not None
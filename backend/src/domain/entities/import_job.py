@@ -0,0 +1,46 @@
+"""
+Domain層: TODO一括インポートのジョブ
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+
+# ジョブの状態
+IMPORT_JOB_PENDING = "pending"
+IMPORT_JOB_RUNNING = "running"
+IMPORT_JOB_COMPLETED = "completed"
+IMPORT_JOB_FAILED = "failed"
+
+
+@dataclass
+class ImportRowError:
+    """インポートできなかった行"""
+    row: int
+    message: str
+
+
+@dataclass
+class ImportJob:
+    """TODO一括インポートの進捗"""
+    id: str
+    status: str = IMPORT_JOB_PENDING
+    # 読み込んだ行数・保存した件数・失敗した行数
+    processed: int = 0
+    imported: int = 0
+    failed: int = 0
+    # 失敗した行（先頭から一定件数まで）
+    errors: List[ImportRowError] = field(default_factory=list)
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    # ジョブ全体が失敗した場合の理由
+    error: Optional[str] = None
+
+    @property
+    def throughput(self) -> float:
+        """1秒あたりの処理行数"""
+        if self.started_at is None:
+            return 0.0
+        elapsed = ((self.finished_at or datetime.now()) - self.started_at).total_seconds()
+        return self.processed / elapsed if elapsed > 0 else 0.0
@@ -0,0 +1,52 @@
+"""
+Domain層: 一部の項目だけを持つTODO
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import FrozenSet, Iterable, Optional
+
+from domain.entities.todo import Todo
+
+
+# 取得する項目として指定できる名前
+TODO_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "completed",
+    "created_at",
+    "updated_at",
+    "expires_at",
+)
+
+
+@dataclass
+class PartialTodo:
+    """
+    一部の項目だけを読み込んだTODO
+
+    一覧表示などの読み取り専用の用途のためのもので、Todoエンティティと異なり
+    バリデーションを行わない。読み込んでいない項目はNoneになる。
+    """
+    id: str
+    fields: FrozenSet[str] = field(default_factory=frozenset)
+    title: Optional[str] = None
+    description: Optional[str] = None
+    completed: Optional[bool] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+
+    @classmethod
+    def from_todo(cls, todo: Todo, fields: Iterable[str]) -> "PartialTodo":
+        """Todoエンティティから指定した項目だけを取り出す"""
+        fields = frozenset(fields) | {"id"}
+        return cls(
+            id=todo.id,
+            fields=fields,
+            **{name: getattr(todo, name) for name in fields if name != "id"}
+        )
+
+    def to_dict(self) -> dict:
+        """読み込んだ項目だけを辞書に変換"""
+        return {name: getattr(self, name) for name in TODO_FIELDS if name in self.fields}
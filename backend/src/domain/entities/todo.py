@@ -3,7 +3,7 @@ Domain層: Todoエンティティ
 ビジネスロジックの中核となるドメインオブジェクト
 """
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
 
@@ -20,6 +20,8 @@ class Todo:
     completed: bool
     created_at: datetime
     updated_at: datetime
+    # 保持期間を過ぎて自動削除（アーカイブ）される日時
+    expires_at: Optional[datetime] = None
 
     def __post_init__(self):
         """バリデーション"""
@@ -29,15 +31,22 @@ class Todo:
         if len(self.title) > 200:
             raise ValueError("タイトルは200文字以内である必要があります")
 
-    def mark_as_completed(self) -> None:
-        """TODOを完了状態にする"""
+    def mark_as_completed(self, retention: Optional[timedelta] = None) -> None:
+        """
+        TODOを完了状態にする
+
+        Args:
+            retention: 完了後に保持する期間（指定した場合は期間経過後にアーカイブされる）
+        """
         self.completed = True
         self.updated_at = datetime.now()
+        self.expires_at = self.updated_at + retention if retention is not None else None
 
     def mark_as_incomplete(self) -> None:
         """TODOを未完了状態にする"""
         self.completed = False
         self.updated_at = datetime.now()
+        self.expires_at = None
 
     def update_title(self, new_title: str) -> None:
         """タイトルを更新する"""
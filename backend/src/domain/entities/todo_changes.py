@@ -0,0 +1,24 @@
+"""
+Domain層: TODO差分
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+
+from domain.entities.todo import Todo
+
+
+@dataclass
+class TodoTombstone:
+    """削除されたTODOの記録"""
+    id: str
+    deleted_at: datetime
+
+
+@dataclass
+class TodoChanges:
+    """ある時点以降に変更されたTODO"""
+    todos: List[Todo]
+    tombstones: List[TodoTombstone]
+    # 次回の差分取得に使う基準時刻
+    watermark: datetime
@@ -0,0 +1,34 @@
+"""
+Domain層: TODOの並び順（作成順）を表すキー
+"""
+import uuid
+from datetime import datetime
+from typing import Optional
+
+
+def is_time_ordered_id(todo_id: str) -> bool:
+    """作成時刻順に並ぶID（UUIDv7）か確認"""
+    try:
+        return uuid.UUID(todo_id).version == 7
+    except ValueError:
+        return False
+
+
+def todo_order_key(todo_id: str, created_at: Optional[datetime]) -> str:
+    """
+    作成順に並べるためのキー（文字列として比較すると作成順になる）
+
+    UUIDv7のIDはそのままキーにする。以前のランダムなID（UUIDv4など）は、
+    作成日時のミリ秒をUUIDv7と同じ位置に置き、残りをIDで埋めたキーにすることで、
+    新しいIDと同じ順序の中に並べる。
+
+    Args:
+        todo_id: TODO ID
+        created_at: 作成日時（以前のIDの場合のみ使用するため、UUIDv7のIDではNoneでもよい）
+    """
+    if is_time_ordered_id(todo_id):
+        return todo_id
+
+    milliseconds = f"{int(created_at.timestamp() * 1000):012x}"
+    suffix = todo_id[14:] if len(todo_id) == 36 else todo_id
+    return f"{milliseconds[:8]}-{milliseconds[8:]}-{suffix}"
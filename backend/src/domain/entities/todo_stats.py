@@ -0,0 +1,16 @@
+"""
+Domain層: TODO集計
+"""
+from dataclasses import dataclass
+
+
+@dataclass
+class TodoStats:
+    """TODOの件数の集計"""
+    total: int = 0
+    completed: int = 0
+
+    @property
+    def open(self) -> int:
+        """未完了のTODOの件数"""
+        return self.total - self.completed
@@ -0,0 +1,48 @@
+"""
+Domain層: TODO変更イベント
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from domain.entities.todo import Todo
+
+
+# イベント種別
+TODO_CREATED = "created"
+TODO_UPDATED = "updated"
+TODO_DELETED = "deleted"
+
+
+@dataclass
+class TodoEvent:
+    """TODOの作成・更新・削除を表すイベント"""
+    type: str
+    todo_id: str
+    todo: Optional[Todo] = None
+    occurred_at: datetime = field(default_factory=datetime.now)
+
+
+class TodoEventPublisher(ABC):
+    """
+    TODO変更イベントの配信インターフェース
+
+    具体的な実装はInfrastructure層で行う
+    """
+
+    @abstractmethod
+    async def publish(self, event: TodoEvent) -> None:
+        """イベントを購読者に配信"""
+        pass
+
+    @abstractmethod
+    def subscribe(self) -> "asyncio.Queue[Optional[TodoEvent]]":
+        """購読を開始（購読が打ち切られた場合はNoneが届く）"""
+        pass
+
+    @abstractmethod
+    def unsubscribe(self, queue: "asyncio.Queue[Optional[TodoEvent]]") -> None:
+        """購読を終了"""
+        pass
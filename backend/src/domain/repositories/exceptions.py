@@ -0,0 +1,36 @@
+"""
+Domain層: リポジトリ操作の例外
+"""
+from typing import Optional
+
+
+class RepositoryError(Exception):
+    """リポジトリ操作の失敗"""
+    pass
+
+
+class RepositoryTransientError(RepositoryError):
+    """
+    一時的な失敗
+
+    時間を置いて再試行すれば成功する可能性がある
+    """
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RepositoryThrottledError(RepositoryTransientError):
+    """バックエンドのスループット上限によるスロットリング"""
+    pass
+
+
+class RepositoryUnavailableError(RepositoryTransientError):
+    """バックエンドに接続できない、または応答しない"""
+    pass
+
+
+class CircuitOpenError(RepositoryUnavailableError):
+    """バックエンドが異常なため呼び出しを遮断している"""
+    pass
@@ -0,0 +1,47 @@
+"""
+Domain層: 冪等キーリポジトリインターフェース
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from domain.entities.idempotency_record import IdempotencyRecord
+from domain.entities.todo import Todo
+
+
+class IdempotencyRepository(ABC):
+    """
+    冪等キーリポジトリのインターフェース
+
+    具体的な実装はInfrastructure層で行う
+    """
+
+    @abstractmethod
+    async def claim(self, key: str, request_hash: str) -> Optional[str]:
+        """
+        冪等キーを処理中として登録
+
+        Returns:
+            登録できた場合は処理中の記録を所有していることを示すトークン、
+            既に記録がある場合None
+        """
+        pass
+
+    @abstractmethod
+    async def find(self, key: str) -> Optional[IdempotencyRecord]:
+        """冪等キーの記録を取得"""
+        pass
+
+    @abstractmethod
+    async def complete(self, key: str, claim_token: str, todo: Todo) -> bool:
+        """
+        冪等キーの処理結果を記録
+
+        Returns:
+            記録した場合True、リース期限切れで他のリクエストに登録し直されていた場合False
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, key: str, claim_token: str) -> None:
+        """処理に失敗した冪等キーの記録を削除（再試行できるようにする）"""
+        pass
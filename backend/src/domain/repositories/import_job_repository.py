@@ -0,0 +1,25 @@
+"""
+Domain層: インポートジョブリポジトリインターフェース
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from domain.entities.import_job import ImportJob
+
+
+class ImportJobRepository(ABC):
+    """
+    インポートジョブの進捗を保持するリポジトリのインターフェース
+
+    具体的な実装はInfrastructure層で行う
+    """
+
+    @abstractmethod
+    async def save(self, job: ImportJob) -> None:
+        """ジョブを保存"""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, job_id: str) -> Optional[ImportJob]:
+        """IDでジョブを取得"""
+        pass
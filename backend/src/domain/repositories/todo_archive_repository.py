@@ -0,0 +1,30 @@
+"""
+Domain層: TODOアーカイブリポジトリインターフェース
+"""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from domain.entities.todo import Todo
+
+
+class TodoArchiveRepository(ABC):
+    """
+    保持期間を過ぎたTODOを保管するアーカイブのインターフェース
+
+    具体的な実装はInfrastructure層で行う
+    """
+
+    @abstractmethod
+    async def append(self, todos: List[Todo]) -> None:
+        """TODOをアーカイブに追加"""
+        pass
+
+    @abstractmethod
+    async def find(
+        self,
+        todo_id: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[Todo]:
+        """アーカイブされたTODOを新しい順に取得"""
+        pass
@@ -3,8 +3,12 @@ Domain層: TODOリポジトリインターフェース
 データ永続化の抽象化
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import FrozenSet, List, Optional
+from domain.entities.partial_todo import PartialTodo
 from domain.entities.todo import Todo
+from domain.entities.todo_changes import TodoChanges
+from domain.entities.todo_stats import TodoStats
 
 
 class TodoRepository(ABC):
@@ -19,6 +23,28 @@ class TodoRepository(ABC):
         """全てのTODOを取得"""
         pass
 
+    @abstractmethod
+    async def find_all_partial(self, fields: FrozenSet[str]) -> List[PartialTodo]:
+        """全てのTODOを指定した項目だけ取得（idは常に含む）"""
+        pass
+
+    @abstractmethod
+    async def find_page(
+        self,
+        limit: int,
+        before: Optional[str] = None,
+        after: Optional[str] = None
+    ) -> List[Todo]:
+        """
+        作成順のキー（todo_order_key）の範囲でTODOを取得（新しい順）
+
+        Args:
+            limit: 最大件数
+            before: このキーより前に作成されたTODOを取得する（キーに最も近いものから）
+            after: このキーより後に作成されたTODOを取得する（キーに最も近いものから）
+        """
+        pass
+
     @abstractmethod
     async def find_by_id(self, todo_id: str) -> Optional[Todo]:
         """IDでTODOを取得"""
@@ -30,11 +56,51 @@ class TodoRepository(ABC):
         pass
 
     @abstractmethod
-    async def delete(self, todo_id: str) -> bool:
-        """TODOを削除"""
+    async def save_many(self, todos: List[Todo]) -> List[str]:
+        """
+        複数のTODOをまとめて保存
+
+        Returns:
+            保存できなかったTODO IDのリスト
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, todo_id: str) -> Optional[Todo]:
+        """
+        TODOを削除
+
+        Returns:
+            削除したTODO（存在しない、または既に削除された場合はNone）
+        """
+        pass
+
+    @abstractmethod
+    async def delete_expiring(self, todo_id: str, expires_at: datetime) -> bool:
+        """
+        完了済みで保持期限が expires_at のままのTODOのみ削除
+
+        Returns:
+            削除した場合はTrue（未完了に戻された、保持期限が変わった、既に削除された場合はFalse）
+        """
         pass
 
     @abstractmethod
     async def exists(self, todo_id: str) -> bool:
         """TODOが存在するか確認"""
         pass
+
+    @abstractmethod
+    async def find_changes_since(self, since: datetime) -> TodoChanges:
+        """指定時刻より後に作成・更新・削除されたTODOを取得"""
+        pass
+
+    @abstractmethod
+    async def find_expiring_before(self, deadline: datetime) -> List[Todo]:
+        """指定日時までに保持期間が切れるTODOを取得"""
+        pass
+
+    @abstractmethod
+    async def count(self) -> TodoStats:
+        """全てのTODOの件数を数える"""
+        pass
@@ -0,0 +1,29 @@
+"""
+Domain層: TODO集計リポジトリインターフェース
+"""
+from abc import ABC, abstractmethod
+
+from domain.entities.todo_stats import TodoStats
+
+
+class TodoStatsRepository(ABC):
+    """
+    TODO件数の集計を保持するリポジトリのインターフェース
+
+    具体的な実装はInfrastructure層で行う
+    """
+
+    @abstractmethod
+    async def increment(self, total: int = 0, completed: int = 0) -> None:
+        """件数を加算（負の値で減算）"""
+        pass
+
+    @abstractmethod
+    async def get(self) -> TodoStats:
+        """現在の集計を取得"""
+        pass
+
+    @abstractmethod
+    async def overwrite(self, stats: TodoStats) -> None:
+        """集計を指定した値で置き換える"""
+        pass
@@ -0,0 +1,113 @@
+"""
+Infrastructure層: 圧縮ファイルを使用した TODO アーカイブ実装
+"""
+import asyncio
+import gzip
+import json
+import os
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from domain.entities.todo import Todo
+from domain.repositories.exceptions import RepositoryError
+from domain.repositories.todo_archive_repository import TodoArchiveRepository
+
+
+class FileTodoArchiveRepository(TodoArchiveRepository):
+    """
+    gzip圧縮したNDJSONファイルにTODOを保管するアーカイブ
+
+    アーカイブ処理1回分を1つのセグメントファイルとして書き込み、
+    読み込み時は新しいセグメントから1行ずつ展開するため、
+    アーカイブ全体をメモリに載せることはない。
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    @staticmethod
+    def _todo_to_record(todo: Todo) -> dict:
+        """TodoエンティティをJSONに変換"""
+        return {
+            'id': todo.id,
+            'title': todo.title,
+            'description': todo.description,
+            'completed': todo.completed,
+            'created_at': todo.created_at.isoformat(),
+            'updated_at': todo.updated_at.isoformat(),
+            'archived_at': datetime.now().isoformat()
+        }
+
+    @staticmethod
+    def _record_to_todo(record: dict) -> Todo:
+        """JSONからTodoエンティティを復元"""
+        return Todo(
+            id=record['id'],
+            title=record['title'],
+            description=record.get('description'),
+            completed=record.get('completed', False),
+            created_at=datetime.fromisoformat(record['created_at']),
+            updated_at=datetime.fromisoformat(record['updated_at'])
+        )
+
+    def _segments(self) -> List[str]:
+        """セグメントファイルを新しい順に取得"""
+        if not os.path.isdir(self.directory):
+            return []
+        names = [name for name in os.listdir(self.directory) if name.endswith(".ndjson.gz")]
+        return [os.path.join(self.directory, name) for name in sorted(names, reverse=True)]
+
+    def _write_segment(self, todos: List[Todo]) -> None:
+        """セグメントファイルを書き込む（書き込み完了後に名前を変えて公開する）"""
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"todos-{datetime.now().strftime('%Y%m%dT%H%M%S%f')}.ndjson.gz"
+        path = os.path.join(self.directory, name)
+
+        with gzip.open(path + ".tmp", "wt", encoding="utf-8") as f:
+            for todo in todos:
+                f.write(json.dumps(self._todo_to_record(todo), ensure_ascii=False))
+                f.write("\n")
+        os.replace(path + ".tmp", path)
+
+    def _iter_records(self) -> Iterator[dict]:
+        """アーカイブされたTODOを新しいセグメントから順に読み込む"""
+        for path in self._segments():
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+
+    def _find(self, todo_id: Optional[str], limit: int, offset: int) -> List[Todo]:
+        todos: List[Todo] = []
+        skipped = 0
+        for record in self._iter_records():
+            if todo_id is not None and record['id'] != todo_id:
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            todos.append(self._record_to_todo(record))
+            if len(todos) >= limit:
+                break
+        return todos
+
+    async def append(self, todos: List[Todo]) -> None:
+        """TODOをアーカイブに追加"""
+        if not todos:
+            return
+        try:
+            await asyncio.to_thread(self._write_segment, todos)
+        except Exception as e:
+            raise RepositoryError(f"TODOアーカイブ書き込みエラー: {str(e)}") from e
+
+    async def find(
+        self,
+        todo_id: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[Todo]:
+        """アーカイブされたTODOを新しい順に取得"""
+        try:
+            return await asyncio.to_thread(self._find, todo_id, limit, offset)
+        except Exception as e:
+            raise RepositoryError(f"TODOアーカイブ取得エラー: {str(e)}") from e
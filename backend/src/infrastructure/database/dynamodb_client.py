@@ -2,10 +2,131 @@
 Infrastructure層: DynamoDB接続設定
 """
 import os
-import boto3
+import time
+from typing import List
+
 from botocore.exceptions import ClientError
 
 
+# 差分同期用のインデックス（全TODOを1つのパーティションにまとめ、updated_at順に並べる）
+# 全ての書き込みが同じパーティションキー（SYNC_PARTITION_KEY）に集まるため、
+# 書き込みが増えるとインデックスのパーティションが書き込みの集中箇所になる
+# （1パーティションあたりの書き込み上限に達した場合は、キーを分割して並列に問い合わせる必要がある）
+SYNC_INDEX_NAME = "updated_at-index"
+SYNC_PARTITION_KEY = "TODO"
+
+# 作成順の一覧取得用のインデックス（作成順のキーを持つTODOだけが含まれる）
+ORDER_INDEX_NAME = "order_key-index"
+ORDER_KEY_ATTRIBUTE = "order_key"
+
+# TTLで自動削除する時刻（UNIX秒）を持つ属性
+TTL_ATTRIBUTE_NAME = "expires_at"
+
+# 保持期限の取得用のインデックス（保持期限を持つTODOだけが含まれる疎なインデックス）
+# 削除済みの記録もTTLのために保持期限を持つが、このパーティションキーを持たないため含まれない
+EXPIRY_INDEX_NAME = "expires_at-index"
+EXPIRY_PARTITION_KEY_ATTRIBUTE = "expiry_pk"
+
+# 冪等キーの記録を保存するテーブル
+IDEMPOTENCY_TABLE_NAME = "TodoIdempotencyKeys"
+
+# 件数の集計を保存するテーブル
+STATS_TABLE_NAME = "TodoStats"
+
+_SYNC_INDEX = {
+    'IndexName': SYNC_INDEX_NAME,
+    'KeySchema': [
+        {
+            'AttributeName': 'sync_pk',
+            'KeyType': 'HASH'
+        },
+        {
+            'AttributeName': 'updated_at',
+            'KeyType': 'RANGE'
+        }
+    ],
+    'Projection': {
+        'ProjectionType': 'ALL'
+    }
+}
+
+_SYNC_INDEX_ATTRIBUTES = [
+    {
+        'AttributeName': 'sync_pk',
+        'AttributeType': 'S'
+    },
+    {
+        'AttributeName': 'updated_at',
+        'AttributeType': 'S'
+    }
+]
+
+
+_ORDER_INDEX = {
+    'IndexName': ORDER_INDEX_NAME,
+    'KeySchema': [
+        {
+            'AttributeName': 'sync_pk',
+            'KeyType': 'HASH'
+        },
+        {
+            'AttributeName': ORDER_KEY_ATTRIBUTE,
+            'KeyType': 'RANGE'
+        }
+    ],
+    'Projection': {
+        'ProjectionType': 'ALL'
+    }
+}
+
+_ORDER_INDEX_ATTRIBUTES = [
+    {
+        'AttributeName': 'sync_pk',
+        'AttributeType': 'S'
+    },
+    {
+        'AttributeName': ORDER_KEY_ATTRIBUTE,
+        'AttributeType': 'S'
+    }
+]
+
+_EXPIRY_INDEX = {
+    'IndexName': EXPIRY_INDEX_NAME,
+    'KeySchema': [
+        {
+            'AttributeName': EXPIRY_PARTITION_KEY_ATTRIBUTE,
+            'KeyType': 'HASH'
+        },
+        {
+            'AttributeName': TTL_ATTRIBUTE_NAME,
+            'KeyType': 'RANGE'
+        }
+    ],
+    'Projection': {
+        'ProjectionType': 'ALL'
+    }
+}
+
+_EXPIRY_INDEX_ATTRIBUTES = [
+    {
+        'AttributeName': EXPIRY_PARTITION_KEY_ATTRIBUTE,
+        'AttributeType': 'S'
+    },
+    {
+        'AttributeName': TTL_ATTRIBUTE_NAME,
+        'AttributeType': 'N'
+    }
+]
+
+
+# TODOテーブルのインデックスと、その作成に必要な属性の定義
+_TODO_INDEXES = [
+    (_SYNC_INDEX, _SYNC_INDEX_ATTRIBUTES),
+    (_ORDER_INDEX, _ORDER_INDEX_ATTRIBUTES),
+    (_EXPIRY_INDEX, _EXPIRY_INDEX_ATTRIBUTES),
+]
+
+
 class DynamoDBClient:
     """DynamoDBクライアントのシングルトン"""
 
@@ -20,14 +141,37 @@ class DynamoDBClient:
     def get_resource(self):
         """DynamoDBリソースを取得"""
         if self._resource is None:
-            endpoint_url = os.getenv("DYNAMODB_ENDPOINT", "http://localhost:8001")
+            # boto3の読み込みには時間がかかるため、最初に使うときまで遅らせる
+            # （インメモリのバックエンドや起動直後のヘルスチェックでは読み込まない）
+            import boto3
+            from botocore.config import Config
+
+            # 空の場合はAWSのエンドポイントと標準の認証情報（IAMロールなど）を使う
+            endpoint_url = os.getenv("DYNAMODB_ENDPOINT", "http://localhost:8001") or None
+
+            # 再試行はリポジトリ側で予算付きで行うため、SDKの再試行は無効にする
+            config = Config(
+                retries={
+                    'mode': 'standard',
+                    'max_attempts': int(os.getenv("DYNAMODB_SDK_MAX_ATTEMPTS", "1"))
+                },
+                connect_timeout=float(os.getenv("DYNAMODB_CONNECT_TIMEOUT", "2")),
+                read_timeout=float(os.getenv("DYNAMODB_READ_TIMEOUT", "5"))
+            )
+
+            credentials = {}
+            if endpoint_url is not None:
+                credentials = {
+                    'aws_access_key_id': os.getenv("AWS_ACCESS_KEY_ID", "dummy"),
+                    'aws_secret_access_key': os.getenv("AWS_SECRET_ACCESS_KEY", "dummy")
+                }
 
             self._resource = boto3.resource(
                 'dynamodb',
                 endpoint_url=endpoint_url,
                 region_name=os.getenv("AWS_DEFAULT_REGION", "ap-northeast-1"),
-                aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID", "dummy"),
-                aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY", "dummy")
+                config=config,
+                **credentials
             )
 
         return self._resource
@@ -42,6 +186,15 @@ class DynamoDBClient:
             table = dynamodb.Table(table_name)
             table.load()
             print(f"テーブル '{table_name}' は既に存在します。")
+            # インデックスの作成には時間がかかるため、起動時には作成も待機もしない
+            unavailable = self.unavailable_todo_indexes(table)
+            if unavailable:
+                print(
+                    f"インデックス {', '.join(unavailable)} はまだ使えません。"
+                    "scripts/migrate_todo_indexes.py で作成してください"
+                    "（使えるようになるまでは、インデックスを使う読み込みをスキャンで代替します）。"
+                )
+            self._ensure_ttl(table_name)
             return table
         except ClientError as e:
             if e.response['Error']['Code'] == 'ResourceNotFoundException':
@@ -60,6 +213,88 @@ class DynamoDBClient:
                             'AttributeName': 'id',
                             'AttributeType': 'S'
                         }
+                    ] + _SYNC_INDEX_ATTRIBUTES + [_ORDER_INDEX_ATTRIBUTES[1]] + _EXPIRY_INDEX_ATTRIBUTES,
+                    GlobalSecondaryIndexes=[_SYNC_INDEX, _ORDER_INDEX, _EXPIRY_INDEX],
+                    BillingMode='PAY_PER_REQUEST'
+                )
+
+                # テーブルが作成されるまで待機
+                table.wait_until_exists()
+                print(f"テーブル '{table_name}' が作成されました。")
+                self._ensure_ttl(table_name)
+                return table
+            else:
+                raise
+
+    def create_idempotency_table(self):
+        """冪等キーテーブルを作成"""
+        dynamodb = self.get_resource()
+        table_name = IDEMPOTENCY_TABLE_NAME
+
+        try:
+            # 既存のテーブルを取得
+            table = dynamodb.Table(table_name)
+            table.load()
+            print(f"テーブル '{table_name}' は既に存在します。")
+            self._ensure_ttl(table_name)
+            return table
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ResourceNotFoundException':
+                # テーブルが存在しない場合は作成
+                print(f"テーブル '{table_name}' を作成中...")
+                table = dynamodb.create_table(
+                    TableName=table_name,
+                    KeySchema=[
+                        {
+                            'AttributeName': 'idempotency_key',
+                            'KeyType': 'HASH'
+                        }
+                    ],
+                    AttributeDefinitions=[
+                        {
+                            'AttributeName': 'idempotency_key',
+                            'AttributeType': 'S'
+                        }
+                    ],
+                    BillingMode='PAY_PER_REQUEST'
+                )
+
+                # テーブルが作成されるまで待機
+                table.wait_until_exists()
+                print(f"テーブル '{table_name}' が作成されました。")
+                self._ensure_ttl(table_name)
+                return table
+            else:
+                raise
+
+    def create_stats_table(self):
+        """集計テーブルを作成"""
+        dynamodb = self.get_resource()
+        table_name = STATS_TABLE_NAME
+
+        try:
+            # 既存のテーブルを取得
+            table = dynamodb.Table(table_name)
+            table.load()
+            print(f"テーブル '{table_name}' は既に存在します。")
+            return table
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ResourceNotFoundException':
+                # テーブルが存在しない場合は作成
+                print(f"テーブル '{table_name}' を作成中...")
+                table = dynamodb.create_table(
+                    TableName=table_name,
+                    KeySchema=[
+                        {
+                            'AttributeName': 'shard',
+                            'KeyType': 'HASH'
+                        }
+                    ],
+                    AttributeDefinitions=[
+                        {
+                            'AttributeName': 'shard',
+                            'AttributeType': 'S'
+                        }
                     ],
                     BillingMode='PAY_PER_REQUEST'
                 )
@@ -71,6 +306,73 @@ class DynamoDBClient:
             else:
                 raise
 
+    def unavailable_todo_indexes(self, table) -> List[str]:
+        """既存のテーブルで未作成または作成中のインデックス名を取得"""
+        statuses = {
+            index['IndexName']: index['IndexStatus'] for index in table.global_secondary_indexes or []
+        }
+        return [
+            index['IndexName'] for index, _ in _TODO_INDEXES
+            if statuses.get(index['IndexName']) != 'ACTIVE'
+        ]
+
+    def ensure_todo_indexes(self, table) -> None:
+        """
+        既存のテーブルに不足しているインデックスを追加
+
+        DynamoDBは作成中のインデックスがある間は次のインデックスを作成できないため、
+        1つずつ作成し、使えるようになる（ACTIVE）まで待ってから次を作成する。
+        完了まで長時間かかることがあるため、アプリケーションの起動時には呼ばず、
+        scripts/migrate_todo_indexes.py から呼ぶ。
+        """
+        existing = {index['IndexName'] for index in table.global_secondary_indexes or []}
+        missing = [
+            (index, attributes)
+            for index, attributes in _TODO_INDEXES
+            if index['IndexName'] not in existing
+        ]
+
+        for index, attributes in missing:
+            self._wait_for_indexes(table)
+            print(f"インデックス '{index['IndexName']}' を作成中...")
+            table.update(
+                AttributeDefinitions=attributes,
+                GlobalSecondaryIndexUpdates=[{'Create': index}]
+            )
+        if missing:
+            self._wait_for_indexes(table)
+
+    def _wait_for_indexes(self, table) -> None:
+        """テーブルと全てのインデックスが使えるようになるまで待つ"""
+        timeout = float(os.getenv("DYNAMODB_INDEX_WAIT_TIMEOUT", "1800"))
+        deadline = time.monotonic() + timeout
+        while True:
+            table.reload()
+            statuses = [table.table_status] + [
+                index['IndexStatus'] for index in table.global_secondary_indexes or []
+            ]
+            if all(status == 'ACTIVE' for status in statuses):
+                return
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"テーブル '{table.name}' のインデックスが {timeout:.0f} 秒以内に使えるようになりませんでした")
+            time.sleep(5)
+
+    def _ensure_ttl(self, table_name: str):
+        """TTLが無効であれば有効にする"""
+        client = self.get_resource().meta.client
+        description = client.describe_time_to_live(TableName=table_name)
+        status = description['TimeToLiveDescription']['TimeToLiveStatus']
+        if status in ('ENABLED', 'ENABLING'):
+            return
+
+        client.update_time_to_live(
+            TableName=table_name,
+            TimeToLiveSpecification={
+                'Enabled': True,
+                'AttributeName': TTL_ATTRIBUTE_NAME
+            }
+        )
+
     def get_table(self, table_name: str):
         """テーブルを取得"""
         dynamodb = self.get_resource()
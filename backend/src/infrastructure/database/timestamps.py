@@ -0,0 +1,29 @@
+"""
+Infrastructure層: DynamoDBに保存する日時の形式
+"""
+from datetime import datetime, timezone
+
+
+def to_storage_timestamp(value: datetime) -> str:
+    """
+    日時を保存形式の文字列に変換
+
+    UTC・マイクロ秒まで含む固定長の形式にそろえ、文字列の比較（インデックスの
+    範囲条件）が時刻の順序と一致するようにする。タイムゾーンのない日時は
+    ローカル時刻とみなす。
+    """
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return value.astimezone(timezone.utc).isoformat(timespec='microseconds')
+
+
+def from_storage_timestamp(value: str) -> datetime:
+    """
+    保存形式の文字列をタイムゾーンのないローカル時刻に変換
+
+    以前のバージョンで保存したタイムゾーンのないローカル時刻もそのまま読める。
+    """
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed
+    return parsed.astimezone().replace(tzinfo=None)
@@ -0,0 +1,59 @@
+"""
+Infrastructure層: プロセス内 TODO 変更イベント配信
+"""
+import asyncio
+from typing import Optional, Set
+
+from domain.events.todo_event import TodoEvent, TodoEventPublisher
+
+
+class InMemoryTodoEventBroker(TodoEventPublisher):
+    """
+    プロセス内の購読者にイベントを配信する実装
+
+    購読者ごとに上限付きのキューを持ち、キューが溢れた（読み出しが
+    追いつかない）購読者は打ち切る。配信はワーカープロセス内に閉じるため、
+    複数ワーカー構成では同じワーカーへの書き込みのみが届く。
+    """
+
+    def __init__(self, max_queue_size: int = 100):
+        self.max_queue_size = max_queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._metrics = {
+            "published": 0,
+            "evicted": 0,
+        }
+
+    async def publish(self, event: TodoEvent) -> None:
+        """イベントを全購読者のキューに追加"""
+        self._metrics["published"] += 1
+
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._evict(queue)
+
+    def subscribe(self) -> "asyncio.Queue[Optional[TodoEvent]]":
+        """購読を開始"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: "asyncio.Queue[Optional[TodoEvent]]") -> None:
+        """購読を終了"""
+        self._subscribers.discard(queue)
+
+    def _evict(self, queue: asyncio.Queue) -> None:
+        """読み出しが追いつかない購読者を打ち切る"""
+        self._subscribers.discard(queue)
+        self._metrics["evicted"] += 1
+
+        # 溜まったイベントを破棄して終了の合図を送る
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def get_metrics(self) -> dict:
+        """イベント配信のメトリクスを取得"""
+        return {**self._metrics, "subscribers": len(self._subscribers)}
@@ -0,0 +1,104 @@
+"""
+Infrastructure層: バックエンド呼び出しへの遅延・障害の注入
+"""
+import asyncio
+import math
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from botocore.exceptions import ClientError, ReadTimeoutError
+
+
+@dataclass
+class FaultProfile:
+    """
+    注入する遅延と障害の設定
+
+    遅延は中央値とp99を指定した対数正規分布に従う。
+    タイムアウトは timeout 秒待ってから読み込みタイムアウトとして失敗させ、
+    スロットリングは短い遅延の後にスロットリングのエラーとして失敗させる。
+    """
+    latency_median: float = 0.005
+    latency_p99: float = 0.025
+    throttle_rate: float = 0.0
+    timeout_rate: float = 0.0
+    timeout: float = 5.0
+    # 一括書き込みで1件ごとに書き込めなかったことにする確率
+    batch_failure_rate: float = 0.0
+
+
+# 標準正規分布の99パーセンタイル
+_Z_99 = 2.3263
+
+
+class FaultInjector:
+    """
+    DynamoDB相当の遅延と障害を注入する
+
+    障害はDynamoDB（botocore）と同じ例外で発生させるため、再試行や
+    サーキットブレーカーは実際のバックエンドと同じように動作する。
+    """
+
+    def __init__(self, profile: FaultProfile, seed: Optional[int] = None):
+        self.profile = profile
+        self._random = random.Random(seed)
+        self._mu = math.log(max(profile.latency_median, 1e-6))
+        self._sigma = max(
+            0.0,
+            math.log(max(profile.latency_p99, profile.latency_median) / max(profile.latency_median, 1e-6)) / _Z_99
+        )
+        self._metrics: Dict[str, int] = {
+            "calls": 0,
+            "throttled": 0,
+            "timeouts": 0,
+            "batch_items_failed": 0,
+        }
+
+    def sample_latency(self) -> float:
+        """1回分の遅延（秒）"""
+        return self._random.lognormvariate(self._mu, self._sigma)
+
+    async def inject(self, operation: str) -> None:
+        """
+        1回分の遅延を待ち、設定した確率で障害を発生させる
+
+        Raises:
+            ClientError: スロットリング（ProvisionedThroughputExceededException）
+            ReadTimeoutError: タイムアウト
+        """
+        self._metrics["calls"] += 1
+        roll = self._random.random()
+
+        if roll < self.profile.timeout_rate:
+            self._metrics["timeouts"] += 1
+            await asyncio.sleep(self.profile.timeout)
+            raise ReadTimeoutError(endpoint_url=f"fault-injection://{operation}")
+
+        if roll < self.profile.timeout_rate + self.profile.throttle_rate:
+            self._metrics["throttled"] += 1
+            await asyncio.sleep(self.sample_latency())
+            raise ClientError(
+                {
+                    "Error": {
+                        "Code": "ProvisionedThroughputExceededException",
+                        "Message": "注入されたスロットリング"
+                    }
+                },
+                operation
+            )
+
+        await asyncio.sleep(self.sample_latency())
+
+    def failed_items(self, ids: List[str]) -> List[str]:
+        """一括書き込みで書き込めなかったことにするIDを選ぶ"""
+        failed = [
+            item_id for item_id in ids
+            if self._random.random() < self.profile.batch_failure_rate
+        ]
+        self._metrics["batch_items_failed"] += len(failed)
+        return failed
+
+    def get_metrics(self) -> dict:
+        """注入した遅延・障害のメトリクスを取得"""
+        return dict(self._metrics)
@@ -0,0 +1,157 @@
+"""
+Infrastructure層: リクエスト単位のバックエンド呼び出しの集計
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Optional
+
+
+@dataclass
+class OperationCount:
+    """操作ごとの呼び出し回数・所要時間・消費キャパシティ"""
+    calls: int = 0
+    seconds: float = 0.0
+    capacity_units: float = 0.0
+
+
+@dataclass
+class BackendCallAccount:
+    """
+    1リクエスト（または計測範囲）で行ったバックエンド呼び出しの集計
+
+    再試行した場合は1回ずつ数える。消費キャパシティは、DynamoDBが応答に
+    含めた場合（ReturnConsumedCapacityを指定した呼び出し）のみ集計する。
+    親を指定した場合は親にも同じ呼び出しを記録する（テストでの計測範囲の中で
+    リクエストごとの集計を行う場合など）。
+    """
+    parent: Optional["BackendCallAccount"] = None
+    calls: int = 0
+    seconds: float = 0.0
+    capacity_units: float = 0.0
+    operations: Dict[str, OperationCount] = field(default_factory=dict)
+
+    def record_call(self, operation: str, seconds: float, capacity_units: float = 0.0) -> None:
+        """バックエンド呼び出し1回分を記録"""
+        count = self.operations.get(operation)
+        if count is None:
+            count = OperationCount()
+            self.operations[operation] = count
+        count.calls += 1
+        count.seconds += seconds
+        count.capacity_units += capacity_units
+        self.calls += 1
+        self.seconds += seconds
+        self.capacity_units += capacity_units
+        if self.parent is not None:
+            self.parent.record_call(operation, seconds, capacity_units)
+
+    def server_timing(self) -> str:
+        """Server-Timingヘッダーの値（合計と操作ごとの内訳）"""
+        metrics = [
+            f'backend;dur={self.seconds * 1000:.3f};desc="calls={self.calls} cu={self.capacity_units:g}"'
+        ]
+        for operation, count in self.operations.items():
+            metrics.append(
+                f'backend-{operation};dur={count.seconds * 1000:.3f};'
+                f'desc="calls={count.calls} cu={count.capacity_units:g}"'
+            )
+        return ", ".join(metrics)
+
+    def to_dict(self) -> dict:
+        """集計を辞書に変換"""
+        return {
+            "calls": self.calls,
+            "ms": round(self.seconds * 1000, 3),
+            "capacity_units": self.capacity_units,
+            "operations": {
+                operation: {
+                    "calls": count.calls,
+                    "ms": round(count.seconds * 1000, 3),
+                    "capacity_units": count.capacity_units,
+                }
+                for operation, count in self.operations.items()
+            },
+        }
+
+
+def consumed_capacity_units(response: Any) -> float:
+    """DynamoDBの応答から消費キャパシティの合計を取得（含まれていない場合は0）"""
+    if not isinstance(response, dict):
+        return 0.0
+    consumed = response.get("ConsumedCapacity")
+    if isinstance(consumed, dict):
+        consumed = [consumed]
+    if not isinstance(consumed, list):
+        return 0.0
+    return float(sum(entry.get("CapacityUnits", 0.0) for entry in consumed))
+
+
+# 集計中のリクエストの記録先（集計していない場合はNone）
+_current_account: ContextVar[Optional[BackendCallAccount]] = ContextVar(
+    "current_backend_call_account",
+    default=None
+)
+
+
+def current_backend_call_account() -> Optional[BackendCallAccount]:
+    """集計中のリクエストの記録先を取得"""
+    return _current_account.get()
+
+
+def set_backend_call_account(account: Optional[BackendCallAccount]):
+    """集計中のリクエストの記録先を設定（戻り値はreset_backend_call_accountに渡す）"""
+    return _current_account.set(account)
+
+
+def reset_backend_call_account(token) -> None:
+    """集計中のリクエストの記録先を元に戻す"""
+    _current_account.reset(token)
+
+
+class BackendCallBudgetExceeded(AssertionError):
+    """バックエンド呼び出しの回数が上限を超えた"""
+
+
+@contextmanager
+def assert_max_backend_calls(
+    max_calls: int,
+    operations: Optional[Dict[str, int]] = None
+) -> Iterator[BackendCallAccount]:
+    """
+    範囲内のバックエンド呼び出しの回数が上限以下であることを確認する
+
+    アプリケーションを同じイベントループ・同じコンテキストで呼び出すテスト
+    （httpx.ASGITransport など）で使う。別タスクで行われた呼び出しも、
+    範囲内で作成されたタスクであれば集計に含まれる。
+
+    Args:
+        max_calls: 呼び出し回数の上限（全操作の合計）
+        operations: 操作ごとの上限（例: {"get_item": 1}）
+
+    Raises:
+        BackendCallBudgetExceeded: 上限を超えた
+
+    例:
+        with assert_max_backend_calls(3, {"get_item": 1}) as account:
+            await client.delete(f"/todos/{todo_id}")
+    """
+    account = BackendCallAccount(parent=current_backend_call_account())
+    token = set_backend_call_account(account)
+    try:
+        yield account
+    finally:
+        reset_backend_call_account(token)
+
+    exceeded = []
+    if account.calls > max_calls:
+        exceeded.append(f"合計 {account.calls}回 > {max_calls}回")
+    for operation, limit in (operations or {}).items():
+        count = account.operations.get(operation)
+        if count is not None and count.calls > limit:
+            exceeded.append(f"{operation} {count.calls}回 > {limit}回")
+    if exceeded:
+        detail = ", ".join(f"{operation}={count.calls}" for operation, count in account.operations.items())
+        raise BackendCallBudgetExceeded(
+            f"バックエンド呼び出しが上限を超えました: {'; '.join(exceeded)}（内訳: {detail}）"
+        )
@@ -0,0 +1,85 @@
+"""
+Infrastructure層: プロファイルのファイル保存
+"""
+import json
+import os
+import re
+from typing import List, Optional
+
+
+# プロファイルIDとして受け付ける形式（パスの指定を防ぐ）
+_PROFILE_ID_PATTERN = re.compile(r"^[0-9]+-[0-9a-f]+$")
+
+
+class ProfileStore:
+    """
+    プロファイルを件数上限付きでディレクトリに保存する
+
+    プロファイルごとに概要（<id>.json）と、CPUプロファイルの場合は
+    pstats形式のダンプ（<id>.prof）を保存する。上限を超えた場合は古いものから削除する。
+    ファイル操作は同期的に行うため、呼び出し側でスレッドに逃がすこと。
+    """
+
+    def __init__(self, directory: str, max_profiles: int = 50):
+        self.directory = directory
+        self.max_profiles = max_profiles
+
+    def _path(self, profile_id: str, extension: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.{extension}")
+
+    @staticmethod
+    def is_valid_id(profile_id: str) -> bool:
+        """プロファイルIDの形式を確認"""
+        return bool(_PROFILE_ID_PATTERN.match(profile_id))
+
+    def _profile_ids(self) -> List[str]:
+        """保存されているプロファイルIDを古い順に取得"""
+        if not os.path.isdir(self.directory):
+            return []
+        ids = [
+            name[:-len(".json")]
+            for name in os.listdir(self.directory)
+            if name.endswith(".json") and self.is_valid_id(name[:-len(".json")])
+        ]
+        # IDはナノ秒単位の時刻から始まる
+        return sorted(ids, key=lambda profile_id: int(profile_id.split("-")[0]))
+
+    def save(self, profile_id: str, summary: dict, profiler=None) -> None:
+        """プロファイルを保存し、上限を超えた古いものを削除"""
+        os.makedirs(self.directory, exist_ok=True)
+
+        if profiler is not None:
+            profiler.dump_stats(self._path(profile_id, "prof"))
+
+        # 概要は最後に書き込む（一覧には概要のあるものだけが表示される）
+        temporary_path = self._path(profile_id, "json.tmp")
+        with open(temporary_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False)
+        os.replace(temporary_path, self._path(profile_id, "json"))
+
+        ids = self._profile_ids()
+        for old_id in ids[:max(0, len(ids) - self.max_profiles)]:
+            for extension in ("json", "prof"):
+                try:
+                    os.remove(self._path(old_id, extension))
+                except FileNotFoundError:
+                    pass
+
+    def list(self) -> List[dict]:
+        """保存されているプロファイルの概要を新しい順に取得"""
+        summaries = []
+        for profile_id in reversed(self._profile_ids()):
+            try:
+                with open(self._path(profile_id, "json"), encoding="utf-8") as f:
+                    summaries.append(json.load(f))
+            except (FileNotFoundError, json.JSONDecodeError):
+                # 一覧の取得中に削除されたもの
+                continue
+        return summaries
+
+    def find_dump_path(self, profile_id: str) -> Optional[str]:
+        """CPUプロファイルのダンプのパスを取得（存在しない場合はNone）"""
+        if not self.is_valid_id(profile_id):
+            return None
+        path = self._path(profile_id, "prof")
+        return path if os.path.exists(path) else None
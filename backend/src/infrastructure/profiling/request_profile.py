@@ -0,0 +1,85 @@
+"""
+Infrastructure層: リクエスト単位のプロファイル計測
+"""
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class BackendCallStats:
+    """操作ごとのバックエンド呼び出しの集計"""
+    calls: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class RequestProfile:
+    """
+    1リクエスト分の時間の内訳
+
+    on_loop_seconds はリクエストのコルーチンがイベントループを占有していた時間で、
+    同期的なバックエンド呼び出し（ループをブロックする呼び出し）を含む。
+    別タスクで行われた呼び出し（読み込みリクエスト集約など）はこのリクエストにとっては
+    待ち時間のため、ブロックした時間には含めない。
+    """
+    # リクエストのコルーチンを実行中か（別タスクでの呼び出しと区別する）
+    stepping: bool = False
+    on_loop_seconds: float = 0.0
+    backend_seconds: float = 0.0
+    backend_blocking_seconds: float = 0.0
+    operations: Dict[str, BackendCallStats] = field(default_factory=dict)
+
+    def record_backend_call(self, operation: str, seconds: float, blocking_seconds: float) -> None:
+        """バックエンド呼び出し1回分を記録"""
+        stats = self.operations.get(operation)
+        if stats is None:
+            stats = BackendCallStats()
+            self.operations[operation] = stats
+        stats.calls += 1
+        stats.seconds += seconds
+        self.backend_seconds += seconds
+        if self.stepping:
+            self.backend_blocking_seconds += blocking_seconds
+
+    def summary(self, wall_seconds: float) -> dict:
+        """時間の内訳をミリ秒単位で返す"""
+        backend_awaited = self.backend_seconds - self.backend_blocking_seconds
+        return {
+            "wall_ms": round(wall_seconds * 1000, 3),
+            # イベントループを占有していた時間からバックエンドの同期呼び出しを除いたもの
+            "cpu_ms": round(max(0.0, self.on_loop_seconds - self.backend_blocking_seconds) * 1000, 3),
+            "backend_ms": round(self.backend_seconds * 1000, 3),
+            "backend_blocking_ms": round(self.backend_blocking_seconds * 1000, 3),
+            "backend_awaited_ms": round(backend_awaited * 1000, 3),
+            # 他のリクエストの処理やバックエンド以外の待ち（スレッドプール等）
+            "other_wait_ms": round(
+                max(0.0, wall_seconds - self.on_loop_seconds - backend_awaited) * 1000, 3
+            ),
+            "operations": {
+                operation: {"calls": stats.calls, "ms": round(stats.seconds * 1000, 3)}
+                for operation, stats in self.operations.items()
+            },
+        }
+
+
+# 計測中のリクエストのプロファイル（計測していない場合はNone）
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar(
+    "current_request_profile",
+    default=None
+)
+
+
+def current_request_profile() -> Optional[RequestProfile]:
+    """計測中のリクエストのプロファイルを取得"""
+    return _current_profile.get()
+
+
+def set_request_profile(profile: Optional[RequestProfile]):
+    """計測中のリクエストのプロファイルを設定（戻り値はreset_request_profileに渡す）"""
+    return _current_profile.set(profile)
+
+
+def reset_request_profile(token) -> None:
+    """計測中のリクエストのプロファイルを元に戻す"""
+    _current_profile.reset(token)
@@ -0,0 +1,62 @@
+"""
+Infrastructure層: TODOの説明の圧縮
+"""
+import zlib
+from typing import Optional
+
+from domain.entities.todo import Todo
+
+
+# 圧縮した説明を保存する属性
+COMPRESSED_DESCRIPTION_ATTRIBUTE = "description_z"
+
+# zlibの圧縮レベル（速度と圧縮率のバランス）
+COMPRESSION_LEVEL = 6
+
+
+def compress_description(description: str, threshold: int) -> Optional[bytes]:
+    """
+    説明を圧縮する
+
+    Returns:
+        圧縮したバイト列（しきい値未満、または圧縮しても小さくならない場合はNone）
+    """
+    encoded = description.encode("utf-8")
+    if len(encoded) < threshold:
+        return None
+    compressed = zlib.compress(encoded, COMPRESSION_LEVEL)
+    return compressed if len(compressed) < len(encoded) else None
+
+
+def decompress_description(compressed: bytes) -> str:
+    """圧縮した説明を展開する"""
+    return zlib.decompress(compressed).decode("utf-8")
+
+
+class LazyDescriptionTodo(Todo):
+    """
+    説明を圧縮したまま保持し、最初に参照された時に展開するTodo
+
+    説明を参照せずに保存し直す場合は、圧縮済みのバイト列をそのまま書き込める。
+    """
+
+    def __init__(self, *, compressed_description: bytes, **kwargs):
+        super().__init__(description=None, **kwargs)
+        self._compressed_description = compressed_description
+
+    @property
+    def description(self) -> Optional[str]:
+        if self._compressed_description is not None:
+            self._description = decompress_description(self._compressed_description)
+            self._compressed_description = None
+        return self._description
+
+    @description.setter
+    def description(self, value: Optional[str]) -> None:
+        self._description = value
+        self._compressed_description = None
+
+    @property
+    def compressed_description(self) -> Optional[bytes]:
+        """まだ展開していない圧縮済みの説明（展開済みまたは変更済みの場合はNone）"""
+        return self._compressed_description
@@ -0,0 +1,210 @@
+"""
+Infrastructure層: DynamoDB 冪等キーリポジトリ実装
+"""
+import inspect
+import time
+import uuid
+from datetime import timedelta
+from typing import Any, Callable, Optional
+
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+from domain.entities.idempotency_record import IdempotencyRecord
+from domain.entities.todo import Todo
+from domain.repositories.exceptions import RepositoryError
+from domain.repositories.idempotency_repository import IdempotencyRepository
+from infrastructure.database.dynamodb_client import (
+    DynamoDBClient,
+    IDEMPOTENCY_TABLE_NAME,
+    TTL_ATTRIBUTE_NAME
+)
+from infrastructure.database.timestamps import from_storage_timestamp, to_storage_timestamp
+from infrastructure.repositories.compressed_description import (
+    COMPRESSED_DESCRIPTION_ATTRIBUTE,
+    compress_description,
+    decompress_description
+)
+from infrastructure.profiling.backend_call_account import current_backend_call_account
+from infrastructure.resilience.resilient_caller import ResilientCaller
+
+
+class DynamoDBIdempotencyRepository(IdempotencyRepository):
+    """
+    DynamoDBを使用した冪等キーリポジトリの実装
+
+    記録は条件付き書き込み（attribute_not_exists）で登録し、TTLで自動削除する。
+    処理中の記録には短いリース期限を設け、処理中にプロセスが停止しても
+    リース期限を過ぎれば同じキーで再試行できるようにする。
+    処理結果の記録と削除は、登録時に発行したトークンを持つリクエストだけが行える。
+    """
+
+    def __init__(
+        self,
+        dynamodb_client: DynamoDBClient,
+        ttl: timedelta = timedelta(hours=24),
+        lease: timedelta = timedelta(seconds=30),
+        resilient_caller: Optional[ResilientCaller] = None,
+        description_compression_threshold: Optional[int] = 1024
+    ):
+        self.dynamodb_client = dynamodb_client
+        self.table_name = IDEMPOTENCY_TABLE_NAME
+        self.ttl = ttl
+        self.lease = lease
+        self.resilient_caller = resilient_caller
+        self.description_compression_threshold = description_compression_threshold
+
+    def _get_table(self):
+        """テーブルを取得"""
+        return self.dynamodb_client.get_table(self.table_name)
+
+    async def _call(self, operation: str, fn: Callable[..., Any], **kwargs) -> Any:
+        """DynamoDBを呼び出す（再試行とサーキットブレーカーを適用）"""
+        if current_backend_call_account() is not None:
+            # 呼び出しを集計中のリクエストでは消費キャパシティも返させる
+            kwargs.setdefault('ReturnConsumedCapacity', 'TOTAL')
+        if self.resilient_caller is None:
+            result = fn(**kwargs)
+            return await result if inspect.isawaitable(result) else result
+        return await self.resilient_caller.call(operation, fn, **kwargs)
+
+    def _todo_to_attribute(self, todo: Todo) -> dict:
+        """
+        レスポンスの再現に必要な項目だけを保存する
+
+        大きな説明はTODOテーブルと同じく圧縮し、アイテムサイズの上限を超えにくくする。
+        """
+        attribute = {
+            'id': todo.id,
+            'title': todo.title,
+            'completed': todo.completed,
+            'created_at': to_storage_timestamp(todo.created_at),
+            'updated_at': to_storage_timestamp(todo.updated_at)
+        }
+
+        compressed = None
+        if todo.description is not None and self.description_compression_threshold is not None:
+            compressed = compress_description(todo.description, self.description_compression_threshold)
+
+        if compressed is not None:
+            attribute[COMPRESSED_DESCRIPTION_ATTRIBUTE] = compressed
+        else:
+            attribute['description'] = todo.description
+        return attribute
+
+    @staticmethod
+    def _attribute_to_todo(attribute: dict) -> Todo:
+        """保存した項目からTodoエンティティを復元"""
+        if COMPRESSED_DESCRIPTION_ATTRIBUTE in attribute:
+            description = decompress_description(bytes(attribute[COMPRESSED_DESCRIPTION_ATTRIBUTE]))
+        else:
+            description = attribute.get('description')
+        return Todo(
+            id=attribute['id'],
+            title=attribute['title'],
+            description=description,
+            completed=attribute.get('completed', False),
+            created_at=from_storage_timestamp(attribute['created_at']),
+            updated_at=from_storage_timestamp(attribute['updated_at'])
+        )
+
+    async def claim(self, key: str, request_hash: str) -> Optional[str]:
+        """冪等キーを処理中として登録"""
+        now = int(time.time())
+        claim_token = uuid.uuid4().hex
+        try:
+            table = self._get_table()
+            await self._call(
+                'put_item',
+                table.put_item,
+                Item={
+                    'idempotency_key': key,
+                    'request_hash': request_hash,
+                    'claim_token': claim_token,
+                    'lease_expires_at': now + int(self.lease.total_seconds()),
+                    TTL_ATTRIBUTE_NAME: now + int(self.ttl.total_seconds())
+                },
+                # 記録がない、または処理中のままリース期限が切れている場合のみ登録
+                ConditionExpression=(
+                    Attr('idempotency_key').not_exists()
+                    | (Attr('response').not_exists() & Attr('lease_expires_at').lt(now))
+                )
+            )
+            return claim_token
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return None
+            raise RepositoryError(f"冪等キー登録エラー: {str(e)}") from e
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"冪等キー登録エラー: {str(e)}") from e
+
+    async def find(self, key: str) -> Optional[IdempotencyRecord]:
+        """冪等キーの記録を取得"""
+        try:
+            table = self._get_table()
+            response = await self._call(
+                'get_item',
+                table.get_item,
+                Key={'idempotency_key': key},
+                ConsistentRead=True
+            )
+
+            item = response.get('Item')
+            if item is None:
+                return None
+
+            todo = self._attribute_to_todo(item['response']) if 'response' in item else None
+            return IdempotencyRecord(key=key, request_hash=item['request_hash'], todo=todo)
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"冪等キー取得エラー: {str(e)}") from e
+
+    async def complete(self, key: str, claim_token: str, todo: Todo) -> bool:
+        """冪等キーの処理結果を記録"""
+        try:
+            table = self._get_table()
+            await self._call(
+                'update_item',
+                table.update_item,
+                Key={'idempotency_key': key},
+                UpdateExpression='SET #response = :response, #ttl = :ttl REMOVE claim_token, lease_expires_at',
+                # 処理中の記録を所有している場合のみ記録する
+                ConditionExpression='claim_token = :claim_token',
+                ExpressionAttributeNames={'#response': 'response', '#ttl': TTL_ATTRIBUTE_NAME},
+                ExpressionAttributeValues={
+                    ':response': self._todo_to_attribute(todo),
+                    ':ttl': int(time.time() + self.ttl.total_seconds()),
+                    ':claim_token': claim_token
+                }
+            )
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise RepositoryError(f"冪等キー保存エラー: {str(e)}") from e
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"冪等キー保存エラー: {str(e)}") from e
+
+    async def release(self, key: str, claim_token: str) -> None:
+        """処理に失敗した冪等キーの記録を削除"""
+        try:
+            table = self._get_table()
+            await self._call(
+                'delete_item',
+                table.delete_item,
+                Key={'idempotency_key': key},
+                # 完了済みの記録や、他のリクエストが登録し直した記録は消さない
+                ConditionExpression=Attr('claim_token').eq(claim_token)
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise RepositoryError(f"冪等キー削除エラー: {str(e)}") from e
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"冪等キー削除エラー: {str(e)}") from e
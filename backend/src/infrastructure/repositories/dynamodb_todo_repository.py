@@ -1,102 +1,595 @@
 """
 Infrastructure層: DynamoDB TODO リポジトリ実装
 """
-from typing import List, Optional
-from datetime import datetime
+import asyncio
+import functools
+import inspect
+from typing import Any, Callable, FrozenSet, List, Optional
+from datetime import datetime, timedelta
+from boto3.dynamodb.conditions import Attr, Key
 from botocore.exceptions import ClientError
 
+from domain.entities.partial_todo import PartialTodo
 from domain.entities.todo import Todo
+from domain.entities.todo_changes import TodoChanges, TodoTombstone
+from domain.entities.todo_order import todo_order_key
+from domain.entities.todo_stats import TodoStats
+from domain.repositories.exceptions import RepositoryError
 from domain.repositories.todo_repository import TodoRepository
-from infrastructure.database.dynamodb_client import DynamoDBClient
+from infrastructure.database.dynamodb_client import (
+    DynamoDBClient,
+    EXPIRY_INDEX_NAME,
+    EXPIRY_PARTITION_KEY_ATTRIBUTE,
+    ORDER_INDEX_NAME,
+    ORDER_KEY_ATTRIBUTE,
+    SYNC_INDEX_NAME,
+    SYNC_PARTITION_KEY,
+    TTL_ATTRIBUTE_NAME
+)
+from infrastructure.database.timestamps import from_storage_timestamp, to_storage_timestamp
+from infrastructure.repositories.compressed_description import (
+    COMPRESSED_DESCRIPTION_ATTRIBUTE,
+    LazyDescriptionTodo,
+    compress_description,
+    decompress_description
+)
+from infrastructure.profiling.backend_call_account import current_backend_call_account
+from infrastructure.resilience.resilient_caller import ResilientCaller
+
+
+# BatchWriteItemの1リクエストあたりの最大件数
+BATCH_WRITE_MAX_ITEMS = 25
+
+# UnprocessedItemsの再送回数
+BATCH_WRITE_MAX_RETRIES = 3
+
+# 取得する項目名 -> 読み込むDynamoDBの属性
+FIELD_ATTRIBUTES = {
+    'id': ('id',),
+    'title': ('title',),
+    'description': ('description', COMPRESSED_DESCRIPTION_ATTRIBUTE),
+    'completed': ('completed',),
+    'created_at': ('created_at',),
+    'updated_at': ('updated_at',),
+    'expires_at': (TTL_ATTRIBUTE_NAME,),
+}
 
 
 class DynamoDBTodoRepository(TodoRepository):
     """DynamoDBを使用したTODOリポジトリの実装"""
 
-    def __init__(self, dynamodb_client: DynamoDBClient):
+    def __init__(
+        self,
+        dynamodb_client: DynamoDBClient,
+        tombstone_retention: timedelta = timedelta(days=7),
+        resilient_caller: Optional[ResilientCaller] = None,
+        scan_segments: int = 4,
+        description_compression_threshold: Optional[int] = 1024
+    ):
         self.dynamodb_client = dynamodb_client
         self.table_name = "Todos"
+        self.tombstone_retention = tombstone_retention
+        self.resilient_caller = resilient_caller
+        # 件数集計の並列スキャンの分割数
+        self.scan_segments = scan_segments
+        # このバイト数以上の説明を圧縮して保存する（Noneの場合は圧縮しない）
+        self.description_compression_threshold = description_compression_threshold
 
     def _get_table(self):
         """テーブルを取得"""
         return self.dynamodb_client.get_table(self.table_name)
 
+    async def _call(self, operation: str, fn: Callable[..., Any], **kwargs) -> Any:
+        """DynamoDBを呼び出す（再試行とサーキットブレーカーを適用）"""
+        if current_backend_call_account() is not None:
+            # 呼び出しを集計中のリクエストでは消費キャパシティも返させる
+            kwargs.setdefault('ReturnConsumedCapacity', 'TOTAL')
+        if self.resilient_caller is None:
+            result = fn(**kwargs)
+            return await result if inspect.isawaitable(result) else result
+        return await self.resilient_caller.call(operation, fn, **kwargs)
+
     def _item_to_entity(self, item: dict) -> Todo:
         """DynamoDBアイテムをTodoエンティティに変換"""
-        return Todo(
-            id=item['id'],
-            title=item['title'],
-            description=item.get('description'),
-            completed=item.get('completed', False),
-            created_at=datetime.fromisoformat(item['created_at']),
-            updated_at=datetime.fromisoformat(item['updated_at'])
-        )
+        fields = {
+            'id': item['id'],
+            'title': item['title'],
+            'completed': item.get('completed', False),
+            'created_at': from_storage_timestamp(item['created_at']),
+            'updated_at': from_storage_timestamp(item['updated_at']),
+            'expires_at': (
+                datetime.fromtimestamp(int(item[TTL_ATTRIBUTE_NAME]))
+                if TTL_ATTRIBUTE_NAME in item else None
+            )
+        }
+
+        # 圧縮された説明は参照されるまで展開しない
+        if COMPRESSED_DESCRIPTION_ATTRIBUTE in item:
+            return LazyDescriptionTodo(
+                compressed_description=bytes(item[COMPRESSED_DESCRIPTION_ATTRIBUTE]),
+                **fields
+            )
+        return Todo(description=item.get('description'), **fields)
 
     def _entity_to_item(self, todo: Todo) -> dict:
         """TodoエンティティをDynamoDBアイテムに変換"""
-        return {
+        item = {
             'id': todo.id,
+            'sync_pk': SYNC_PARTITION_KEY,
+            ORDER_KEY_ATTRIBUTE: todo_order_key(todo.id, todo.created_at),
             'title': todo.title,
-            'description': todo.description,
             'completed': todo.completed,
-            'created_at': todo.created_at.isoformat(),
-            'updated_at': todo.updated_at.isoformat()
+            'created_at': to_storage_timestamp(todo.created_at),
+            'updated_at': to_storage_timestamp(todo.updated_at)
         }
 
+        # 大きな説明は圧縮してバイナリ属性に保存する
+        compressed = None
+        if isinstance(todo, LazyDescriptionTodo) and todo.compressed_description is not None:
+            # 読み込んでから説明を参照していなければ、展開せずにそのまま書き戻す
+            compressed = todo.compressed_description
+        elif todo.description is not None and self.description_compression_threshold is not None:
+            compressed = compress_description(todo.description, self.description_compression_threshold)
+
+        if compressed is not None:
+            item[COMPRESSED_DESCRIPTION_ATTRIBUTE] = compressed
+        else:
+            item['description'] = todo.description
+
+        if todo.expires_at is not None:
+            item[TTL_ATTRIBUTE_NAME] = int(todo.expires_at.timestamp())
+            # 保持期限のあるTODOだけを保持期限のインデックスに含める
+            item[EXPIRY_PARTITION_KEY_ATTRIBUTE] = SYNC_PARTITION_KEY
+        return item
+
+    def _item_to_partial(self, item: dict, fields: FrozenSet[str]) -> PartialTodo:
+        """一部の属性だけを読み込んだDynamoDBアイテムをPartialTodoに変換"""
+        values = {}
+        if 'title' in fields:
+            values['title'] = item.get('title')
+        if 'description' in fields:
+            if COMPRESSED_DESCRIPTION_ATTRIBUTE in item:
+                values['description'] = decompress_description(bytes(item[COMPRESSED_DESCRIPTION_ATTRIBUTE]))
+            else:
+                values['description'] = item.get('description')
+        if 'completed' in fields:
+            values['completed'] = item.get('completed', False)
+        for name in ('created_at', 'updated_at'):
+            if name in fields and name in item:
+                values[name] = from_storage_timestamp(item[name])
+        if 'expires_at' in fields and TTL_ATTRIBUTE_NAME in item:
+            values['expires_at'] = datetime.fromtimestamp(int(item[TTL_ATTRIBUTE_NAME]))
+        return PartialTodo(id=item['id'], fields=fields, **values)
+
+    def _tombstone_item(self, todo_id: str) -> dict:
+        """削除済みを表すDynamoDBアイテムを作成（保持期間を過ぎるとTTLで消える）"""
+        now = datetime.now()
+        return {
+            'id': todo_id,
+            'sync_pk': SYNC_PARTITION_KEY,
+            'deleted': True,
+            'updated_at': to_storage_timestamp(now),
+            TTL_ATTRIBUTE_NAME: int((now + self.tombstone_retention).timestamp())
+        }
+
+    @staticmethod
+    def _is_tombstone(item: dict) -> bool:
+        """削除済みのアイテムか確認"""
+        return item.get('deleted', False)
+
+    @staticmethod
+    def _is_index_unavailable(error: ClientError) -> bool:
+        """
+        インデックスが未作成または作成中で問い合わせられないエラーか確認
+
+        インデックスの作成は scripts/migrate_todo_indexes.py で行い、起動時には待たないため、
+        使えるようになるまではインデックスを使う読み込みをスキャンで代替する。
+        """
+        error = error.response.get('Error', {})
+        return (
+            error.get('Code') in ('ValidationException', 'ResourceNotFoundException')
+            and 'index' in error.get('Message', '').lower()
+        )
+
+    async def _scan_items(self, scan_kwargs: dict) -> List[dict]:
+        """条件に合うアイテムを全ページ読み込む（インデックスが使えない場合の代替）"""
+        table = self._get_table()
+        items: List[dict] = []
+        while True:
+            response = await self._call('scan', table.scan, **scan_kwargs)
+            items.extend(response.get('Items', []))
+
+            if 'LastEvaluatedKey' not in response:
+                return items
+            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
     async def find_all(self) -> List[Todo]:
         """全てのTODOを取得"""
         try:
             table = self._get_table()
-            response = table.scan()
-            items = response.get('Items', [])
+            scan_kwargs = {'FilterExpression': Attr('deleted').not_exists()}
+
+            # 削除済みの記録が1ページ分を占めることがあるため全ページを読む
+            todos: List[Todo] = []
+            while True:
+                response = await self._call('scan', table.scan, **scan_kwargs)
+                todos.extend(self._item_to_entity(item) for item in response.get('Items', []))
+
+                if 'LastEvaluatedKey' not in response:
+                    break
+                scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+            return todos
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"TODO一覧取得エラー: {str(e)}") from e
+
+    async def find_all_partial(self, fields: FrozenSet[str]) -> List[PartialTodo]:
+        """全てのTODOを指定した項目だけ取得（ProjectionExpressionで読み込む属性を絞る）"""
+        fields = frozenset(fields) | {'id'}
+        attributes = [attribute for name in sorted(fields) for attribute in FIELD_ATTRIBUTES[name]]
+        try:
+            table = self._get_table()
+            scan_kwargs = {
+                'FilterExpression': Attr('deleted').not_exists(),
+                # 予約語と衝突しないよう属性名はプレースホルダーで指定する
+                'ProjectionExpression': ', '.join(f'#p{i}' for i in range(len(attributes))),
+                'ExpressionAttributeNames': {f'#p{i}': attribute for i, attribute in enumerate(attributes)}
+            }
+
+            todos: List[PartialTodo] = []
+            while True:
+                response = await self._call('scan', table.scan, **scan_kwargs)
+                todos.extend(self._item_to_partial(item, fields) for item in response.get('Items', []))
+
+                if 'LastEvaluatedKey' not in response:
+                    break
+                scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+            return todos
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"TODO一覧取得エラー: {str(e)}") from e
+
+    async def find_page(
+        self,
+        limit: int,
+        before: Optional[str] = None,
+        after: Optional[str] = None
+    ) -> List[Todo]:
+        """
+        作成順のインデックスのキー範囲でTODOを取得（新しい順）
+
+        削除済みの記録は作成順のキーを持たないためインデックスに含まれない。
+        インデックスからの読み込みは結果整合性のため、作成直後のTODOが
+        含まれないことがある。
+        """
+        try:
+            table = self._get_table()
+            condition = Key('sync_pk').eq(SYNC_PARTITION_KEY)
+            if after is not None:
+                # キーに近い（古い）ものから読み、最後に新しい順に並べ替える
+                condition &= Key(ORDER_KEY_ATTRIBUTE).gt(after)
+            elif before is not None:
+                condition &= Key(ORDER_KEY_ATTRIBUTE).lt(before)
+
+            query_kwargs = {
+                'IndexName': ORDER_INDEX_NAME,
+                'KeyConditionExpression': condition,
+                'ScanIndexForward': after is not None,
+                'Limit': limit
+            }
+
+            todos: List[Todo] = []
+            try:
+                while len(todos) < limit:
+                    response = await self._call('query', table.query, **query_kwargs)
+                    todos.extend(self._item_to_entity(item) for item in response.get('Items', []))
 
-            todos = [self._item_to_entity(item) for item in items]
+                    # 1MBを超えたページは途中で打ち切られるため、件数に達するまで続きを読む
+                    if 'LastEvaluatedKey' not in response:
+                        break
+                    query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+                    query_kwargs['Limit'] = limit - len(todos)
+            except ClientError as e:
+                if not self._is_index_unavailable(e):
+                    raise
+                return await self._find_page_by_scan(limit, before, after)
+
+            if after is not None:
+                todos.reverse()
             return todos
+        except RepositoryError:
+            raise
         except Exception as e:
-            raise Exception(f"TODO一覧取得エラー: {str(e)}")
+            raise RepositoryError(f"TODO一覧取得エラー: {str(e)}") from e
+
+    async def _find_page_by_scan(
+        self,
+        limit: int,
+        before: Optional[str],
+        after: Optional[str]
+    ) -> List[Todo]:
+        """作成順のインデックスが使えるようになるまでの代替（全件を読み込んで並べ替える）"""
+        todos = [
+            todo for todo in await self.find_all()
+            if (before is None or todo_order_key(todo.id, todo.created_at) < before)
+            and (after is None or todo_order_key(todo.id, todo.created_at) > after)
+        ]
+        todos.sort(key=lambda todo: todo_order_key(todo.id, todo.created_at), reverse=True)
+        return todos[-limit:] if after is not None else todos[:limit]
 
     async def find_by_id(self, todo_id: str) -> Optional[Todo]:
         """IDでTODOを取得"""
         try:
             table = self._get_table()
-            response = table.get_item(Key={'id': todo_id})
+            response = await self._call('get_item', table.get_item, Key={'id': todo_id})
 
-            if 'Item' not in response:
+            if 'Item' not in response or self._is_tombstone(response['Item']):
                 return None
 
             return self._item_to_entity(response['Item'])
+        except RepositoryError:
+            raise
         except ClientError:
             return None
         except Exception as e:
-            raise Exception(f"TODO取得エラー: {str(e)}")
+            raise RepositoryError(f"TODO取得エラー: {str(e)}") from e
 
     async def save(self, todo: Todo) -> Todo:
         """TODOを保存（作成または更新）"""
         try:
             table = self._get_table()
             item = self._entity_to_item(todo)
-            table.put_item(Item=item)
+            await self._call('put_item', table.put_item, Item=item)
 
             return todo
+        except RepositoryError:
+            raise
         except Exception as e:
-            raise Exception(f"TODO保存エラー: {str(e)}")
+            raise RepositoryError(f"TODO保存エラー: {str(e)}") from e
+
+    async def delete(self, todo_id: str) -> Optional[Todo]:
+        """
+        TODOを削除（差分同期のため削除済みの記録に置き換える）
 
-    async def delete(self, todo_id: str) -> bool:
-        """TODOを削除"""
+        存在するTODOのみを条件付きで置き換え、置き換える前のアイテムを返させるため、
+        同じTODOを同時に削除しても削除したと判定されるのは1つだけになる。
+        """
         try:
             table = self._get_table()
-            table.delete_item(Key={'id': todo_id})
+            response = await self._call(
+                'put_item',
+                table.put_item,
+                Item=self._tombstone_item(todo_id),
+                ConditionExpression=Attr('id').exists() & Attr('deleted').not_exists(),
+                ReturnValues='ALL_OLD'
+            )
+            return self._item_to_entity(response['Attributes'])
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return None
+            raise RepositoryError(f"TODO削除エラー: {str(e)}") from e
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"TODO削除エラー: {str(e)}") from e
+
+    async def delete_expiring(self, todo_id: str, expires_at: datetime) -> bool:
+        """完了済みで保持期限が変わっていないTODOのみ削除（削除済みの記録に置き換える）"""
+        try:
+            table = self._get_table()
+            await self._call(
+                'put_item',
+                table.put_item,
+                Item=self._tombstone_item(todo_id),
+                ConditionExpression=(
+                    Attr('completed').eq(True)
+                    & Attr(TTL_ATTRIBUTE_NAME).eq(int(expires_at.timestamp()))
+                    & Attr('deleted').not_exists()
+                )
+            )
             return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return False
+            raise RepositoryError(f"TODO削除エラー: {str(e)}") from e
+        except RepositoryError:
+            raise
         except Exception as e:
-            raise Exception(f"TODO削除エラー: {str(e)}")
+            raise RepositoryError(f"TODO削除エラー: {str(e)}") from e
 
     async def exists(self, todo_id: str) -> bool:
         """TODOが存在するか確認"""
         try:
             table = self._get_table()
-            response = table.get_item(Key={'id': todo_id})
-            return 'Item' in response
+            response = await self._call('get_item', table.get_item, Key={'id': todo_id})
+            return 'Item' in response and not self._is_tombstone(response['Item'])
+        except RepositoryError:
+            raise
         except ClientError:
             return False
         except Exception as e:
-            raise Exception(f"TODO存在確認エラー: {str(e)}")
+            raise RepositoryError(f"TODO存在確認エラー: {str(e)}") from e
+
+    async def find_changes_since(self, since: datetime) -> TodoChanges:
+        """
+        指定時刻より後に作成・更新・削除されたTODOを取得
+
+        インデックスからの読み込みは結果整合性のため、直前の書き込みが含まれないことがある。
+        取りこぼしを防ぐ重複期間は呼び出し側（GetTodoChangesUseCase）で設ける。
+        """
+        try:
+            table = self._get_table()
+            query_kwargs = {
+                'IndexName': SYNC_INDEX_NAME,
+                'KeyConditionExpression': (
+                    Key('sync_pk').eq(SYNC_PARTITION_KEY)
+                    & Key('updated_at').gt(to_storage_timestamp(since))
+                )
+            }
+
+            items: List[dict] = []
+            try:
+                while True:
+                    response = await self._call('query', table.query, **query_kwargs)
+                    items.extend(response.get('Items', []))
+
+                    if 'LastEvaluatedKey' not in response:
+                        break
+                    query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            except ClientError as e:
+                if not self._is_index_unavailable(e):
+                    raise
+                items = await self._scan_items({
+                    'FilterExpression': Attr('updated_at').gt(to_storage_timestamp(since))
+                })
+
+            todos: List[Todo] = []
+            tombstones: List[TodoTombstone] = []
+            watermark = since
+            for item in items:
+                updated_at = from_storage_timestamp(item['updated_at'])
+                watermark = max(watermark, updated_at)
+                if self._is_tombstone(item):
+                    tombstones.append(TodoTombstone(id=item['id'], deleted_at=updated_at))
+                else:
+                    todos.append(self._item_to_entity(item))
+
+            return TodoChanges(todos=todos, tombstones=tombstones, watermark=watermark)
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"TODO差分取得エラー: {str(e)}") from e
+
+    async def find_expiring_before(self, deadline: datetime) -> List[Todo]:
+        """
+        指定日時までに保持期間が切れるTODOを取得
+
+        保持期限を持つTODOだけが含まれるインデックスを、保持期限の範囲で問い合わせる
+        （削除済みの記録はインデックスに含まれない）。
+        """
+        try:
+            table = self._get_table()
+            query_kwargs = {
+                'IndexName': EXPIRY_INDEX_NAME,
+                'KeyConditionExpression': (
+                    Key(EXPIRY_PARTITION_KEY_ATTRIBUTE).eq(SYNC_PARTITION_KEY)
+                    & Key(TTL_ATTRIBUTE_NAME).lte(int(deadline.timestamp()))
+                )
+            }
+
+            items: List[dict] = []
+            try:
+                while True:
+                    response = await self._call('query', table.query, **query_kwargs)
+                    items.extend(response.get('Items', []))
+
+                    if 'LastEvaluatedKey' not in response:
+                        break
+                    query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            except ClientError as e:
+                if not self._is_index_unavailable(e):
+                    raise
+                items = await self._scan_items({
+                    'FilterExpression': (
+                        Attr(TTL_ATTRIBUTE_NAME).lte(int(deadline.timestamp()))
+                        & Attr('deleted').not_exists()
+                    )
+                })
+
+            return [self._item_to_entity(item) for item in items]
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"TODO保持期限取得エラー: {str(e)}") from e
+
+    async def count(self) -> TodoStats:
+        """全てのTODOの件数を並列スキャンで数える"""
+        # 低レベルクライアントはスレッドセーフなので、セグメントごとに別スレッドでスキャンする
+        # （リソースから取得したクライアントは属性値を Python の型に変換して返す）
+        client = self.dynamodb_client.get_resource().meta.client
+        scan = functools.partial(asyncio.to_thread, client.scan)
+
+        async def count_segment(segment: int) -> TodoStats:
+            stats = TodoStats()
+            scan_kwargs = {
+                'TableName': self.table_name,
+                'Segment': segment,
+                'TotalSegments': self.scan_segments,
+                'ProjectionExpression': 'completed',
+                'FilterExpression': 'attribute_not_exists(deleted)'
+            }
+            while True:
+                response = await self._call('scan', scan, **scan_kwargs)
+                for item in response.get('Items', []):
+                    stats.total += 1
+                    if item.get('completed', False):
+                        stats.completed += 1
+
+                if 'LastEvaluatedKey' not in response:
+                    return stats
+                scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+        try:
+            results = await asyncio.gather(
+                *(count_segment(segment) for segment in range(self.scan_segments))
+            )
+            return TodoStats(
+                total=sum(stats.total for stats in results),
+                completed=sum(stats.completed for stats in results)
+            )
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"TODO件数集計エラー: {str(e)}") from e
+
+    async def save_many(self, todos: List[Todo]) -> List[str]:
+        """複数のTODOをBatchWriteItemでまとめて保存"""
+        return await self.batch_write(todos, [])
+
+    async def batch_write(self, todos: List[Todo], deleted_ids: List[str]) -> List[str]:
+        """
+        BatchWriteItemで複数のTODOをまとめて保存・削除する
+
+        Args:
+            todos: 保存するTODO
+            deleted_ids: 削除するTODO ID
+
+        Returns:
+            再送しても書き込めなかったTODO IDのリスト
+        """
+        requests = [
+            {'PutRequest': {'Item': self._entity_to_item(todo)}} for todo in todos
+        ] + [
+            {'PutRequest': {'Item': self._tombstone_item(todo_id)}} for todo_id in deleted_ids
+        ]
+
+        failed_ids: List[str] = []
+        try:
+            dynamodb = self.dynamodb_client.get_resource()
+            for start in range(0, len(requests), BATCH_WRITE_MAX_ITEMS):
+                pending = requests[start:start + BATCH_WRITE_MAX_ITEMS]
+
+                for attempt in range(BATCH_WRITE_MAX_RETRIES + 1):
+                    response = await self._call(
+                        'batch_write_item',
+                        dynamodb.batch_write_item,
+                        RequestItems={self.table_name: pending}
+                    )
+                    pending = response.get('UnprocessedItems', {}).get(self.table_name, [])
+                    if not pending:
+                        break
+                    if attempt < BATCH_WRITE_MAX_RETRIES:
+                        # スロットリング時は指数バックオフで再送
+                        await asyncio.sleep(0.05 * (2 ** attempt))
+
+                failed_ids.extend(request['PutRequest']['Item']['id'] for request in pending)
+
+            return failed_ids
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"TODO一括書き込みエラー: {str(e)}") from e
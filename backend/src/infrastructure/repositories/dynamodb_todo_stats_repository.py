@@ -0,0 +1,121 @@
+"""
+Infrastructure層: DynamoDB TODO集計リポジトリ実装
+"""
+import inspect
+import random
+from typing import Any, Callable, Optional
+
+from domain.entities.todo_stats import TodoStats
+from domain.repositories.exceptions import RepositoryError
+from domain.repositories.todo_stats_repository import TodoStatsRepository
+from infrastructure.database.dynamodb_client import DynamoDBClient, STATS_TABLE_NAME
+from infrastructure.profiling.backend_call_account import current_backend_call_account
+from infrastructure.resilience.resilient_caller import ResilientCaller
+
+
+class DynamoDBTodoStatsRepository(TodoStatsRepository):
+    """
+    シャーディングしたカウンターで件数を集計するリポジトリ
+
+    加算はランダムに選んだシャードへのアトミックなADD更新で行い、
+    1つのアイテムに書き込みが集中しないようにする。
+    取得時は全シャードをまとめて読み込んで合計する。
+    """
+
+    def __init__(
+        self,
+        dynamodb_client: DynamoDBClient,
+        shards: int = 8,
+        resilient_caller: Optional[ResilientCaller] = None
+    ):
+        self.dynamodb_client = dynamodb_client
+        self.table_name = STATS_TABLE_NAME
+        self.shards = shards
+        self.resilient_caller = resilient_caller
+
+    def _get_table(self):
+        """テーブルを取得"""
+        return self.dynamodb_client.get_table(self.table_name)
+
+    async def _call(self, operation: str, fn: Callable[..., Any], **kwargs) -> Any:
+        """DynamoDBを呼び出す（再試行とサーキットブレーカーを適用）"""
+        if current_backend_call_account() is not None:
+            # 呼び出しを集計中のリクエストでは消費キャパシティも返させる
+            kwargs.setdefault('ReturnConsumedCapacity', 'TOTAL')
+        if self.resilient_caller is None:
+            result = fn(**kwargs)
+            return await result if inspect.isawaitable(result) else result
+        return await self.resilient_caller.call(operation, fn, **kwargs)
+
+    def _shard_key(self, shard: int) -> dict:
+        """シャードのキー"""
+        return {'shard': f"todos#{shard}"}
+
+    async def increment(self, total: int = 0, completed: int = 0) -> None:
+        """件数を加算（負の値で減算）"""
+        if total == 0 and completed == 0:
+            return
+        try:
+            table = self._get_table()
+            await self._call(
+                'update_item',
+                table.update_item,
+                Key=self._shard_key(random.randrange(self.shards)),
+                UpdateExpression="ADD #total :total, #completed :completed",
+                ExpressionAttributeNames={'#total': 'total', '#completed': 'completed'},
+                ExpressionAttributeValues={':total': total, ':completed': completed}
+            )
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"TODO集計更新エラー: {str(e)}") from e
+
+    async def get(self) -> TodoStats:
+        """全シャードを合計した集計を取得"""
+        try:
+            dynamodb = self.dynamodb_client.get_resource()
+            response = await self._call(
+                'batch_get_item',
+                dynamodb.batch_get_item,
+                RequestItems={
+                    self.table_name: {
+                        'Keys': [self._shard_key(shard) for shard in range(self.shards)]
+                    }
+                }
+            )
+
+            stats = TodoStats()
+            for item in response.get('Responses', {}).get(self.table_name, []):
+                stats.total += int(item.get('total', 0))
+                stats.completed += int(item.get('completed', 0))
+            return stats
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"TODO集計取得エラー: {str(e)}") from e
+
+    async def overwrite(self, stats: TodoStats) -> None:
+        """集計を先頭のシャードにまとめ、他のシャードを0にする"""
+        try:
+            dynamodb = self.dynamodb_client.get_resource()
+            requests = [
+                {
+                    'PutRequest': {
+                        'Item': {
+                            **self._shard_key(shard),
+                            'total': stats.total if shard == 0 else 0,
+                            'completed': stats.completed if shard == 0 else 0
+                        }
+                    }
+                }
+                for shard in range(self.shards)
+            ]
+            await self._call(
+                'batch_write_item',
+                dynamodb.batch_write_item,
+                RequestItems={self.table_name: requests}
+            )
+        except RepositoryError:
+            raise
+        except Exception as e:
+            raise RepositoryError(f"TODO集計保存エラー: {str(e)}") from e
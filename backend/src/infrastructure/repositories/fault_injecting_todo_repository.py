@@ -0,0 +1,122 @@
+"""
+Infrastructure層: 遅延・障害を注入する TODO リポジトリ
+"""
+from datetime import datetime
+from typing import FrozenSet, List, Optional
+
+from domain.entities.partial_todo import PartialTodo
+from domain.entities.todo import Todo
+from domain.entities.todo_changes import TodoChanges
+from domain.entities.todo_stats import TodoStats
+from domain.repositories.todo_repository import TodoRepository
+from infrastructure.fault_injection.fault_injector import FaultInjector
+from infrastructure.resilience.resilient_caller import ResilientCaller
+
+
+class FaultInjectingTodoRepository(TodoRepository):
+    """
+    呼び出しごとに遅延と障害を注入してから元のリポジトリに委譲するリポジトリ
+
+    注入した障害には再試行とサーキットブレーカーを適用し、成功した場合のみ
+    元のリポジトリを呼び出す。元のリポジトリ自身の再試行と二重にならないよう、
+    委譲した呼び出しは再試行しない。
+    """
+
+    def __init__(
+        self,
+        repository: TodoRepository,
+        injector: FaultInjector,
+        resilient_caller: Optional[ResilientCaller] = None
+    ):
+        self.repository = repository
+        self.injector = injector
+        self.resilient_caller = resilient_caller
+
+    async def _inject(self, operation: str) -> None:
+        """遅延と障害を注入する（障害は再試行の対象）"""
+        if self.resilient_caller is None:
+            await self.injector.inject(operation)
+        else:
+            await self.resilient_caller.call(operation, self.injector.inject, operation)
+
+    async def find_all(self) -> List[Todo]:
+        """全てのTODOを取得"""
+        await self._inject('scan')
+        return await self.repository.find_all()
+
+    async def find_all_partial(self, fields: FrozenSet[str]) -> List[PartialTodo]:
+        """全てのTODOを指定した項目だけ取得"""
+        await self._inject('scan')
+        return await self.repository.find_all_partial(fields)
+
+    async def find_page(
+        self,
+        limit: int,
+        before: Optional[str] = None,
+        after: Optional[str] = None
+    ) -> List[Todo]:
+        """作成順のキーの範囲でTODOを取得（新しい順）"""
+        await self._inject('query')
+        return await self.repository.find_page(limit, before, after)
+
+    async def find_by_id(self, todo_id: str) -> Optional[Todo]:
+        """IDでTODOを取得"""
+        await self._inject('get_item')
+        return await self.repository.find_by_id(todo_id)
+
+    async def save(self, todo: Todo) -> Todo:
+        """TODOを保存"""
+        await self._inject('put_item')
+        return await self.repository.save(todo)
+
+    async def save_many(self, todos: List[Todo]) -> List[str]:
+        """複数のTODOをまとめて保存"""
+        return await self.batch_write(todos, [])
+
+    async def delete(self, todo_id: str) -> Optional[Todo]:
+        """TODOを削除"""
+        await self._inject('put_item')
+        return await self.repository.delete(todo_id)
+
+    async def delete_expiring(self, todo_id: str, expires_at: datetime) -> bool:
+        """完了済みで保持期限が変わっていないTODOのみ削除"""
+        await self._inject('put_item')
+        return await self.repository.delete_expiring(todo_id, expires_at)
+
+    async def exists(self, todo_id: str) -> bool:
+        """TODOが存在するか確認"""
+        await self._inject('get_item')
+        return await self.repository.exists(todo_id)
+
+    async def find_changes_since(self, since: datetime) -> TodoChanges:
+        """指定時刻より後に作成・更新・削除されたTODOを取得"""
+        await self._inject('query')
+        return await self.repository.find_changes_since(since)
+
+    async def find_expiring_before(self, deadline: datetime) -> List[Todo]:
+        """指定日時までに保持期間が切れるTODOを取得"""
+        await self._inject('scan')
+        return await self.repository.find_expiring_before(deadline)
+
+    async def count(self) -> TodoStats:
+        """全てのTODOの件数を数える"""
+        await self._inject('scan')
+        return await self.repository.count()
+
+    async def batch_write(self, todos: List[Todo], deleted_ids: List[str]) -> List[str]:
+        """
+        複数のTODOをまとめて保存・削除する
+
+        設定した確率で一部のTODOを書き込めなかったものとして返す
+
+        Returns:
+            書き込めなかったTODO IDのリスト
+        """
+        await self._inject('batch_write_item')
+
+        failed_ids = set(self.injector.failed_items([todo.id for todo in todos] + deleted_ids))
+        failed_ids.update(await self.repository.batch_write(
+            [todo for todo in todos if todo.id not in failed_ids],
+            [todo_id for todo_id in deleted_ids if todo_id not in failed_ids]
+        ))
+        return list(failed_ids)
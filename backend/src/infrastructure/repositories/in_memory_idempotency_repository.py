@@ -0,0 +1,82 @@
+"""
+Infrastructure層: インメモリ 冪等キーリポジトリ実装
+"""
+import copy
+import time
+import uuid
+from datetime import timedelta
+from typing import Dict, Optional
+
+from domain.entities.idempotency_record import IdempotencyRecord
+from domain.entities.todo import Todo
+from domain.repositories.idempotency_repository import IdempotencyRepository
+
+
+class InMemoryIdempotencyRepository(IdempotencyRepository):
+    """
+    プロセス内のメモリに冪等キーの記録を保持するリポジトリ
+
+    期限切れの記録は参照時に削除する
+    """
+
+    def __init__(
+        self,
+        ttl: timedelta = timedelta(hours=24),
+        lease: timedelta = timedelta(seconds=30)
+    ):
+        self.ttl = ttl
+        self.lease = lease
+        # 冪等キー -> (記録, 記録の有効期限, 処理中のリース期限, 処理中の記録を所有するトークン)
+        self._records: Dict[str, tuple] = {}
+
+    def _get(self, key: str) -> Optional[tuple]:
+        """有効な記録を取得"""
+        entry = self._records.get(key)
+        if entry is not None and entry[1] < time.time():
+            del self._records[key]
+            return None
+        return entry
+
+    async def claim(self, key: str, request_hash: str) -> Optional[str]:
+        """冪等キーを処理中として登録"""
+        now = time.time()
+        entry = self._get(key)
+        # 記録がない、または処理中のままリース期限が切れている場合のみ登録
+        if entry is not None and (entry[0].completed or entry[2] >= now):
+            return None
+
+        claim_token = uuid.uuid4().hex
+        self._records[key] = (
+            IdempotencyRecord(key=key, request_hash=request_hash),
+            now + self.ttl.total_seconds(),
+            now + self.lease.total_seconds(),
+            claim_token
+        )
+        return claim_token
+
+    async def find(self, key: str) -> Optional[IdempotencyRecord]:
+        """冪等キーの記録を取得"""
+        entry = self._get(key)
+        return copy.copy(entry[0]) if entry is not None else None
+
+    async def complete(self, key: str, claim_token: str, todo: Todo) -> bool:
+        """冪等キーの処理結果を記録"""
+        entry = self._get(key)
+        # 処理中の記録を所有している場合のみ記録する
+        if entry is None or entry[3] != claim_token:
+            return False
+
+        self._records[key] = (
+            IdempotencyRecord(key=key, request_hash=entry[0].request_hash, todo=copy.copy(todo)),
+            time.time() + self.ttl.total_seconds(),
+            0.0,
+            None
+        )
+        return True
+
+    async def release(self, key: str, claim_token: str) -> None:
+        """処理に失敗した冪等キーの記録を削除"""
+        entry = self._get(key)
+        # 完了済みの記録や、他のリクエストが登録し直した記録は消さない
+        if entry is not None and entry[3] == claim_token:
+            del self._records[key]
@@ -0,0 +1,32 @@
+"""
+Infrastructure層: インメモリ インポートジョブリポジトリ実装
+"""
+from collections import OrderedDict
+from typing import Optional
+
+from domain.entities.import_job import ImportJob
+from domain.repositories.import_job_repository import ImportJobRepository
+
+
+class InMemoryImportJobRepository(ImportJobRepository):
+    """
+    プロセス内のメモリにインポートジョブを保持するリポジトリ
+
+    保持する件数には上限があり、超えた場合は古いジョブから破棄する。
+    ジョブは実行したプロセスでのみ参照できる。
+    """
+
+    def __init__(self, max_jobs: int = 100):
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, ImportJob]" = OrderedDict()
+
+    async def save(self, job: ImportJob) -> None:
+        """ジョブを保存"""
+        self._jobs[job.id] = job
+        self._jobs.move_to_end(job.id)
+        while len(self._jobs) > self.max_jobs:
+            self._jobs.popitem(last=False)
+
+    async def find_by_id(self, job_id: str) -> Optional[ImportJob]:
+        """IDでジョブを取得"""
+        return self._jobs.get(job_id)
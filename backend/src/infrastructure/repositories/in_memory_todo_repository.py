@@ -0,0 +1,148 @@
+"""
+Infrastructure層: インメモリ TODO リポジトリ実装
+"""
+import copy
+from datetime import datetime, timedelta
+from typing import Dict, FrozenSet, List, Optional
+
+from domain.entities.partial_todo import PartialTodo
+from domain.entities.todo import Todo
+from domain.entities.todo_changes import TodoChanges, TodoTombstone
+from domain.entities.todo_order import todo_order_key
+from domain.entities.todo_stats import TodoStats
+from domain.repositories.todo_repository import TodoRepository
+
+
+class InMemoryTodoRepository(TodoRepository):
+    """
+    プロセス内のメモリにTODOを保持するリポジトリ
+
+    DynamoDBを使わずに負荷試験や動作確認を行うための代替のバックエンド。
+    差分同期のため、削除したTODOは削除済みの記録として保持期間の間だけ残す。
+    プロセスを再起動すると内容は失われる。
+    """
+
+    def __init__(self, tombstone_retention: timedelta = timedelta(days=7)):
+        self._todos: Dict[str, Todo] = {}
+        self.tombstone_retention = tombstone_retention
+        # TODO ID -> 削除日時（削除した順）
+        self._tombstones: Dict[str, datetime] = {}
+
+    def _record_tombstone(self, todo_id: str) -> None:
+        """削除済みの記録を追加し、保持期間を過ぎた記録を古いものから捨てる"""
+        now = datetime.now()
+        # 削除した順を保つため、同じIDの古い記録は末尾に移す
+        self._tombstones.pop(todo_id, None)
+        self._tombstones[todo_id] = now
+
+        cutoff = now - self.tombstone_retention
+        expired_ids = []
+        for expired_id, deleted_at in self._tombstones.items():
+            if deleted_at >= cutoff:
+                break
+            expired_ids.append(expired_id)
+        for expired_id in expired_ids:
+            del self._tombstones[expired_id]
+
+    async def find_all(self) -> List[Todo]:
+        """全てのTODOを取得"""
+        return [copy.copy(todo) for todo in self._todos.values()]
+
+    async def find_all_partial(self, fields: FrozenSet[str]) -> List[PartialTodo]:
+        """全てのTODOを指定した項目だけ取得"""
+        return [PartialTodo.from_todo(todo, fields) for todo in self._todos.values()]
+
+    async def find_page(
+        self,
+        limit: int,
+        before: Optional[str] = None,
+        after: Optional[str] = None
+    ) -> List[Todo]:
+        """作成順のキーの範囲でTODOを取得（新しい順）"""
+        keyed = [(todo_order_key(todo.id, todo.created_at), todo) for todo in self._todos.values()]
+        if after is not None:
+            keyed = sorted((entry for entry in keyed if entry[0] > after), key=lambda entry: entry[0])[:limit]
+            keyed.reverse()
+        else:
+            keyed = sorted(
+                (entry for entry in keyed if before is None or entry[0] < before),
+                key=lambda entry: entry[0],
+                reverse=True
+            )[:limit]
+        return [copy.copy(todo) for _, todo in keyed]
+
+    async def find_by_id(self, todo_id: str) -> Optional[Todo]:
+        """IDでTODOを取得"""
+        todo = self._todos.get(todo_id)
+        return copy.copy(todo) if todo is not None else None
+
+    async def save(self, todo: Todo) -> Todo:
+        """TODOを保存（作成または更新）"""
+        self._todos[todo.id] = copy.copy(todo)
+        self._tombstones.pop(todo.id, None)
+        return todo
+
+    async def save_many(self, todos: List[Todo]) -> List[str]:
+        """複数のTODOをまとめて保存"""
+        return await self.batch_write(todos, [])
+
+    async def delete(self, todo_id: str) -> Optional[Todo]:
+        """TODOを削除（差分同期のため削除済みの記録を残す）"""
+        todo = self._todos.pop(todo_id, None)
+        if todo is None:
+            return None
+        self._record_tombstone(todo_id)
+        return todo
+
+    async def delete_expiring(self, todo_id: str, expires_at: datetime) -> bool:
+        """完了済みで保持期限が変わっていないTODOのみ削除"""
+        todo = self._todos.get(todo_id)
+        if todo is None or not todo.completed or todo.expires_at != expires_at:
+            return False
+        return await self.delete(todo_id) is not None
+
+    async def exists(self, todo_id: str) -> bool:
+        """TODOが存在するか確認"""
+        return todo_id in self._todos
+
+    async def find_changes_since(self, since: datetime) -> TodoChanges:
+        """指定時刻より後に作成・更新・削除されたTODOを取得"""
+        todos = [copy.copy(todo) for todo in self._todos.values() if todo.updated_at > since]
+        tombstones = [
+            TodoTombstone(id=todo_id, deleted_at=deleted_at)
+            for todo_id, deleted_at in self._tombstones.items()
+            if deleted_at > since
+        ]
+        watermark = max(
+            [since]
+            + [todo.updated_at for todo in todos]
+            + [tombstone.deleted_at for tombstone in tombstones]
+        )
+        return TodoChanges(todos=todos, tombstones=tombstones, watermark=watermark)
+
+    async def find_expiring_before(self, deadline: datetime) -> List[Todo]:
+        """指定日時までに保持期間が切れるTODOを取得"""
+        return [
+            copy.copy(todo) for todo in self._todos.values()
+            if todo.expires_at is not None and todo.expires_at <= deadline
+        ]
+
+    async def count(self) -> TodoStats:
+        """全てのTODOの件数を数える"""
+        return TodoStats(
+            total=len(self._todos),
+            completed=sum(1 for todo in self._todos.values() if todo.completed)
+        )
+
+    async def batch_write(self, todos: List[Todo], deleted_ids: List[str]) -> List[str]:
+        """
+        複数のTODOをまとめて保存・削除する
+
+        Returns:
+            書き込めなかったTODO IDのリスト（常に空）
+        """
+        for todo in todos:
+            await self.save(todo)
+        for todo_id in deleted_ids:
+            await self.delete(todo_id)
+        return []
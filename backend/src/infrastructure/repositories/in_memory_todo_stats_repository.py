@@ -0,0 +1,25 @@
+"""
+Infrastructure層: インメモリ TODO集計リポジトリ実装
+"""
+from domain.entities.todo_stats import TodoStats
+from domain.repositories.todo_stats_repository import TodoStatsRepository
+
+
+class InMemoryTodoStatsRepository(TodoStatsRepository):
+    """プロセス内のメモリに件数の集計を保持するリポジトリ"""
+
+    def __init__(self):
+        self._stats = TodoStats()
+
+    async def increment(self, total: int = 0, completed: int = 0) -> None:
+        """件数を加算（負の値で減算）"""
+        self._stats.total += total
+        self._stats.completed += completed
+
+    async def get(self) -> TodoStats:
+        """現在の集計を取得"""
+        return TodoStats(total=self._stats.total, completed=self._stats.completed)
+
+    async def overwrite(self, stats: TodoStats) -> None:
+        """集計を指定した値で置き換える"""
+        self._stats = TodoStats(total=stats.total, completed=stats.completed)
@@ -0,0 +1,258 @@
+"""
+Infrastructure層: 書き込みバッファ付き TODO リポジトリ実装
+"""
+import asyncio
+import copy
+from datetime import datetime
+from typing import Dict, FrozenSet, List, Optional
+
+from domain.entities.partial_todo import PartialTodo
+from domain.entities.todo import Todo
+from domain.entities.todo_changes import TodoChanges
+from domain.entities.todo_order import todo_order_key
+from domain.entities.todo_stats import TodoStats
+from domain.repositories.exceptions import RepositoryUnavailableError
+from domain.repositories.todo_repository import TodoRepository
+
+
+class WriteBehindTodoRepository(TodoRepository):
+    """
+    書き込みをメモリ上のバッファに溜めてまとめて反映するリポジトリ
+
+    同じIDへの更新はバッファ上で1件にまとめられ、一定間隔または
+    バッファ件数の上限到達時にBatchWriteItemでDynamoDBへ書き込まれる。
+    読み込みはバッファの内容を優先するため、未反映の更新も参照できる。
+    """
+
+    def __init__(
+        self,
+        repository: TodoRepository,
+        flush_interval: float = 0.5,
+        max_pending: int = 500
+    ):
+        """
+        Args:
+            repository: 実際の書き込み先となるリポジトリ（batch_writeを持つもの）
+            flush_interval: バッファを書き込む間隔（秒）。未反映の書き込みが
+                メモリ上に留まる時間の上限の目安
+            max_pending: バッファに保持できるTODOの最大件数。到達時は即座に書き込む
+        """
+        self.repository = repository
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        # TODO ID -> 書き込むTODO（Noneは削除）
+        self._pending: Dict[str, Optional[Todo]] = {}
+        # 書き込み中のバッファ（書き込み完了までは読み込みに反映する）
+        self._flushing: Dict[str, Optional[Todo]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self._metrics = {
+            "buffered_writes": 0,
+            "coalesced_writes": 0,
+            "flushed_items": 0,
+            "flush_count": 0,
+            "flush_errors": 0,
+        }
+
+    def _lookup(self, todo_id: str):
+        """バッファ上の状態を取得（バッファにない場合はKeyError）"""
+        if todo_id in self._pending:
+            return self._pending[todo_id]
+        return self._flushing[todo_id]
+
+    def _is_buffered(self, todo_id: str) -> bool:
+        """バッファ上に状態があるか確認"""
+        return todo_id in self._pending or todo_id in self._flushing
+
+    async def _buffer(self, todo_id: str, todo: Optional[Todo]) -> None:
+        """書き込みをバッファに追加"""
+        if todo_id not in self._pending and len(self._pending) >= self.max_pending:
+            await self.flush()
+            if len(self._pending) >= self.max_pending:
+                raise RepositoryUnavailableError(
+                    "書き込みバッファが上限に達しています",
+                    retry_after=self.flush_interval
+                )
+
+        if todo_id in self._pending:
+            self._metrics["coalesced_writes"] += 1
+        self._metrics["buffered_writes"] += 1
+        self._pending[todo_id] = todo
+
+        if len(self._pending) >= self.max_pending:
+            await self.flush()
+
+    async def find_all(self) -> List[Todo]:
+        """全てのTODOを取得（未反映の書き込みを含む）"""
+        todos = {todo.id: todo for todo in await self.repository.find_all()}
+
+        for buffer in (self._flushing, self._pending):
+            for todo_id, todo in buffer.items():
+                if todo is None:
+                    todos.pop(todo_id, None)
+                else:
+                    todos[todo_id] = copy.copy(todo)
+
+        return list(todos.values())
+
+    async def find_all_partial(self, fields: FrozenSet[str]) -> List[PartialTodo]:
+        """全てのTODOを指定した項目だけ取得（未反映の書き込みを含む）"""
+        todos = {todo.id: todo for todo in await self.repository.find_all_partial(fields)}
+
+        for buffer in (self._flushing, self._pending):
+            for todo_id, todo in buffer.items():
+                if todo is None:
+                    todos.pop(todo_id, None)
+                else:
+                    todos[todo_id] = PartialTodo.from_todo(todo, fields)
+
+        return list(todos.values())
+
+    async def find_page(
+        self,
+        limit: int,
+        before: Optional[str] = None,
+        after: Optional[str] = None
+    ) -> List[Todo]:
+        """作成順のキーの範囲でTODOを取得（新しい順、未反映の書き込みを含む）"""
+        buffers = (self._flushing, self._pending)
+        # 未反映の削除で件数が減る分だけ多めに読む
+        deleted = sum(1 for buffer in buffers for todo in buffer.values() if todo is None)
+        todos = {todo.id: todo for todo in await self.repository.find_page(limit + deleted, before, after)}
+
+        for buffer in buffers:
+            for todo_id, todo in buffer.items():
+                if todo is None:
+                    todos.pop(todo_id, None)
+                    continue
+                key = todo_order_key(todo.id, todo.created_at)
+                if (before is None or key < before) and (after is None or key > after):
+                    todos[todo_id] = todo
+
+        ordered = sorted(
+            todos.values(),
+            key=lambda todo: todo_order_key(todo.id, todo.created_at),
+            reverse=True
+        )
+        return ordered[-limit:] if after is not None else ordered[:limit]
+
+    async def find_by_id(self, todo_id: str) -> Optional[Todo]:
+        """IDでTODOを取得（未反映の書き込みを含む）"""
+        if self._is_buffered(todo_id):
+            todo = self._lookup(todo_id)
+            return copy.copy(todo) if todo is not None else None
+
+        return await self.repository.find_by_id(todo_id)
+
+    async def save(self, todo: Todo) -> Todo:
+        """TODOをバッファに保存"""
+        await self._buffer(todo.id, copy.copy(todo))
+        return todo
+
+    async def save_many(self, todos: List[Todo]) -> List[str]:
+        """
+        複数のTODOをまとめて保存
+
+        既に一括で書き込む単位になっているため、バッファを経由せず直接書き込む
+        （新規作成のTODOを想定しており、バッファ上の同じIDの書き込みとは順序を保証しない）
+        """
+        return await self.repository.save_many(todos)
+
+    async def delete(self, todo_id: str) -> Optional[Todo]:
+        """
+        TODOの削除をバッファに追加
+
+        このプロセス内で同じTODOを同時に削除しても、削除したTODOを返すのは1つだけになる
+        （バッファを共有しない他のプロセスとの同時削除は区別できない）。
+        """
+        todo = await self.find_by_id(todo_id)
+        # 取得を待つ間に他の削除がバッファに追加されていれば削除済みとする
+        if todo is None or (self._is_buffered(todo_id) and self._lookup(todo_id) is None):
+            return None
+
+        await self._buffer(todo_id, None)
+        return todo
+
+    async def delete_expiring(self, todo_id: str, expires_at: datetime) -> bool:
+        """完了済みで保持期限が変わっていないTODOのみ削除（バッファを書き込んでから条件付きで削除する）"""
+        await self.flush()
+        return await self.repository.delete_expiring(todo_id, expires_at)
+
+    async def exists(self, todo_id: str) -> bool:
+        """TODOが存在するか確認（未反映の書き込みを含む）"""
+        if self._is_buffered(todo_id):
+            return self._lookup(todo_id) is not None
+
+        return await self.repository.exists(todo_id)
+
+    async def find_changes_since(self, since: datetime) -> TodoChanges:
+        """指定時刻以降の変更を取得（バッファを書き込んでから取得する）"""
+        await self.flush()
+        return await self.repository.find_changes_since(since)
+
+    async def find_expiring_before(self, deadline: datetime) -> List[Todo]:
+        """保持期間が切れるTODOを取得（バッファを書き込んでから取得する）"""
+        await self.flush()
+        return await self.repository.find_expiring_before(deadline)
+
+    async def count(self) -> TodoStats:
+        """全てのTODOの件数を数える（バッファを書き込んでから数える）"""
+        await self.flush()
+        return await self.repository.count()
+
+    async def flush(self) -> None:
+        """バッファの内容をDynamoDBに書き込む"""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+
+            self._flushing, self._pending = self._pending, {}
+            todos = [todo for todo in self._flushing.values() if todo is not None]
+            deleted_ids = [todo_id for todo_id, todo in self._flushing.items() if todo is None]
+
+            try:
+                failed_ids = await self.repository.batch_write(todos, deleted_ids)
+            except Exception as e:
+                failed_ids = list(self._flushing)
+                self._metrics["flush_errors"] += 1
+                print(f"書き込みバッファの反映に失敗しました: {str(e)}")
+
+            # 書き込めなかったものは、より新しい書き込みがなければバッファに戻す
+            for todo_id in failed_ids:
+                if todo_id not in self._pending:
+                    self._pending[todo_id] = self._flushing[todo_id]
+
+            self._metrics["flush_count"] += 1
+            self._metrics["flushed_items"] += len(self._flushing) - len(failed_ids)
+            self._flushing = {}
+
+    async def _flush_periodically(self) -> None:
+        """一定間隔でバッファを書き込む"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self) -> None:
+        """定期書き込みを開始"""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def close(self) -> None:
+        """定期書き込みを停止し、残りのバッファを書き込む"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        await self.flush()
+        if self._pending:
+            print(f"{len(self._pending)}件の書き込みを反映できませんでした")
+
+    def get_metrics(self) -> dict:
+        """書き込みバッファのメトリクスを取得"""
+        return {**self._metrics, "pending": len(self._pending) + len(self._flushing)}
@@ -0,0 +1,94 @@
+"""
+Infrastructure層: サーキットブレーカー
+"""
+import time
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    連続して失敗したバックエンドへの呼び出しを一定時間遮断する
+
+    closed: 通常通り呼び出す。連続失敗が閾値に達するとopenに移る
+    open: 呼び出さずに即座に失敗させる。一定時間後にhalf_openに移る
+    half_open: 試行の呼び出しを1件だけ通し、成功すればclosed、失敗すればopenに戻る
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._metrics = {
+            "opened": 0,
+            "rejected": 0,
+            "failures": 0,
+            "throttled": 0,
+            "successes": 0,
+        }
+
+    def retry_after(self) -> float:
+        """遮断が解除されるまでの秒数"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """呼び出しを許可するか判定"""
+        if self.state == OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                self._metrics["rejected"] += 1
+                return False
+            self.state = HALF_OPEN
+            self._trial_in_flight = False
+
+        if self.state == HALF_OPEN:
+            if self._trial_in_flight:
+                self._metrics["rejected"] += 1
+                return False
+            self._trial_in_flight = True
+
+        return True
+
+    def record_success(self) -> None:
+        """呼び出しの成功を記録"""
+        self._metrics["successes"] += 1
+        self._consecutive_failures = 0
+        self._trial_in_flight = False
+        self.state = CLOSED
+
+    def record_throttled(self) -> None:
+        """
+        スロットリングを記録
+
+        バックエンドは応答しており、容量が一時的に足りないだけのため失敗には数えない。
+        状態は変えず、half_openの試行枠だけを空けて次の呼び出しで再び試行できるようにする。
+        """
+        self._metrics["throttled"] += 1
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """バックエンドの異常による失敗を記録"""
+        self._metrics["failures"] += 1
+        self._consecutive_failures += 1
+        self._trial_in_flight = False
+
+        if self.state == HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self._metrics["opened"] += 1
+            self.state = OPEN
+            self._opened_at = time.monotonic()
+
+    def get_metrics(self) -> dict:
+        """サーキットブレーカーのメトリクスを取得"""
+        return {
+            **self._metrics,
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+        }
@@ -0,0 +1,208 @@
+"""
+Infrastructure層: 再試行とサーキットブレーカーを適用したバックエンド呼び出し
+"""
+import asyncio
+import inspect
+import time
+from typing import Any, Callable, Dict, Optional
+
+from botocore.exceptions import (
+    ClientError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError
+)
+
+from domain.repositories.exceptions import (
+    CircuitOpenError,
+    RepositoryThrottledError,
+    RepositoryTransientError,
+    RepositoryUnavailableError
+)
+from infrastructure.profiling.backend_call_account import (
+    consumed_capacity_units,
+    current_backend_call_account
+)
+from infrastructure.profiling.request_profile import current_request_profile
+from infrastructure.resilience.circuit_breaker import CircuitBreaker
+from infrastructure.resilience.retry import DecorrelatedJitterBackoff, RetryBudget
+
+
+# スロットリングを表すエラーコード
+THROTTLING_ERROR_CODES = {
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+}
+
+# バックエンド側の一時的な障害を表すエラーコード
+UNAVAILABLE_ERROR_CODES = {
+    "InternalServerError",
+    "ServiceUnavailable",
+}
+
+# 接続・タイムアウトの失敗
+CONNECTION_ERRORS = (
+    EndpointConnectionError,
+    ConnectTimeoutError,
+    ReadTimeoutError,
+    ConnectionClosedError,
+)
+
+
+def classify_error(error: Exception, operation: str) -> Optional[RepositoryTransientError]:
+    """
+    例外を分類する
+
+    Returns:
+        一時的な失敗であれば対応する例外、それ以外（再試行しても成功しない）はNone
+    """
+    if isinstance(error, RepositoryTransientError):
+        return error
+
+    if isinstance(error, ClientError):
+        code = error.response.get("Error", {}).get("Code", "")
+        if code in THROTTLING_ERROR_CODES:
+            return RepositoryThrottledError(f"{operation}がスロットリングされました: {code}", retry_after=1.0)
+        if code in UNAVAILABLE_ERROR_CODES:
+            return RepositoryUnavailableError(f"{operation}が失敗しました: {code}", retry_after=1.0)
+        return None
+
+    if isinstance(error, CONNECTION_ERRORS):
+        return RepositoryUnavailableError(f"{operation}が応答しません: {str(error)}", retry_after=1.0)
+
+    return None
+
+
+class ResilientCaller:
+    """
+    バックエンドの呼び出しに再試行とサーキットブレーカーを適用する
+
+    一時的な失敗（スロットリング、接続・タイムアウト、サーバー側の障害）のみ
+    Decorrelated Jitterの間隔で再試行し、操作ごとの再試行予算を超えた場合や
+    サーキットブレーカーが開いている場合は型付きの例外ですぐに失敗させる。
+    サーキットブレーカーの失敗に数えるのは接続・タイムアウトとサーバー側の障害のみで、
+    スロットリングは数えない。それ以外の失敗は元の例外のまま呼び出し元に返す。
+    """
+
+    def __init__(
+        self,
+        breaker: Optional[CircuitBreaker] = None,
+        max_attempts: int = 3,
+        backoff_base: float = 0.025,
+        backoff_cap: float = 1.0,
+        budget_ratio: float = 0.1,
+        budget_min_per_second: float = 10.0
+    ):
+        self.breaker = breaker or CircuitBreaker()
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.budget_ratio = budget_ratio
+        self.budget_min_per_second = budget_min_per_second
+        self._budgets: Dict[str, RetryBudget] = {}
+
+    def _budget(self, operation: str) -> RetryBudget:
+        """操作ごとの再試行予算を取得"""
+        budget = self._budgets.get(operation)
+        if budget is None:
+            budget = RetryBudget(self.budget_ratio, self.budget_min_per_second)
+            self._budgets[operation] = budget
+        return budget
+
+    async def call(self, operation: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        バックエンドを呼び出す
+
+        Args:
+            operation: 操作名（再試行予算とメトリクスの単位）
+            fn: 呼び出す関数（コルーチン関数も可）
+
+        Raises:
+            CircuitOpenError: サーキットブレーカーが開いている
+            RepositoryTransientError: 再試行しても一時的な失敗が続いた
+        """
+        budget = self._budget(operation)
+        budget.record_request()
+        backoff = DecorrelatedJitterBackoff(self.backoff_base, self.backoff_cap)
+
+        attempt = 0
+        while True:
+            if not self.breaker.allow_request():
+                raise CircuitOpenError(
+                    f"{operation}を遮断しています（バックエンド異常）",
+                    retry_after=self.breaker.retry_after()
+                )
+
+            try:
+                result = await self._invoke(operation, fn, args, kwargs)
+            except Exception as e:
+                transient = classify_error(e, operation)
+                if transient is None:
+                    # バックエンドは応答しているので正常とみなす
+                    self.breaker.record_success()
+                    raise
+
+                if isinstance(transient, RepositoryThrottledError):
+                    # スロットリングは背圧として扱い、再試行予算の範囲で待って再試行するだけにする
+                    # （遮断すると容量が戻ってもしばらく呼び出せなくなるため、失敗には数えない）
+                    self.breaker.record_throttled()
+                else:
+                    self.breaker.record_failure()
+                attempt += 1
+                if attempt >= self.max_attempts or not budget.try_spend():
+                    raise transient from e
+
+                await asyncio.sleep(backoff.next())
+                continue
+
+            self.breaker.record_success()
+            return result
+
+    @staticmethod
+    async def _invoke(operation: str, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        """
+        関数を1回呼び出す
+
+        プロファイル計測中のリクエストでは所要時間を、呼び出しを集計中のリクエストでは
+        回数と消費キャパシティを記録する（失敗した呼び出しも1回として数える）。
+        """
+        profile = current_request_profile()
+        account = current_backend_call_account()
+        if profile is None and account is None:
+            result = fn(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        start = time.perf_counter()
+        blocking = None
+        result = None
+        try:
+            result = fn(*args, **kwargs)
+            if inspect.isawaitable(result):
+                # ここまでがイベントループをブロックした時間
+                blocking = time.perf_counter() - start
+                result = await result
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            if profile is not None:
+                profile.record_backend_call(
+                    operation,
+                    elapsed,
+                    blocking_seconds=elapsed if blocking is None else blocking
+                )
+            if account is not None:
+                account.record_call(operation, elapsed, consumed_capacity_units(result))
+
+    def get_metrics(self) -> dict:
+        """再試行とサーキットブレーカーのメトリクスを取得"""
+        return {
+            "circuit_breaker": self.breaker.get_metrics(),
+            "retries": {
+                operation: budget.get_metrics()
+                for operation, budget in self._budgets.items()
+            },
+        }
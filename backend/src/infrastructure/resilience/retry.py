@@ -0,0 +1,74 @@
+"""
+Infrastructure層: 再試行の間隔と回数の制御
+"""
+import random
+import time
+
+
+class DecorrelatedJitterBackoff:
+    """
+    Decorrelated Jitter方式の待ち時間
+
+    前回の待ち時間の3倍までの範囲からランダムに選ぶことで、
+    同時に失敗したクライアントの再試行が揃わないようにする
+    """
+
+    def __init__(self, base: float = 0.025, cap: float = 1.0):
+        self.base = base
+        self.cap = cap
+        self._sleep = base
+
+    def next(self) -> float:
+        """次の待ち時間（秒）"""
+        self._sleep = min(self.cap, random.uniform(self.base, self._sleep * 3))
+        return self._sleep
+
+
+class RetryBudget:
+    """
+    操作ごとの再試行の予算
+
+    リクエストごとに ratio 分の予算が貯まり、再試行1回ごとに1消費する。
+    バックエンドの障害時に再試行がリクエスト量を何倍にも増幅させないよう、
+    再試行の量をリクエスト量の一定割合（と毎秒の最低保証分）に抑える。
+    """
+
+    def __init__(self, ratio: float = 0.1, min_per_second: float = 10.0, ttl: float = 10.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_balance = max(1.0, min_per_second * ttl)
+        self._balance = self.max_balance
+        self._updated_at = time.monotonic()
+        self._metrics = {
+            "requests": 0,
+            "retries": 0,
+            "exhausted": 0,
+        }
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._balance = min(
+            self.max_balance,
+            self._balance + (now - self._updated_at) * self.min_per_second
+        )
+        self._updated_at = now
+
+    def record_request(self) -> None:
+        """リクエストを記録して予算を積み立てる"""
+        self._metrics["requests"] += 1
+        self._refill()
+        self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        """再試行1回分の予算を消費する（予算がなければFalse）"""
+        self._refill()
+        if self._balance < 1:
+            self._metrics["exhausted"] += 1
+            return False
+        self._balance -= 1
+        self._metrics["retries"] += 1
+        return True
+
+    def get_metrics(self) -> dict:
+        """再試行のメトリクスを取得"""
+        return {**self._metrics, "balance": round(self._balance, 2)}
@@ -2,11 +2,36 @@
 FastAPIアプリケーションのエントリーポイント
 クリーンアーキテクチャ構成
 """
+import asyncio
+import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from presentation.api.todo_router import router as todo_router
-from dependencies import get_dynamodb_client
+from presentation.api.admin_router import router as admin_router
+from presentation.middleware.admission_control import (
+    AdmissionController,
+    AdmissionControlMiddleware,
+    AIMDLimit
+)
+from presentation.middleware.compression import CompressionMiddleware
+from dependencies import (
+    get_archive_expiring_todos_use_case,
+    get_dynamodb_client,
+    get_fault_injector,
+    get_profile_store,
+    get_profiling_token,
+    get_reconcile_todo_stats_use_case,
+    get_resilient_caller,
+    get_single_flight,
+    get_todo_archive_repository,
+    get_todo_event_publisher,
+    get_todo_repository,
+    get_todo_stats_repository,
+    get_write_behind_repository,
+    is_archive_enabled,
+    should_create_tables
+)
 
 
 # FastAPIアプリケーション
@@ -16,26 +41,144 @@ app = FastAPI(
     description="クリーンアーキテクチャで構築されたTODOアプリケーション"
 )
 
-# CORS設定
+# リクエスト単位のプロファイリング（ルーター以降の処理だけを計測するため最も内側に置く）
+profiling_sample_rate = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+if get_profiling_token() or profiling_sample_rate > 0:
+    from presentation.middleware.profiling import PROFILE_MODE_WALL, ProfilingMiddleware
+
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=get_profile_store(),
+        token=get_profiling_token(),
+        sample_rate=profiling_sample_rate,
+        sample_mode=os.getenv("PROFILING_SAMPLE_MODE", PROFILE_MODE_WALL)
+    )
+
+# バックエンド呼び出しの回数・消費キャパシティをServer-Timingヘッダーで返す
+if os.getenv("SERVER_TIMING_ENABLED", "false").lower() in ("1", "true", "yes", "on"):
+    from presentation.middleware.server_timing import ServerTimingMiddleware
+
+    app.add_middleware(ServerTimingMiddleware)
+
+# 流入制御（同時実行数の上限を超えたリクエストは待たせるか503を返す）
+admission_controller = AdmissionController(
+    AIMDLimit(
+        initial_limit=int(os.getenv("ADMISSION_INITIAL_LIMIT", "32")),
+        min_limit=int(os.getenv("ADMISSION_MIN_LIMIT", "4")),
+        max_limit=int(os.getenv("ADMISSION_MAX_LIMIT", "256")),
+        target_latency=float(os.getenv("ADMISSION_TARGET_LATENCY", "0.25"))
+    ),
+    max_queue=int(os.getenv("ADMISSION_MAX_QUEUE", "128")),
+    queue_timeout=float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "1.0"))
+)
+if os.getenv("ADMISSION_CONTROL_ENABLED", "true").lower() in ("1", "true", "yes", "on"):
+    client_rate = os.getenv("CLIENT_RATE_LIMIT")
+    client_burst = os.getenv("CLIENT_RATE_BURST")
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        controller=admission_controller,
+        client_rate=float(client_rate) if client_rate else None,
+        client_burst=float(client_burst) if client_burst else None
+    )
+
+# レスポンス圧縮（gzip / brotli）
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", "1024"))
+)
+
+# CORS設定（流入制御が返す429 / 503にもCORSヘッダーが付くよう最も外側に置く）
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # 本番環境では適切に設定してください
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # ブラウザから再試行までの待ち時間を参照できるようにする
+    expose_headers=["Retry-After"],
 )
 
 # ルーターの登録
+# 旧API互換モードでは、旧APIと同じパスを互換ルーターで先に受ける
+# （差分取得やイベント購読など、旧APIにないエンドポイントはそのまま利用できる）
+if os.getenv("LEGACY_API_ENABLED", "false").lower() in ("1", "true", "yes", "on"):
+    from presentation.api.legacy_todo_router import router as legacy_todo_router
+
+    app.include_router(legacy_todo_router)
 app.include_router(todo_router)
+app.include_router(admin_router)
+
+
+# バックグラウンドで実行中のタスク
+_background_tasks = []
+
+
+async def _archive_periodically(interval: float):
+    """保持期間が切れる完了済みTODOを定期的にアーカイブに移す"""
+    while True:
+        try:
+            use_case = get_archive_expiring_todos_use_case(
+                get_todo_repository(get_dynamodb_client(), get_resilient_caller()),
+                get_todo_archive_repository(),
+                get_todo_event_publisher(),
+                get_todo_stats_repository(get_dynamodb_client(), get_resilient_caller())
+            )
+            archived = await use_case.execute()
+            if archived:
+                print(f"{archived}件のTODOをアーカイブしました")
+        except Exception as e:
+            print(f"TODOのアーカイブに失敗しました: {str(e)}")
+        await asyncio.sleep(interval)
+
+
+async def _reconcile_stats_periodically(interval: float):
+    """TODO件数の集計を定期的に数え直して補正する"""
+    while True:
+        try:
+            use_case = get_reconcile_todo_stats_use_case(
+                get_todo_repository(get_dynamodb_client(), get_resilient_caller()),
+                get_todo_stats_repository(get_dynamodb_client(), get_resilient_caller())
+            )
+            stats = await use_case.execute()
+            print(f"TODO集計を補正しました: total={stats.total} completed={stats.completed}")
+        except Exception as e:
+            print(f"TODO集計の補正に失敗しました: {str(e)}")
+        await asyncio.sleep(interval)
 
 
 # 起動時処理
 @app.on_event("startup")
 async def startup_event():
     """アプリケーション起動時の処理"""
-    # DynamoDBテーブルの作成
-    dynamodb_client = get_dynamodb_client()
-    dynamodb_client.create_todos_table()
+    # DynamoDBテーブルの作成（インメモリのバックエンドでは不要）
+    # テーブルを事前に用意する環境では DYNAMODB_CREATE_TABLES=false で確認を省き、起動を速くする
+    if should_create_tables():
+        dynamodb_client = get_dynamodb_client()
+        dynamodb_client.create_todos_table()
+        dynamodb_client.create_idempotency_table()
+        dynamodb_client.create_stats_table()
+
+    # 書き込みバッファの定期書き込みを開始
+    write_behind_repository = get_write_behind_repository()
+    if write_behind_repository is not None:
+        write_behind_repository.start()
+
+    # 完了済みTODOのアーカイブを開始
+    # プロセスごとに動くと同じ問い合わせが重複し、同じTODOを取り合うため、
+    # 既定では無効にし、1つのプロセス（または定期実行のジョブ）だけで間隔を設定する
+    archive_interval = float(os.getenv("TODO_ARCHIVE_INTERVAL", "0"))
+    if is_archive_enabled() and archive_interval > 0:
+        _background_tasks.append(asyncio.create_task(_archive_periodically(archive_interval)))
+
+    # TODO件数の集計の補正を開始（起動時に1回数え直し、以降は一定間隔で補正する）
+    # 補正は全件をスキャンし、プロセスごとに動くと同じスキャンが重複して上書きし合うため、
+    # 既定では無効にし、1つのプロセス（または定期実行のジョブ）だけで有効にする
+    reconcile_interval = float(os.getenv("TODO_STATS_RECONCILE_INTERVAL", "0"))
+    if reconcile_interval > 0:
+        _background_tasks.append(
+            asyncio.create_task(_reconcile_stats_periodically(reconcile_interval))
+        )
+
     print("アプリケーションが起動しました")
 
 
@@ -43,6 +186,14 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """アプリケーション終了時の処理"""
+    for task in _background_tasks:
+        task.cancel()
+
+    # 未反映の書き込みを反映
+    write_behind_repository = get_write_behind_repository()
+    if write_behind_repository is not None:
+        await write_behind_repository.close()
+
     print("アプリケーションが終了しました")
 
 
@@ -62,3 +213,28 @@ async def root():
 async def health_check():
     """ヘルスチェックエンドポイント"""
     return {"status": "ok"}
+
+
+# メトリクス
+@app.get("/metrics", tags=["health"])
+async def metrics():
+    """メトリクス取得エンドポイント"""
+    result = {}
+
+    write_behind_repository = get_write_behind_repository()
+    if write_behind_repository is not None:
+        result["write_behind"] = write_behind_repository.get_metrics()
+
+    single_flight = get_single_flight()
+    if single_flight is not None:
+        result["single_flight"] = single_flight.get_metrics()
+
+    result["events"] = get_todo_event_publisher().get_metrics()
+    result["admission_control"] = admission_controller.get_metrics()
+    result["resilience"] = get_resilient_caller().get_metrics()
+
+    fault_injector = get_fault_injector()
+    if fault_injector is not None:
+        result["fault_injection"] = fault_injector.get_metrics()
+
+    return result
@@ -0,0 +1,63 @@
+"""
+Presentation層: 管理用APIルーター
+"""
+import asyncio
+import hmac
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import FileResponse
+
+from infrastructure.profiling.profile_store import ProfileStore
+from dependencies import get_profile_store, get_profiling_token
+
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+def _authorize(
+    x_profile_token: Optional[str] = Header(None),
+    profiling_token: Optional[str] = Depends(get_profiling_token)
+) -> None:
+    """プロファイリング用のトークンを確認"""
+    if not profiling_token:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="プロファイリングは無効です"
+        )
+    if x_profile_token is None or not hmac.compare_digest(x_profile_token, profiling_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="トークンが正しくありません"
+        )
+
+
+@router.get("/profiles", summary="プロファイル一覧取得", dependencies=[Depends(_authorize)])
+async def list_profiles(store: ProfileStore = Depends(get_profile_store)) -> List[dict]:
+    """
+    保存されているプロファイルの概要を新しい順に取得
+
+    Returns:
+        リクエストの情報、時間の内訳（CPU時間・DynamoDBの待ち時間など）、
+        CPUプロファイルの場合は累積時間の多い関数の一覧
+    """
+    return await asyncio.to_thread(store.list)
+
+
+@router.get("/profiles/{profile_id}", summary="CPUプロファイル取得", dependencies=[Depends(_authorize)])
+async def get_profile(profile_id: str, store: ProfileStore = Depends(get_profile_store)):
+    """
+    CPUプロファイルをpstats形式でダウンロード
+
+    snakeviz等のツールや python -m pstats で参照できる
+
+    Raises:
+        404: プロファイルが見つからない（wallモードのプロファイルを含む）
+    """
+    path = store.find_dump_path(profile_id)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"プロファイル {profile_id} が見つかりません"
+        )
+    return FileResponse(path, media_type="application/octet-stream", filename=f"{profile_id}.prof")
@@ -0,0 +1,178 @@
+"""
+Presentation層: 旧TODO API（backend/main.py）互換ルーター
+
+旧APIと同じパス・レスポンス形式・エラーメッセージを、共有のDynamoDBクライアントと
+ユースケース層の上で提供する。旧APIはリクエストごとにboto3のリソースを作成し、
+一覧取得ではページングせずにスキャンしていたが、このルーターではそれらを行わない。
+
+現行のAPIより先に登録されるため、旧APIにない指定（fields / limit / before / after、
+MessagePack形式の要求）を含む一覧取得は現行のAPIの処理に引き渡す。
+"""
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Request, Response
+from typing import List, Optional
+
+from presentation.api.negotiation import NEGOTIATED_HEADERS, wants_msgpack
+from presentation.api.todo_router import PAGE_MAX_LIMIT, _service_unavailable
+from presentation.api.todo_router import get_todos as get_todos_current
+from presentation.schemas.legacy_todo_schema import (
+    LegacyTodoCreateRequest,
+    LegacyTodoUpdateRequest,
+    LegacyTodoResponse
+)
+from application.exceptions import IdempotencyKeyConflictError, IdempotencyKeyInProgressError
+from application.use_cases.create_todo import CreateTodoUseCase
+from application.use_cases.get_todos import GetTodoPageUseCase, GetTodosUseCase
+from application.use_cases.update_todo import UpdateTodoUseCase
+from application.use_cases.delete_todo import DeleteTodoUseCase
+from domain.entities.todo import Todo
+from domain.repositories.exceptions import RepositoryTransientError
+from dependencies import (
+    get_create_todo_use_case,
+    get_get_todo_page_use_case,
+    get_get_todos_use_case,
+    get_update_todo_use_case,
+    get_delete_todo_use_case
+)
+
+
+router = APIRouter(prefix="/todos", tags=["todos (legacy)"])
+
+
+def _todo_to_legacy_response(todo: Todo) -> LegacyTodoResponse:
+    """Todoエンティティを旧API形式のレスポンスに変換（日時はisoformatの文字列）"""
+    return LegacyTodoResponse(
+        id=todo.id,
+        title=todo.title,
+        description=todo.description,
+        completed=todo.completed,
+        created_at=todo.created_at.isoformat(),
+        updated_at=todo.updated_at.isoformat()
+    )
+
+
+@router.get("", response_model=List[LegacyTodoResponse])
+async def get_todos(
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=PAGE_MAX_LIMIT),
+    before: Optional[str] = Query(None),
+    after: Optional[str] = Query(None),
+    get_todos_use_case: GetTodosUseCase = Depends(get_get_todos_use_case),
+    get_todo_page_use_case: GetTodoPageUseCase = Depends(get_get_todo_page_use_case)
+):
+    """
+    全てのTODOを取得
+
+    現行のAPIの指定を含む場合は現行のAPIと同じ処理・レスポンス形式で返す
+    """
+    if any(value is not None for value in (fields, limit, before, after)) or wants_msgpack(request):
+        return await get_todos_current(
+            request,
+            fields=fields,
+            limit=limit,
+            before=before,
+            after=after,
+            get_todos_use_case=get_todos_use_case,
+            get_todo_page_use_case=get_todo_page_use_case
+        )
+
+    response.headers.update(NEGOTIATED_HEADERS)
+    try:
+        todos = await get_todos_use_case.execute()
+        return [_todo_to_legacy_response(todo) for todo in todos]
+    except RepositoryTransientError as e:
+        raise _service_unavailable(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("", response_model=LegacyTodoResponse, status_code=201)
+async def create_todo(
+    todo: LegacyTodoCreateRequest,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
+    create_todo_use_case: CreateTodoUseCase = Depends(get_create_todo_use_case)
+):
+    """
+    新しいTODOを作成
+
+    - **title**: TODOのタイトル（必須）
+    - **description**: TODOの説明（任意）
+    """
+    try:
+        created = await create_todo_use_case.execute(
+            title=todo.title,
+            description=todo.description,
+            idempotency_key=idempotency_key
+        )
+        return _todo_to_legacy_response(created)
+    except IdempotencyKeyInProgressError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except IdempotencyKeyConflictError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RepositoryTransientError as e:
+        raise _service_unavailable(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"TODO作成エラー: {str(e)}")
+
+
+@router.put("/{todo_id}", response_model=LegacyTodoResponse)
+async def update_todo(
+    todo_id: str,
+    todo: LegacyTodoUpdateRequest,
+    update_todo_use_case: UpdateTodoUseCase = Depends(get_update_todo_use_case)
+):
+    """
+    TODOを更新（部分更新対応）
+
+    - **title**: TODOのタイトル（任意）
+    - **description**: TODOの説明（任意）
+    - **completed**: 完了状態（任意）
+    """
+    try:
+        updated = await update_todo_use_case.execute(
+            todo_id=todo_id,
+            title=todo.title,
+            description=todo.description,
+            completed=todo.completed
+        )
+
+        if updated is None:
+            raise HTTPException(status_code=404, detail="TODOが見つかりません")
+
+        return _todo_to_legacy_response(updated)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RepositoryTransientError as e:
+        raise _service_unavailable(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"TODO更新エラー: {str(e)}")
+
+
+@router.delete("/{todo_id}", status_code=204)
+async def delete_todo(
+    todo_id: str,
+    delete_todo_use_case: DeleteTodoUseCase = Depends(get_delete_todo_use_case)
+):
+    """
+    TODOを削除
+
+    - **todo_id**: 削除するTODOのID
+    """
+    try:
+        result = await delete_todo_use_case.execute(todo_id)
+
+        if not result:
+            raise HTTPException(status_code=404, detail="TODOが見つかりません")
+
+        return None
+    except HTTPException:
+        raise
+    except RepositoryTransientError as e:
+        raise _service_unavailable(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"TODO削除エラー: {str(e)}")
@@ -0,0 +1,106 @@
+"""
+Presentation層: レスポンス形式のネゴシエーション
+"""
+from typing import Any, List, Optional, Tuple
+
+import msgpack
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+JSON_MEDIA_TYPE = "application/json"
+
+# Acceptヘッダーによって内容が変わることをキャッシュに伝えるヘッダー
+NEGOTIATED_HEADERS = {"Vary": "Accept"}
+
+
+class MsgPackResponse(Response):
+    """MessagePack形式のレスポンス"""
+    media_type = "application/msgpack"
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, use_bin_type=True)
+
+
+def _parse_accept(header: str) -> List[Tuple[str, float]]:
+    """Acceptヘッダーを(メディアタイプ, q値)のリストに変換（ヘッダーに書かれた順）"""
+    media_ranges = []
+    for part in header.split(","):
+        media_type, *params = [value.strip() for value in part.split(";")]
+        if not media_type:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        media_ranges.append((media_type.lower(), quality))
+    return media_ranges
+
+
+def _match(media_ranges: List[Tuple[str, float]], media_type: str) -> Optional[Tuple[float, int]]:
+    """
+    メディアタイプに一致する最も具体的な範囲の(q値, ヘッダー内の位置)を取得
+
+    application/msgpack > application/* > */* の順に具体的とみなす。
+    """
+    main_type = media_type.split("/")[0]
+    best = None
+    best_specificity = -1
+    for position, (media_range, quality) in enumerate(media_ranges):
+        if media_range == media_type:
+            specificity = 2
+        elif media_range == f"{main_type}/*":
+            specificity = 1
+        elif media_range == "*/*":
+            specificity = 0
+        else:
+            continue
+        if specificity > best_specificity:
+            best, best_specificity = (quality, position), specificity
+    return best
+
+
+def wants_msgpack(request: Request) -> bool:
+    """
+    クライアントがMessagePack形式を要求しているか確認
+
+    MessagePackのq値がJSONより高い場合に選ぶ。同じq値の場合はAcceptヘッダーで
+    先に書かれた方を選び、区別できない場合（*/* のみなど）はJSONを返す。
+    q=0 のメディアタイプは受け付けないものとして扱う。
+    """
+    media_ranges = _parse_accept(request.headers.get("accept", ""))
+    if not media_ranges:
+        return False
+
+    candidates = [_match(media_ranges, media_type) for media_type in MSGPACK_MEDIA_TYPES]
+    msgpack_match = max(
+        (match for match in candidates if match is not None),
+        key=lambda match: (match[0], -match[1]),
+        default=None
+    )
+    if msgpack_match is None or msgpack_match[0] <= 0:
+        return False
+
+    json_match = _match(media_ranges, JSON_MEDIA_TYPE)
+    if json_match is None or json_match[0] <= 0:
+        return True
+    if msgpack_match[0] != json_match[0]:
+        return msgpack_match[0] > json_match[0]
+    return msgpack_match[1] < json_match[1]
+
+
+def negotiated_response(request: Request, content: Any) -> Response:
+    """
+    Acceptヘッダーに応じてMessagePackまたはJSONのレスポンスを作成
+
+    Args:
+        content: JSONに変換できる値（model_dump(mode="json") の結果など）
+    """
+    if wants_msgpack(request):
+        return MsgPackResponse(content, headers=NEGOTIATED_HEADERS)
+    return JSONResponse(content, headers=NEGOTIATED_HEADERS)
@@ -0,0 +1,143 @@
+"""
+Presentation層: インポートする本文の読み込み
+"""
+import codecs
+import csv
+import json
+from typing import AsyncIterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from application.use_cases.import_todos import ImportRow
+from presentation.schemas.todo_schema import TodoCreateRequest
+
+
+# インポートできるファイル形式
+IMPORT_FORMAT_NDJSON = "ndjson"
+IMPORT_FORMAT_CSV = "csv"
+
+
+class ImportLineTooLongError(ValueError):
+    """1行（CSVの1レコード）が上限を超えている"""
+    pass
+
+
+def detect_import_format(content_type: str) -> str:
+    """Content-Typeからファイル形式を判定（判定できない場合はNDJSON）"""
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type in ("text/csv", "application/csv"):
+        return IMPORT_FORMAT_CSV
+    return IMPORT_FORMAT_NDJSON
+
+
+def _validate(row: int, data) -> ImportRow:
+    """1行分のデータをTODO作成リクエストと同じ規則で検証"""
+    if not isinstance(data, dict):
+        return ImportRow(row=row, error="オブジェクトではありません")
+    try:
+        request = TodoCreateRequest.model_validate(data)
+    except ValidationError as e:
+        message = "; ".join(
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+            for error in e.errors()
+        )
+        return ImportRow(row=row, error=message)
+    return ImportRow(row=row, title=request.title, description=request.description)
+
+
+async def _read_lines(
+    chunks: AsyncIterator[bytes],
+    max_line_length: int
+) -> AsyncIterator[Tuple[int, str]]:
+    """
+    受信したチャンクを(行番号, 行)に分割する（行末の改行を含む）
+
+    読み込み中に保持するのは1行に満たない残りの部分だけで、本文全体は保持しない。
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    line_number = 0
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            line_number += 1
+            yield line_number, line + "\n"
+        if len(pending) > max_line_length:
+            raise ImportLineTooLongError(f"{line_number + 1}行目が長すぎます（上限 {max_line_length} 文字）")
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield line_number + 1, pending
+
+
+async def _read_ndjson(chunks: AsyncIterator[bytes], max_line_length: int) -> AsyncIterator[ImportRow]:
+    async for row, line in _read_lines(chunks, max_line_length):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield ImportRow(row=row, error=f"JSONとして解析できません: {e.msg}")
+            continue
+        yield _validate(row, data)
+
+
+async def _read_csv_records(
+    chunks: AsyncIterator[bytes],
+    max_line_length: int
+) -> AsyncIterator[Tuple[int, List[str]]]:
+    """
+    CSVを(最終行の行番号, 値のリスト)に分割する
+
+    引用符で囲まれた値は改行を含むことがあるため、引用符の数が偶数になるまで
+    行をつなげてから1レコードとして解析する。
+    """
+    record = ""
+    async for line_number, line in _read_lines(chunks, max_line_length):
+        record += line
+        if record.count('"') % 2:
+            if len(record) > max_line_length:
+                raise ImportLineTooLongError(f"{line_number}行目が長すぎます（上限 {max_line_length} 文字）")
+            continue
+        values = next(csv.reader([record]), [])
+        record = ""
+        yield line_number, values
+
+    if record:
+        yield line_number, next(csv.reader([record]), [])
+
+
+async def _read_csv(chunks: AsyncIterator[bytes], max_line_length: int) -> AsyncIterator[ImportRow]:
+    header: Optional[List[str]] = None
+    async for row, values in _read_csv_records(chunks, max_line_length):
+        # 空行は読み飛ばす（csv.DictReaderと同じ）
+        if not values:
+            continue
+        if header is None:
+            header = values
+            continue
+        data = {key: values[index] if index < len(values) else None for index, key in enumerate(header)}
+        # 空欄の説明は未指定として扱う
+        if data.get("description") == "":
+            data["description"] = None
+        yield _validate(row, data)
+
+
+def read_import_rows(
+    chunks: AsyncIterator[bytes],
+    import_format: str,
+    max_line_length: int = 1024 * 1024
+) -> AsyncIterator[ImportRow]:
+    """
+    受信中の本文を1行ずつ解析する
+
+    NDJSONは1行1オブジェクト、CSVは1行目をヘッダー（title, description）とする。
+    本文全体をメモリやファイルに溜めず、受信したチャンクから順に行を取り出す。
+
+    Raises:
+        ImportLineTooLongError: 1行が max_line_length 文字を超えている（読み進めた時点で発生）
+    """
+    if import_format == IMPORT_FORMAT_CSV:
+        return _read_csv(chunks, max_line_length)
+    return _read_ndjson(chunks, max_line_length)
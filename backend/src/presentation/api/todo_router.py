@@ -1,30 +1,81 @@
 """
 Presentation層: TODO APIルーター
 """
-from fastapi import APIRouter, HTTPException, Depends, status
-from typing import List
+import asyncio
+import json
+import math
+import os
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, FrozenSet, List, Optional, Union
 
 from presentation.schemas.todo_schema import (
     TodoCreateRequest,
     TodoUpdateRequest,
-    TodoResponse
+    TodoResponse,
+    TodoPartialResponse,
+    TodoChangesResponse,
+    TodoStatsResponse,
+    ImportJobResponse,
+    ImportRowErrorResponse,
+    TodoTombstoneResponse
+)
+from presentation.api.negotiation import negotiated_response
+from presentation.api.todo_import_reader import (
+    ImportLineTooLongError,
+    detect_import_format,
+    read_import_rows
+)
+from application.exceptions import (
+    IdempotencyKeyConflictError,
+    IdempotencyKeyInProgressError,
+    ImportJobAlreadyStartedError,
+    ImportJobNotFoundError,
+    TodoCursorNotFoundError
 )
 from application.use_cases.create_todo import CreateTodoUseCase
-from application.use_cases.get_todos import GetTodosUseCase, GetTodoByIdUseCase
+from application.use_cases.get_todos import GetTodosUseCase, GetTodoByIdUseCase, GetTodoPageUseCase
+from application.use_cases.get_todo_changes import GetTodoChangesUseCase
+from application.use_cases.get_todo_stats import GetTodoStatsUseCase
+from application.use_cases.import_todos import GetImportJobUseCase, ImportTodosUseCase
+from application.use_cases.archive_todos import GetArchivedTodosUseCase
 from application.use_cases.update_todo import UpdateTodoUseCase
 from application.use_cases.delete_todo import DeleteTodoUseCase
+from domain.entities.import_job import ImportJob
+from domain.entities.partial_todo import PartialTodo, TODO_FIELDS
 from domain.entities.todo import Todo
+from domain.events.todo_event import TodoEvent, TodoEventPublisher
+from domain.repositories.exceptions import RepositoryTransientError
 from dependencies import (
     get_create_todo_use_case,
     get_get_todos_use_case,
+    get_get_todo_page_use_case,
     get_get_todo_by_id_use_case,
+    get_get_todo_changes_use_case,
+    get_get_todo_stats_use_case,
+    get_import_todos_use_case,
+    get_get_import_job_use_case,
+    get_get_archived_todos_use_case,
     get_update_todo_use_case,
-    get_delete_todo_use_case
+    get_delete_todo_use_case,
+    get_todo_event_publisher
 )
 
 
 router = APIRouter(prefix="/todos", tags=["todos"])
 
+# 変更イベントがない場合にハートビートを送る間隔（秒）
+STREAM_HEARTBEAT_INTERVAL = float(os.getenv("TODO_EVENT_HEARTBEAT_INTERVAL", "15"))
+
+# 作成順の一覧取得で件数を指定しなかった場合の件数と、指定できる最大件数
+PAGE_DEFAULT_LIMIT = 50
+PAGE_MAX_LIMIT = 1000
+
+# インポートする本文の最大サイズ（バイト）と1行の最大長（文字）
+IMPORT_MAX_BYTES = int(os.getenv("TODO_IMPORT_MAX_BYTES", str(1024 ** 3)))
+IMPORT_MAX_LINE_LENGTH = int(os.getenv("TODO_IMPORT_MAX_LINE_LENGTH", str(1024 * 1024)))
+
 
 def _todo_to_response(todo: Todo) -> TodoResponse:
     """Todoエンティティをレスポンススキーマに変換"""
@@ -34,23 +85,114 @@ def _todo_to_response(todo: Todo) -> TodoResponse:
         description=todo.description,
         completed=todo.completed,
         created_at=todo.created_at,
-        updated_at=todo.updated_at
+        updated_at=todo.updated_at,
+        expires_at=todo.expires_at
     )
 
 
-@router.get("", response_model=List[TodoResponse], summary="TODO一覧取得")
+def _service_unavailable(error: RepositoryTransientError) -> HTTPException:
+    """一時的なバックエンドの失敗を503に変換"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={"Retry-After": str(max(1, math.ceil(error.retry_after or 1)))}
+    )
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[FrozenSet[str]]:
+    """fieldsパラメータを項目名の集合に変換（未指定の場合はNone）"""
+    if fields is None:
+        return None
+
+    names = frozenset(name.strip() for name in fields.split(",") if name.strip())
+    unknown = names - set(TODO_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"指定できない項目です: {', '.join(sorted(unknown))}"
+        )
+    return names | {"id"}
+
+
+def _partial_to_response(todo: PartialTodo) -> dict:
+    """PartialTodoを指定した項目だけのレスポンスに変換"""
+    return TodoPartialResponse(**todo.to_dict()).model_dump(mode="json", exclude_unset=True)
+
+
+@router.get(
+    "",
+    response_model=List[Union[TodoResponse, TodoPartialResponse]],
+    summary="TODO一覧取得"
+)
 async def get_todos(
-    get_todos_use_case: GetTodosUseCase = Depends(get_get_todos_use_case)
+    request: Request,
+    fields: Optional[str] = Query(
+        None,
+        description="取得する項目（カンマ区切り。例: id,title,completed）。idは常に含まれる"
+    ),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=PAGE_MAX_LIMIT,
+        description=f"最大件数。指定した場合は新しい順に返す（before / after のみ指定した場合は{PAGE_DEFAULT_LIMIT}件）"
+    ),
+    before: Optional[str] = Query(None, description="このIDのTODOより前に作成されたTODOを新しい順に返す"),
+    after: Optional[str] = Query(None, description="このIDのTODOより後に作成されたTODOを新しい順に返す"),
+    get_todos_use_case: GetTodosUseCase = Depends(get_get_todos_use_case),
+    get_todo_page_use_case: GetTodoPageUseCase = Depends(get_get_todo_page_use_case)
 ):
     """
     全てのTODOを取得
 
+    limit / before / after のいずれかを指定した場合は、作成順のインデックスから
+    新しい順にページ単位で取得する（次のページは最後のTODOのIDを before に指定する）。
+    Acceptヘッダーにapplication/msgpackを指定するとMessagePack形式で返す
+
+    Args:
+        fields: 取得する項目（任意）。指定した項目だけを読み込んで返す
+        limit: 最大件数（任意）
+        before: このIDのTODOより前に作成されたTODOを取得する（任意）
+        after: このIDのTODOより後に作成されたTODOを取得する（任意）
+
     Returns:
         TODOのリスト
+
+    Raises:
+        400: 指定できない項目が含まれている、before と after を同時に指定した、
+             before / after のTODOが見つからない
     """
+    field_names = _parse_fields(fields)
+    if before is not None and after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="before と after は同時に指定できません"
+        )
+    paged = limit is not None or before is not None or after is not None
+
     try:
-        todos = await get_todos_use_case.execute()
-        return [_todo_to_response(todo) for todo in todos]
+        if paged:
+            todos = await get_todo_page_use_case.execute(limit or PAGE_DEFAULT_LIMIT, before, after)
+            if field_names is not None:
+                todos = [PartialTodo.from_todo(todo, field_names) for todo in todos]
+        elif field_names is not None:
+            todos = await get_todos_use_case.execute(field_names)
+        else:
+            todos = await get_todos_use_case.execute()
+
+        if field_names is not None:
+            return negotiated_response(request, [_partial_to_response(todo) for todo in todos])
+
+        return negotiated_response(
+            request,
+            [_todo_to_response(todo).model_dump(mode="json") for todo in todos]
+        )
+    except TodoCursorNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except RepositoryTransientError as e:
+        raise _service_unavailable(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -58,6 +200,302 @@ async def get_todos(
         )
 
 
+@router.get("/changes", response_model=TodoChangesResponse, summary="TODO差分取得")
+async def get_todo_changes(
+    request: Request,
+    since: datetime = Query(..., description="前回のレスポンスのwatermark"),
+    get_todo_changes_use_case: GetTodoChangesUseCase = Depends(get_get_todo_changes_use_case)
+):
+    """
+    基準時刻より後に作成・更新・削除されたTODOを取得
+
+    Acceptヘッダーにapplication/msgpackを指定するとMessagePack形式で返す
+
+    Args:
+        since: 基準時刻（前回のレスポンスのwatermark）
+
+    Returns:
+        変更されたTODO、削除されたTODO、次回の基準時刻
+
+    Raises:
+        410: 基準時刻が古すぎるため全件の再取得が必要
+    """
+    try:
+        changes = await get_todo_changes_use_case.execute(since)
+
+        if changes is None:
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail="基準時刻が古すぎます。一覧を再取得してください"
+            )
+
+        response = TodoChangesResponse(
+            todos=[_todo_to_response(todo) for todo in changes.todos],
+            deleted=[
+                TodoTombstoneResponse(id=tombstone.id, deleted_at=tombstone.deleted_at)
+                for tombstone in changes.tombstones
+            ],
+            watermark=changes.watermark
+        )
+
+        return negotiated_response(request, response.model_dump(mode="json"))
+    except HTTPException:
+        raise
+    except RepositoryTransientError as e:
+        raise _service_unavailable(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"TODO差分取得エラー: {str(e)}"
+        )
+
+
+@router.get("/stats", response_model=TodoStatsResponse, summary="TODO集計取得")
+async def get_todo_stats(
+    get_todo_stats_use_case: GetTodoStatsUseCase = Depends(get_get_todo_stats_use_case)
+):
+    """
+    TODOの件数を取得
+
+    テーブルを数えずに集計用のカウンターから返すため、件数によらず高速に応答する。
+    カウンターは定期的に実際の件数で補正される
+
+    Returns:
+        全件数・完了件数・未完了件数
+    """
+    try:
+        stats = await get_todo_stats_use_case.execute()
+        return TodoStatsResponse(total=stats.total, completed=stats.completed, open=stats.open)
+    except RepositoryTransientError as e:
+        raise _service_unavailable(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"TODO集計取得エラー: {str(e)}"
+        )
+
+
+def _import_job_to_response(job: ImportJob) -> ImportJobResponse:
+    """ImportJobをレスポンススキーマに変換"""
+    return ImportJobResponse(
+        id=job.id,
+        status=job.status,
+        processed=job.processed,
+        imported=job.imported,
+        failed=job.failed,
+        throughput=round(job.throughput, 1),
+        errors=[ImportRowErrorResponse(row=error.row, message=error.message) for error in job.errors],
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        error=job.error
+    )
+
+
+async def _limited_stream(request: Request) -> AsyncIterator[bytes]:
+    """受信中の本文をチャンクごとに返す（上限を超えた時点で413）"""
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > IMPORT_MAX_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"ファイルが大きすぎます（上限 {IMPORT_MAX_BYTES} バイト）"
+            )
+        yield chunk
+
+
+@router.post(
+    "/import",
+    response_model=ImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="TODO一括インポートの受付"
+)
+async def create_import_job(
+    response: Response,
+    import_todos_use_case: ImportTodosUseCase = Depends(get_import_todos_use_case)
+):
+    """
+    TODO一括インポートのジョブを作成
+
+    本文は受け取らずにジョブIDをすぐに返す。インポートするファイルは
+    PUT /todos/import/{job_id} で送り、送信中も GET /todos/import/{job_id} で進捗を確認できる。
+
+    Returns:
+        作成したインポートジョブ（Locationヘッダーに本文の送信先）
+    """
+    try:
+        job = await import_todos_use_case.create()
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"TODOインポートエラー: {str(e)}"
+        )
+    response.headers["Location"] = f"{router.prefix}/import/{job.id}"
+    return _import_job_to_response(job)
+
+
+@router.put(
+    "/import/{job_id}",
+    response_model=ImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="TODO一括インポートの本文の送信"
+)
+async def upload_import_file(
+    job_id: str,
+    request: Request,
+    import_todos_use_case: ImportTodosUseCase = Depends(get_import_todos_use_case)
+):
+    """
+    NDJSONまたはCSVのTODOを作成済みのジョブでインポート
+
+    本文はContent-Typeがtext/csvの場合はCSV（1行目はtitle, descriptionのヘッダー）、
+    それ以外はNDJSON（1行1オブジェクト）として扱う。各行はTODO作成と同じ規則で検証する。
+    本文は溜めずに受信しながら解析・保存し、受信し終えた時点でジョブを返す
+    （残りの保存はバックグラウンドで続ける）。
+
+    Args:
+        job_id: POST /todos/import で作成したジョブのID
+
+    Returns:
+        開始したインポートジョブ（進捗は GET /todos/import/{job_id} で取得する）
+
+    Raises:
+        404: ジョブが見つからない
+        409: ジョブが既に本文を受け取っている
+        413: ファイルが大きすぎる、1行が長すぎる
+    """
+    rows = read_import_rows(
+        _limited_stream(request),
+        detect_import_format(request.headers.get("content-type", "")),
+        max_line_length=IMPORT_MAX_LINE_LENGTH
+    )
+    try:
+        job = await import_todos_use_case.start(job_id, rows)
+        return _import_job_to_response(job)
+    except HTTPException:
+        raise
+    except ImportJobNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ImportJobAlreadyStartedError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ImportLineTooLongError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"TODOインポートエラー: {str(e)}"
+        )
+
+
+@router.get("/import/{job_id}", response_model=ImportJobResponse, summary="TODO一括インポートの進捗取得")
+async def get_import_job(
+    job_id: str,
+    get_import_job_use_case: GetImportJobUseCase = Depends(get_get_import_job_use_case)
+):
+    """
+    インポートジョブの進捗を取得
+
+    Args:
+        job_id: ジョブID
+
+    Returns:
+        処理した行数、保存した件数、スループット、失敗した行
+
+    Raises:
+        404: ジョブが見つからない
+    """
+    job = await get_import_job_use_case.execute(job_id)
+
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"インポートジョブ {job_id} が見つかりません"
+        )
+
+    return _import_job_to_response(job)
+
+
+@router.get("/archive", response_model=List[TodoResponse], summary="アーカイブ済みTODO取得")
+async def get_archived_todos(
+    todo_id: Optional[str] = Query(None, description="絞り込むTODO ID"),
+    limit: int = Query(100, ge=1, le=1000, description="取得する最大件数"),
+    offset: int = Query(0, ge=0, description="読み飛ばす件数"),
+    get_archived_todos_use_case: GetArchivedTodosUseCase = Depends(get_get_archived_todos_use_case)
+):
+    """
+    保持期間を過ぎてアーカイブされたTODOを新しい順に取得
+
+    Args:
+        todo_id: 絞り込むTODO ID（任意）
+        limit: 取得する最大件数
+        offset: 読み飛ばす件数
+
+    Returns:
+        TODOのリスト
+    """
+    try:
+        todos = await get_archived_todos_use_case.execute(todo_id=todo_id, limit=limit, offset=offset)
+        return [_todo_to_response(todo) for todo in todos]
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"アーカイブ取得エラー: {str(e)}"
+        )
+
+
+def _event_to_sse(event: TodoEvent) -> str:
+    """変更イベントをServer-Sent Events形式に変換"""
+    if event.todo is not None:
+        data = _todo_to_response(event.todo).model_dump_json()
+    else:
+        data = json.dumps({"id": event.todo_id})
+    return f"event: {event.type}\ndata: {data}\n\n"
+
+
+async def _stream_events(event_publisher: TodoEventPublisher) -> AsyncIterator[str]:
+    """変更イベントを購読してServer-Sent Eventsとして送信"""
+    queue = event_publisher.subscribe()
+    try:
+        # 切断時の再接続間隔（ミリ秒）
+        yield "retry: 3000\n\n"
+
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=STREAM_HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                yield ": heartbeat\n\n"
+                continue
+
+            # 読み出しが追いつかず購読が打ち切られた
+            if event is None:
+                break
+
+            yield _event_to_sse(event)
+    finally:
+        event_publisher.unsubscribe(queue)
+
+
+@router.get("/stream", summary="TODO変更イベント購読")
+async def stream_todos(
+    event_publisher: TodoEventPublisher = Depends(get_todo_event_publisher)
+):
+    """
+    TODOの作成・更新・削除をServer-Sent Eventsで配信
+
+    Returns:
+        created / updated / deleted イベントのストリーム
+    """
+    return StreamingResponse(
+        _stream_events(event_publisher),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/{todo_id}", response_model=TodoResponse, summary="TODO取得")
 async def get_todo(
     todo_id: str,
@@ -87,6 +525,8 @@ async def get_todo(
         return _todo_to_response(todo)
     except HTTPException:
         raise
+    except RepositoryTransientError as e:
+        raise _service_unavailable(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -102,6 +542,12 @@ async def get_todo(
 )
 async def create_todo(
     request: TodoCreateRequest,
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias="Idempotency-Key",
+        max_length=255,
+        description="冪等キー（再送時に同じ値を指定すると重複して作成しない）"
+    ),
     create_todo_use_case: CreateTodoUseCase = Depends(get_create_todo_use_case)
 ):
     """
@@ -109,24 +555,40 @@ async def create_todo(
 
     Args:
         request: TODO作成リクエスト
+        idempotency_key: 冪等キー（任意）
 
     Returns:
-        作成されたTODO
+        作成されたTODO（同じ冪等キーの再送には最初に作成したTODO）
 
     Raises:
         400: バリデーションエラー
+        409: 同じ冪等キーのリクエストが処理中
+        422: 同じ冪等キーで異なる内容が送られた
     """
     try:
         todo = await create_todo_use_case.execute(
             title=request.title,
-            description=request.description
+            description=request.description,
+            idempotency_key=idempotency_key
         )
         return _todo_to_response(todo)
+    except IdempotencyKeyInProgressError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except IdempotencyKeyConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except RepositoryTransientError as e:
+        raise _service_unavailable(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -176,6 +638,8 @@ async def update_todo(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except RepositoryTransientError as e:
+        raise _service_unavailable(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -209,6 +673,8 @@ async def delete_todo(
         return None
     except HTTPException:
         raise
+    except RepositoryTransientError as e:
+        raise _service_unavailable(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
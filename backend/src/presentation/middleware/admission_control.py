@@ -0,0 +1,252 @@
+"""
+Presentation層: 流入制御（アドミッションコントロール）ミドルウェア
+"""
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+
+
+class AIMDLimit:
+    """
+    観測したレイテンシに応じて同時実行数の上限を調整する（AIMD方式）
+
+    目標レイテンシ以内で処理できている間は上限を少しずつ増やし、
+    目標を超えた、または過負荷のエラーが返った場合は上限を一定の割合で減らす。
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 32,
+        min_limit: int = 4,
+        max_limit: int = 256,
+        target_latency: float = 0.25,
+        backoff_ratio: float = 0.8
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.backoff_ratio = backoff_ratio
+        self._limit = float(initial_limit)
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        """現在の同時実行数の上限"""
+        return int(self._limit)
+
+    def on_sample(self, latency: float, overloaded: bool) -> None:
+        """処理1件分の結果を反映"""
+        if overloaded or latency > self.target_latency:
+            # 同じ過負荷で連続して減らしすぎないよう、目標レイテンシ1回分は間隔を空ける
+            now = time.monotonic()
+            if now - self._last_decrease >= self.target_latency:
+                self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+                self._last_decrease = now
+        else:
+            # 上限1周分の処理が目標内に収まるごとに1増やす
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+
+class TokenBucket:
+    """クライアントごとのリクエストレート制限"""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+
+    def try_acquire(self) -> Tuple[bool, float]:
+        """
+        トークンを1つ消費する
+
+        Returns:
+            (消費できたか, 次のトークンが貯まるまでの秒数)
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True, 0.0
+        return False, (1 - self.tokens) / self.rate
+
+
+class AdmissionController:
+    """同時実行数の上限と待ち行列を管理する"""
+
+    def __init__(self, limit: AIMDLimit, max_queue: int = 128, queue_timeout: float = 1.0):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._metrics = {
+            "admitted": 0,
+            "shed": 0,
+            "rate_limited": 0,
+        }
+
+    async def acquire(self) -> bool:
+        """実行枠を確保する（待ち行列が満杯または期限切れの場合はFalse）"""
+        if self.in_flight < self.limit.limit and not self._waiters:
+            self.in_flight += 1
+            self._metrics["admitted"] += 1
+            return True
+
+        if len(self._waiters) >= self.max_queue:
+            self._metrics["shed"] += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            if not (waiter.done() and not waiter.cancelled()):
+                self._metrics["shed"] += 1
+                return False
+        except asyncio.CancelledError:
+            # 枠を引き継いだ直後にキャンセルされた場合は枠を返す
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+        # release()で枠を引き継いでいる
+        self._metrics["admitted"] += 1
+        return True
+
+    def release(self) -> None:
+        """実行枠を解放し、待っているリクエストに引き継ぐ"""
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < self.limit.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def record_rate_limited(self) -> None:
+        """レート制限で拒否したリクエストを記録"""
+        self._metrics["rate_limited"] += 1
+
+    def get_metrics(self) -> dict:
+        """流入制御のメトリクスを取得"""
+        return {
+            **self._metrics,
+            "limit": self.limit.limit,
+            "in_flight": self.in_flight,
+            "queued": len(self._waiters),
+        }
+
+
+class AdmissionControlMiddleware:
+    """
+    リポジトリ処理を伴うリクエストの同時実行数を制限するASGIミドルウェア
+
+    上限を超えたリクエストは期限付きで待たせ、待ち行列が満杯または期限切れの
+    場合は503とRetry-Afterをすぐに返す。上限はレイテンシに応じて調整される。
+    クライアントごとのレート制限が有効な場合、超過分には429を返す。
+    接続を長く保つイベント購読とインポートのパス（配下のパスを含む）は対象外とする。
+    """
+
+    def __init__(
+        self,
+        app,
+        controller: AdmissionController,
+        path_prefix: str = "/todos",
+        excluded_paths: Tuple[str, ...] = ("/todos/stream", "/todos/import"),
+        client_rate: Optional[float] = None,
+        client_burst: Optional[float] = None,
+        max_clients: int = 10000
+    ):
+        self.app = app
+        self.controller = controller
+        self.path_prefix = path_prefix
+        self.excluded_paths = excluded_paths
+        self.client_rate = client_rate
+        self.client_burst = client_burst or client_rate
+        self.max_clients = max_clients
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+
+    def _is_excluded(self, path: str) -> bool:
+        """流入制御の対象外のパスか確認"""
+        return any(path == excluded or path.startswith(excluded + "/") for excluded in self.excluded_paths)
+
+    def _client_key(self, scope) -> str:
+        """レート制限の単位となるクライアントを識別"""
+        for name, value in scope["headers"]:
+            if name == b"x-client-id":
+                return value.decode("latin-1")
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    def _check_rate(self, scope) -> Tuple[bool, float]:
+        """クライアントごとのレート制限を確認"""
+        key = self._client_key(scope)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.client_rate, self.client_burst)
+            self._buckets[key] = bucket
+            # 古いクライアントから破棄してメモリ使用量を抑える
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket.try_acquire()
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or not path.startswith(self.path_prefix)
+            or self._is_excluded(path)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if self.client_rate:
+            allowed, retry_after = self._check_rate(scope)
+            if not allowed:
+                self.controller.record_rate_limited()
+                response = JSONResponse(
+                    status_code=429,
+                    content={"detail": "リクエストが多すぎます"},
+                    headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+                )
+                await response(scope, receive, send)
+                return
+
+        if not await self.controller.acquire():
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": "サーバーが混雑しています"},
+                headers={"Retry-After": str(max(1, math.ceil(self.controller.queue_timeout)))}
+            )
+            await response(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.monotonic()
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.controller.limit.on_sample(
+                time.monotonic() - start,
+                overloaded=status_code in (500, 503)
+            )
+            self.controller.release()
@@ -0,0 +1,161 @@
+"""
+Presentation層: レスポンス圧縮ミドルウェア
+"""
+import zlib
+from typing import List, Optional, Tuple
+
+import brotli
+
+
+def _parse_accept_encoding(header: str) -> List[Tuple[str, float]]:
+    """Accept-Encodingヘッダーを(エンコーディング, q値)のリストに変換"""
+    encodings = []
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            encodings.append((name.strip().lower(), quality))
+    return encodings
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """クライアントが受け付ける圧縮方式のうち最適なものを選択"""
+    accepted = {
+        name: quality
+        for name, quality in _parse_accept_encoding(accept_encoding)
+        if quality > 0
+    }
+    wildcard = "*" in accepted
+
+    # 同じq値であればbrotliを優先
+    candidates = ["br", "gzip"]
+    best = None
+    best_quality = 0.0
+    for name in candidates:
+        quality = accepted.get(name, accepted.get("*", 0.0) if wildcard else 0.0)
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+class _Compressor:
+    """ストリーミング対応の圧縮器"""
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=level)
+        else:
+            self._zlib = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        """データを圧縮し、ここまでの出力をすぐに送れるようにフラッシュする"""
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        """圧縮を終了"""
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encodingに応じてレスポンスをbrotliまたはgzipで圧縮するASGIミドルウェア
+
+    一度に送られるレスポンスは閾値以上の大きさの場合のみ圧縮する。
+    ストリーミングレスポンス（Server-Sent Eventsなど）は大きさが事前に
+    分からないため常に圧縮し、チャンクごとにフラッシュして遅延させない。
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {"gzip": gzip_level, "br": brotli_quality}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        encoding = select_encoding(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                # ボディの大きさが分かるまで送信を保留
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                response_headers = [
+                    (name, value) for name, value in start_message["headers"]
+                    if name.lower() != b"content-length"
+                ]
+                already_encoded = any(
+                    name.lower() == b"content-encoding" for name, _ in response_headers
+                )
+                if already_encoded or (not more_body and len(body) < self.minimum_size):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = _Compressor(encoding, self.levels[encoding])
+                response_headers += [
+                    (b"content-encoding", encoding.encode("latin-1")),
+                    (b"vary", b"Accept-Encoding"),
+                ]
+
+                if not more_body:
+                    compressed = compressor.compress(body) + compressor.finish()
+                    response_headers.append((b"content-length", str(len(compressed)).encode("latin-1")))
+                    await send({**start_message, "headers": response_headers})
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+
+                await send({**start_message, "headers": response_headers})
+
+            if more_body:
+                await send({
+                    "type": "http.response.body",
+                    "body": compressor.compress(body),
+                    "more_body": True
+                })
+            else:
+                await send({
+                    "type": "http.response.body",
+                    "body": compressor.compress(body) + compressor.finish()
+                })
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,185 @@
+"""
+Presentation層: リクエスト単位のプロファイリングミドルウェア
+"""
+import asyncio
+import cProfile
+import hmac
+import pstats
+import random
+import time
+import uuid
+from datetime import datetime
+from typing import Optional, Tuple
+
+from infrastructure.profiling.profile_store import ProfileStore
+from infrastructure.profiling.request_profile import (
+    RequestProfile,
+    reset_request_profile,
+    set_request_profile
+)
+
+
+# プロファイルの種類
+PROFILE_MODE_CPU = "cpu"
+PROFILE_MODE_WALL = "wall"
+
+# 概要に含める関数の件数（累積時間の多い順）
+TOP_FUNCTIONS = 30
+
+
+class _SteppedCoroutine:
+    """
+    コルーチンを1ステップずつ実行し、イベントループを占有した時間を計測する
+
+    awaitで中断している間（他のリクエストの処理中）は計測しないため、
+    同時に処理されている他のリクエストの時間や関数呼び出しが混ざらない。
+    CPUプロファイラを渡した場合は、各ステップの実行中だけ有効にする。
+    リクエストから起動された別タスク（読み込みリクエスト集約など）の処理は含まない。
+    """
+
+    def __init__(self, coro, profile: RequestProfile, profiler: Optional[cProfile.Profile] = None):
+        self.coro = coro
+        self.profile = profile
+        self.profiler = profiler
+
+    def __await__(self):
+        send_value, error = None, None
+        while True:
+            if self.profiler is not None:
+                self.profiler.enable()
+            self.profile.stepping = True
+            start = time.perf_counter()
+            try:
+                if error is not None:
+                    yielded = self.coro.throw(error)
+                else:
+                    yielded = self.coro.send(send_value)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self.profile.on_loop_seconds += time.perf_counter() - start
+                self.profile.stepping = False
+                if self.profiler is not None:
+                    self.profiler.disable()
+
+            try:
+                send_value, error = (yield yielded), None
+            except GeneratorExit:
+                self.coro.close()
+                raise
+            except BaseException as e:
+                send_value, error = None, e
+
+
+def _top_functions(profiler: cProfile.Profile) -> list:
+    """累積時間の多い関数の一覧"""
+    stats = pstats.Stats(profiler).stats
+    rows = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:TOP_FUNCTIONS]
+    return [
+        {
+            "function": f"{filename}:{line}({name})",
+            "calls": calls,
+            "tottime_ms": round(tottime * 1000, 3),
+            "cumtime_ms": round(cumtime * 1000, 3),
+        }
+        for (filename, line, name), (_, calls, tottime, cumtime, _) in rows
+    ]
+
+
+class ProfilingMiddleware:
+    """
+    指定したリクエストだけをプロファイリングするASGIミドルウェア
+
+    認証用のトークンをX-Profile-Tokenヘッダーに付けたリクエスト、または
+    サンプリング率に従って選ばれたリクエストを計測し、ProfileStoreに保存する。
+    X-Profile-Modeヘッダーで種類を選べる:
+      - cpu: cProfileで関数ごとのCPU時間を記録する（pstats形式でダウンロード可能）
+      - wall: DynamoDBの待ち時間とCPU時間などの内訳のみを記録する（低負荷）
+    計測しないリクエストはヘッダーの確認のみで、そのまま処理する。
+    """
+
+    def __init__(
+        self,
+        app,
+        store: ProfileStore,
+        token: Optional[str] = None,
+        sample_rate: float = 0.0,
+        sample_mode: str = PROFILE_MODE_WALL,
+        excluded_prefixes: Tuple[str, ...] = ("/admin", "/todos/stream")
+    ):
+        self.app = app
+        self.store = store
+        self.token = token
+        self.sample_rate = sample_rate
+        self.sample_mode = sample_mode
+        self.excluded_prefixes = excluded_prefixes
+
+    def _select(self, scope) -> Optional[Tuple[str, str]]:
+        """計測するか判定し、(種類, きっかけ)を返す（計測しない場合はNone）"""
+        if self.token:
+            token = mode = None
+            for name, value in scope["headers"]:
+                if name == b"x-profile-token":
+                    token = value.decode("latin-1")
+                elif name == b"x-profile-mode":
+                    mode = value.decode("latin-1").lower()
+            if token is not None and hmac.compare_digest(token, self.token):
+                return (PROFILE_MODE_WALL if mode == PROFILE_MODE_WALL else PROFILE_MODE_CPU), "header"
+
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return self.sample_mode, "sample"
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("path", "").startswith(self.excluded_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        selected = self._select(scope)
+        if selected is None:
+            await self.app(scope, receive, send)
+            return
+
+        mode, trigger = selected
+        profile_id = f"{time.time_ns()}-{uuid.uuid4().hex[:8]}"
+        profile = RequestProfile()
+        profiler = cProfile.Profile() if mode == PROFILE_MODE_CPU else None
+        status_code = 500
+
+        async def send_with_profile_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", []), (b"x-profile-id", profile_id.encode())]
+                }
+            await send(message)
+
+        started_at = datetime.now()
+        start = time.perf_counter()
+        context_token = set_request_profile(profile)
+        try:
+            await _SteppedCoroutine(self.app(scope, receive, send_with_profile_id), profile, profiler)
+        finally:
+            wall_seconds = time.perf_counter() - start
+            reset_request_profile(context_token)
+
+            summary = {
+                "id": profile_id,
+                "mode": mode,
+                "trigger": trigger,
+                "method": scope.get("method"),
+                "path": scope.get("path"),
+                "query": scope.get("query_string", b"").decode("latin-1"),
+                "status": status_code,
+                "started_at": started_at.isoformat(),
+                **profile.summary(wall_seconds),
+            }
+            if profiler is not None:
+                summary["top_functions"] = _top_functions(profiler)
+
+            try:
+                await asyncio.to_thread(self.store.save, profile_id, summary, profiler)
+            except Exception as e:
+                print(f"プロファイルの保存に失敗しました: {str(e)}")
@@ -0,0 +1,46 @@
+"""
+Presentation層: バックエンド呼び出しの集計を返すミドルウェア
+"""
+from infrastructure.profiling.backend_call_account import (
+    BackendCallAccount,
+    current_backend_call_account,
+    reset_backend_call_account,
+    set_backend_call_account
+)
+
+
+class ServerTimingMiddleware:
+    """
+    リクエストごとにバックエンド呼び出しを集計し、Server-Timingヘッダーで返すASGIミドルウェア
+
+    レスポンスを返し始めるまでに行った呼び出しの回数・所要時間・消費キャパシティを、
+    合計（backend）と操作ごと（backend-get_item など）に分けて返す。
+    ブラウザの開発者ツールで確認できるほか、負荷試験で呼び出し回数の退行を検知できる。
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        account = BackendCallAccount(parent=current_backend_call_account())
+
+        async def send_with_server_timing(message):
+            if message["type"] == "http.response.start":
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", []),
+                        (b"server-timing", account.server_timing().encode("latin-1")),
+                    ]
+                }
+            await send(message)
+
+        token = set_backend_call_account(account)
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            reset_backend_call_account(token)
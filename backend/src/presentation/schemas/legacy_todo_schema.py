@@ -0,0 +1,30 @@
+"""
+Presentation層: 旧API（backend/main.py）互換のTODOスキーマ定義
+
+旧APIのレスポンスと同じ形にするため、日時は文字列のまま返す
+"""
+from pydantic import BaseModel
+from typing import Optional
+
+
+class LegacyTodoCreateRequest(BaseModel):
+    """TODO作成リクエスト（旧API互換）"""
+    title: str
+    description: Optional[str] = None
+
+
+class LegacyTodoUpdateRequest(BaseModel):
+    """TODO更新リクエスト（旧API互換）"""
+    title: Optional[str] = None
+    description: Optional[str] = None
+    completed: Optional[bool] = None
+
+
+class LegacyTodoResponse(BaseModel):
+    """TODOレスポンス（旧API互換）"""
+    id: str
+    title: str
+    description: Optional[str] = None
+    completed: bool
+    created_at: str
+    updated_at: str
@@ -2,7 +2,7 @@
 Presentation層: TODOスキーマ定義
 """
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -44,6 +44,7 @@ class TodoResponse(BaseModel):
     completed: bool = Field(..., description="完了状態")
     created_at: datetime = Field(..., description="作成日時")
     updated_at: datetime = Field(..., description="更新日時")
+    expires_at: Optional[datetime] = Field(None, description="アーカイブ予定日時（完了済みのみ）")
 
     class Config:
         json_schema_extra = {
@@ -53,6 +54,119 @@ class TodoResponse(BaseModel):
                 "description": "牛乳とパンを買う",
                 "completed": False,
                 "created_at": "2024-01-01T12:00:00",
-                "updated_at": "2024-01-01T12:00:00"
+                "updated_at": "2024-01-01T12:00:00",
+                "expires_at": None
+            }
+        }
+
+
+class TodoTombstoneResponse(BaseModel):
+    """削除されたTODOのレスポンス"""
+    id: str = Field(..., description="TODO ID")
+    deleted_at: datetime = Field(..., description="削除日時")
+
+
+class TodoChangesResponse(BaseModel):
+    """TODO差分レスポンス"""
+    todos: List[TodoResponse] = Field(..., description="作成・更新されたTODO")
+    deleted: List[TodoTombstoneResponse] = Field(..., description="削除されたTODO")
+    watermark: datetime = Field(..., description="次回の差分取得に指定する基準時刻")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "todos": [
+                    {
+                        "id": "123e4567-e89b-12d3-a456-426614174000",
+                        "title": "買い物に行く",
+                        "description": "牛乳とパンを買う",
+                        "completed": True,
+                        "created_at": "2024-01-01T12:00:00",
+                        "updated_at": "2024-01-01T13:00:00"
+                    }
+                ],
+                "deleted": [
+                    {
+                        "id": "9b2f0c8e-3a61-4d0e-8d8e-2f1d3c4b5a69",
+                        "deleted_at": "2024-01-01T13:30:00"
+                    }
+                ],
+                "watermark": "2024-01-01T13:30:00"
+            }
+        }
+
+
+class TodoStatsResponse(BaseModel):
+    """TODO集計レスポンス"""
+    total: int = Field(..., description="TODOの件数")
+    completed: int = Field(..., description="完了したTODOの件数")
+    open: int = Field(..., description="未完了のTODOの件数")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "total": 12,
+                "completed": 5,
+                "open": 7
+            }
+        }
+
+
+class TodoPartialResponse(BaseModel):
+    """TODOレスポンス（fieldsで指定した項目のみ）"""
+    id: str = Field(..., description="TODO ID")
+    title: Optional[str] = Field(None, description="TODOのタイトル")
+    description: Optional[str] = Field(None, description="TODOの説明")
+    completed: Optional[bool] = Field(None, description="完了状態")
+    created_at: Optional[datetime] = Field(None, description="作成日時")
+    updated_at: Optional[datetime] = Field(None, description="更新日時")
+    expires_at: Optional[datetime] = Field(None, description="アーカイブ予定日時（完了済みのみ）")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": "123e4567-e89b-12d3-a456-426614174000",
+                "title": "買い物に行く",
+                "completed": False
+            }
+        }
+
+
+class ImportRowErrorResponse(BaseModel):
+    """インポートできなかった行"""
+    row: int = Field(..., description="行番号（1始まり）")
+    message: str = Field(..., description="エラー内容")
+
+
+class ImportJobResponse(BaseModel):
+    """TODO一括インポートの進捗レスポンス"""
+    id: str = Field(..., description="ジョブID")
+    status: str = Field(..., description="状態（pending / running / completed / failed）")
+    processed: int = Field(..., description="読み込んだ行数")
+    imported: int = Field(..., description="保存したTODOの件数")
+    failed: int = Field(..., description="失敗した行数")
+    throughput: float = Field(..., description="1秒あたりの処理行数")
+    errors: List[ImportRowErrorResponse] = Field(..., description="失敗した行（先頭から一定件数まで）")
+    created_at: datetime = Field(..., description="受付日時")
+    started_at: Optional[datetime] = Field(None, description="開始日時")
+    finished_at: Optional[datetime] = Field(None, description="終了日時")
+    error: Optional[str] = Field(None, description="ジョブ全体が失敗した場合の理由")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": "0b6f3a52-3f0e-4c8e-9d43-6f1a2b3c4d5e",
+                "status": "running",
+                "processed": 120000,
+                "imported": 119998,
+                "failed": 2,
+                "throughput": 8421.5,
+                "errors": [
+                    {"row": 17, "message": "title: Field required"}
+                ],
+                "created_at": "2024-01-01T12:00:00",
+                "started_at": "2024-01-01T12:00:01",
+                "finished_at": None,
+                "error": None
             }
         }
@@ -0,0 +1,48 @@
+"""
+サーバーレス環境（AWS Lambdaなど）向けのエントリーポイント
+
+API Gateway / Lambda Function URL のイベントをASGIアプリケーションに変換する。
+ハンドラー: serverless.handler
+
+短時間で停止・再作成される環境ではコールドスタートの時間がレイテンシを左右するため、
+以下を既定で無効にする（環境変数で明示した場合はその設定に従う）:
+  - 起動時のDynamoDBテーブルの確認・作成（テーブルは事前に用意しておく）
+  - TODO件数の集計の定期補正（呼び出しの合間は処理が止まるため動作しない）
+  - 書き込みバッファ（呼び出しの合間に止まると未反映の書き込みを失うおそれがある）
+  - 完了済みTODOのアーカイブ（定期実行できないため、完了したTODOに保持期限も設けない）
+"""
+import os
+
+os.environ.setdefault("DYNAMODB_CREATE_TABLES", "false")
+os.environ.setdefault("TODO_STATS_RECONCILE_INTERVAL", "0")
+os.environ.setdefault("TODO_WRITE_BEHIND_ENABLED", "false")
+os.environ.setdefault("TODO_ARCHIVE_ENABLED", "false")
+
+from main import app  # noqa: E402
+from dependencies import get_dynamodb_client, should_create_tables  # noqa: E402
+
+try:
+    from mangum import Mangum
+except ImportError:  # mangumが未インストールの場合はハンドラーを提供しない
+    Mangum = None
+
+
+# テーブルの確認・作成を有効にした場合は、初期化時に1回だけ行う
+# （アプリケーションの起動・終了処理は呼び出しごとに実行されるため使わない）
+if should_create_tables():
+    _dynamodb_client = get_dynamodb_client()
+    _dynamodb_client.create_todos_table()
+    _dynamodb_client.create_idempotency_table()
+    _dynamodb_client.create_stats_table()
+
+
+if Mangum is not None:
+    handler = Mangum(
+        app,
+        lifespan="off",
+        api_gateway_base_path=os.getenv("SERVERLESS_BASE_PATH", "/")
+    )
+else:
+    def handler(event, context):
+        """mangumが未インストールの場合のハンドラー"""
+        raise RuntimeError("サーバーレスモードには mangum が必要です（pip install mangum）")
@@ -0,0 +1,66 @@
+"""
+テスト共通の設定
+
+アプリケーションと同じく src をインポートの起点にする。
+"""
+import importlib
+import os
+import sys
+from types import ModuleType
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture
+def dynamodb_client(monkeypatch):
+    """motoで模擬したDynamoDBにTODOテーブルを作成したクライアント"""
+    from moto import mock_aws
+
+    from infrastructure.database.dynamodb_client import DynamoDBClient
+
+    # エンドポイントを空にしてAWSの標準のエンドポイント（motoが置き換える）を使う
+    monkeypatch.setenv("DYNAMODB_ENDPOINT", "")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "ap-northeast-1")
+
+    with mock_aws():
+        client = DynamoDBClient()
+        client._resource = None
+        client.create_todos_table()
+        client.create_idempotency_table()
+        client.create_stats_table()
+        yield client
+        client._resource = None
+
+
+@pytest.fixture
+def load_app(monkeypatch):
+    """
+    環境変数を設定してアプリケーション（src/main.py）を読み込み直す
+
+    main.py は読み込み時の環境変数でミドルウェアを構成するため、テストごとに読み込み直す。
+    dependencies.py のシングルトンも作り直されるよう空にし、テスト後は元の環境変数で
+    読み込み直す。
+    """
+    import dependencies
+
+    def load(**env):
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        for name, value in list(vars(dependencies).items()):
+            if name.startswith("_") and not name.startswith("__") and not callable(value) \
+                    and not isinstance(value, ModuleType):
+                monkeypatch.setattr(dependencies, name, None)
+
+        import main
+        return importlib.reload(main)
+
+    yield load
+
+    # 元の環境変数で読み込み直し、後のテストに設定を残さない
+    monkeypatch.undo()
+    if "main" in sys.modules:
+        importlib.reload(sys.modules["main"])
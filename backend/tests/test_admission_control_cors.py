@@ -0,0 +1,57 @@
+"""
+流入制御で拒否したレスポンスのCORSヘッダーのテスト
+
+ブラウザが429 / 503とRetry-Afterを読めるよう、CORSは流入制御より外側で処理する。
+"""
+import asyncio
+
+import httpx
+
+ORIGIN = "http://localhost:3000"
+
+
+def _get(app, path: str) -> httpx.Response:
+    async def request():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path, headers={"Origin": ORIGIN})
+    return asyncio.run(request())
+
+
+def _assert_cors(response: httpx.Response):
+    assert response.headers.get("access-control-allow-origin") in ("*", ORIGIN)
+    assert "retry-after" in response.headers.get("access-control-expose-headers", "").lower()
+
+
+def test_shed_response_has_cors_headers(load_app):
+    main = load_app(
+        TODO_BACKEND="memory",
+        ADMISSION_CONTROL_ENABLED="true",
+        ADMISSION_INITIAL_LIMIT="1",
+        ADMISSION_MIN_LIMIT="1",
+        ADMISSION_MAX_QUEUE="0"
+    )
+    # 実行枠を使い切った状態にする
+    main.admission_controller.in_flight = 1
+
+    response = _get(main.app, "/todos")
+
+    assert response.status_code == 503
+    assert "retry-after" in response.headers
+    _assert_cors(response)
+
+
+def test_rate_limited_response_has_cors_headers(load_app):
+    main = load_app(
+        TODO_BACKEND="memory",
+        ADMISSION_CONTROL_ENABLED="true",
+        CLIENT_RATE_LIMIT="0.001",
+        CLIENT_RATE_BURST="1"
+    )
+
+    assert _get(main.app, "/todos").status_code == 200
+    response = _get(main.app, "/todos")
+
+    assert response.status_code == 429
+    assert "retry-after" in response.headers
+    _assert_cors(response)
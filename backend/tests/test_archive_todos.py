@@ -0,0 +1,118 @@
+"""
+ArchiveExpiringTodosUseCaseのテスト
+
+一覧を取得してから削除するまでの間に状態が変わったTODOをアーカイブしないことを確認する。
+"""
+import asyncio
+import copy
+from datetime import timedelta
+
+import pytest
+
+from application.use_cases.archive_todos import ArchiveExpiringTodosUseCase
+from application.use_cases.create_todo import CreateTodoUseCase
+from domain.entities.todo_stats import TodoStats
+from infrastructure.archive.file_todo_archive_repository import FileTodoArchiveRepository
+from infrastructure.repositories.dynamodb_todo_repository import DynamoDBTodoRepository
+from infrastructure.repositories.in_memory_todo_repository import InMemoryTodoRepository
+from infrastructure.repositories.in_memory_todo_stats_repository import InMemoryTodoStatsRepository
+
+
+@pytest.fixture(params=["memory", "dynamodb"])
+def todo_repository(request):
+    if request.param == "memory":
+        return InMemoryTodoRepository()
+    return DynamoDBTodoRepository(request.getfixturevalue("dynamodb_client"))
+
+
+async def _create_expired_todo(todo_repository):
+    """保持期限を過ぎた完了済みのTODOを作成"""
+    todo = await CreateTodoUseCase(todo_repository).execute("期限切れ")
+    todo.mark_as_completed(timedelta(seconds=-1))
+    await todo_repository.save(todo)
+    return todo
+
+
+def _stale_scan(monkeypatch, todo_repository, todos):
+    """保持期限の取得結果を、取得した時点の内容に固定する"""
+    async def find_expiring_before(deadline):
+        return [copy.copy(todo) for todo in todos]
+
+    monkeypatch.setattr(todo_repository, "find_expiring_before", find_expiring_before)
+
+
+def test_archives_expired_todo(tmp_path, todo_repository):
+    async def scenario():
+        todo = await _create_expired_todo(todo_repository)
+        stats_repository = InMemoryTodoStatsRepository()
+        await stats_repository.overwrite(TodoStats(total=1, completed=1))
+        archive_repository = FileTodoArchiveRepository(str(tmp_path))
+        use_case = ArchiveExpiringTodosUseCase(
+            todo_repository, archive_repository, stats_repository=stats_repository
+        )
+
+        assert await use_case.execute() == 1
+        assert await todo_repository.find_by_id(todo.id) is None
+        assert [archived.id for archived in await archive_repository.find()] == [todo.id]
+        assert await stats_repository.get() == TodoStats(total=0, completed=0)
+
+    asyncio.run(scenario())
+
+
+def test_skips_todo_reopened_after_scan(tmp_path, todo_repository, monkeypatch):
+    async def scenario():
+        todo = await _create_expired_todo(todo_repository)
+        _stale_scan(monkeypatch, todo_repository, await todo_repository.find_expiring_before(todo.expires_at))
+
+        reopened = await todo_repository.find_by_id(todo.id)
+        reopened.mark_as_incomplete()
+        await todo_repository.save(reopened)
+
+        archive_repository = FileTodoArchiveRepository(str(tmp_path))
+        use_case = ArchiveExpiringTodosUseCase(todo_repository, archive_repository)
+
+        assert await use_case.execute() == 0
+        assert (await todo_repository.find_by_id(todo.id)).completed is False
+        assert await archive_repository.find() == []
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_workers_archive_once(tmp_path, todo_repository, monkeypatch):
+    async def scenario():
+        todo = await _create_expired_todo(todo_repository)
+        _stale_scan(monkeypatch, todo_repository, await todo_repository.find_expiring_before(todo.expires_at))
+
+        stats_repository = InMemoryTodoStatsRepository()
+        await stats_repository.overwrite(TodoStats(total=1, completed=1))
+        archive_repository = FileTodoArchiveRepository(str(tmp_path))
+
+        # 同じ一覧を取得した2つの処理が続けて実行された場合
+        archived = [
+            await ArchiveExpiringTodosUseCase(
+                todo_repository, archive_repository, stats_repository=stats_repository
+            ).execute()
+            for _ in range(2)
+        ]
+
+        assert archived == [1, 0]
+        assert len(await archive_repository.find()) == 1
+        assert await stats_repository.get() == TodoStats(total=0, completed=0)
+
+    asyncio.run(scenario())
+
+
+def test_finds_only_expiring_todos(todo_repository):
+    async def scenario():
+        expired = await _create_expired_todo(todo_repository)
+        deleted = await _create_expired_todo(todo_repository)
+        await todo_repository.delete(deleted.id)
+        reopened = await _create_expired_todo(todo_repository)
+        reopened.mark_as_incomplete()
+        await todo_repository.save(reopened)
+        await CreateTodoUseCase(todo_repository).execute("未完了")
+
+        expiring = await todo_repository.find_expiring_before(expired.expires_at)
+        assert [todo.id for todo in expiring] == [expired.id]
+
+    asyncio.run(scenario())
@@ -0,0 +1,54 @@
+"""
+ルートごとのバックエンド呼び出し回数の上限のテスト
+
+benchmarks/backend_call_budget.py と同じ手順・上限（BUDGETS）で、motoで模擬した
+DynamoDBに対する呼び出し回数を数える。インメモリのバックエンドは呼び出しを数える
+ResilientCallerを経由しないため、DynamoDBのリポジトリで確認する。
+環境変数はこのテストの範囲だけで設定し、後のテストに残さない。
+"""
+import asyncio
+import importlib.util
+import os
+
+import pytest
+
+BENCHMARK = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks", "backend_call_budget.py")
+
+
+def _load_benchmark():
+    spec = importlib.util.spec_from_file_location("backend_call_budget", BENCHMARK)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def benchmark():
+    return _load_benchmark()
+
+
+@pytest.fixture
+def app(dynamodb_client, load_app, benchmark):
+    """ベンチマークと同じ環境変数で読み込み直したアプリケーション"""
+    return load_app(**benchmark.BENCHMARK_ENV).app
+
+
+def _run(benchmark, app, capsys) -> str:
+    """全ルートを確認し、上限を超えたルートがあれば出力を付けてSystemExitを送出する"""
+    try:
+        asyncio.run(benchmark.run(app))
+    except SystemExit:
+        raise AssertionError(capsys.readouterr().out)
+    return capsys.readouterr().out
+
+
+def test_routes_within_backend_call_budget(benchmark, app, capsys):
+    output = _run(benchmark, app, capsys)
+    assert output.rstrip().endswith("OK")
+
+
+def test_route_over_budget_fails(benchmark, app, capsys, monkeypatch):
+    monkeypatch.setitem(benchmark.BUDGETS, "GET /todos/{id}", (0, {}))
+
+    with pytest.raises(AssertionError, match="NG: GET /todos/\\{id\\}"):
+        _run(benchmark, app, capsys)
@@ -0,0 +1,41 @@
+"""
+コールドスタートのテスト
+
+benchmarks/cold_start_budget.py の1回分の計測を新しいプロセスで実行し、
+遅延読み込みにしたモジュールが読み込み時点で読み込まれていないこと、
+読み込みと最初のリクエストが予算に収まることを確認する。
+共有の実行環境での揺れを考慮し、時間の予算はベンチマークの2倍まで許容する。
+"""
+import json
+import os
+import subprocess
+import sys
+
+BENCHMARK = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks", "cold_start_budget.py")
+
+# 時間の予算に対する許容倍率
+TOLERANCE = 2.0
+
+
+def _measure() -> dict:
+    env = {**os.environ, "TODO_BACKEND": "memory"}
+    result = subprocess.run(
+        [sys.executable, BENCHMARK, "--run"],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_cold_start_within_budget():
+    import_budget_ms = float(os.getenv("COLD_START_IMPORT_BUDGET_MS", "1500"))
+    first_request_budget_ms = float(os.getenv("COLD_START_FIRST_REQUEST_BUDGET_MS", "1000"))
+
+    result = _measure()
+
+    assert result["loaded"] == [], f"読み込み時点で読み込まれています: {result['loaded']}"
+    assert result["import_ms"] < import_budget_ms * TOLERANCE
+    assert result["todos"] < first_request_budget_ms * TOLERANCE
@@ -0,0 +1,100 @@
+"""
+CreateTodoUseCaseの冪等キーのテスト
+
+処理結果の記録に失敗しても作成済みのTODOを返すこと、リース期限後に登録し直された
+冪等キーには元のリクエストが結果を記録しないことを確認する。
+"""
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from application.use_cases.create_todo import CreateTodoUseCase
+from infrastructure.repositories.dynamodb_idempotency_repository import DynamoDBIdempotencyRepository
+from infrastructure.repositories.in_memory_idempotency_repository import InMemoryIdempotencyRepository
+from infrastructure.repositories.in_memory_todo_repository import InMemoryTodoRepository
+
+
+@pytest.fixture(params=["memory", "dynamodb"])
+def idempotency_repository(request):
+    if request.param == "memory":
+        return InMemoryIdempotencyRepository()
+    return DynamoDBIdempotencyRepository(request.getfixturevalue("dynamodb_client"))
+
+
+def test_returns_created_todo_when_complete_fails(monkeypatch, idempotency_repository):
+    async def scenario():
+        todo_repository = InMemoryTodoRepository()
+        use_case = CreateTodoUseCase(todo_repository, idempotency_repository=idempotency_repository)
+
+        async def failing_complete(key, claim_token, todo):
+            raise RuntimeError("書き込みに失敗しました")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(idempotency_repository, "complete", failing_complete)
+            todo = await use_case.execute("買い物", idempotency_key="key-1")
+
+        assert await todo_repository.find_by_id(todo.id) is not None
+        record = await idempotency_repository.find("key-1")
+        assert record is not None and not record.completed
+
+    asyncio.run(scenario())
+
+
+def test_complete_retries_once(monkeypatch, idempotency_repository):
+    async def scenario():
+        use_case = CreateTodoUseCase(InMemoryTodoRepository(), idempotency_repository=idempotency_repository)
+        complete = idempotency_repository.complete
+        calls = []
+
+        async def flaky_complete(key, claim_token, todo):
+            calls.append(key)
+            if len(calls) == 1:
+                raise RuntimeError("一時的なエラー")
+            return await complete(key, claim_token, todo)
+
+        monkeypatch.setattr(idempotency_repository, "complete", flaky_complete)
+        todo = await use_case.execute("買い物", idempotency_key="key-1")
+
+        assert len(calls) == 2
+        assert (await idempotency_repository.find("key-1")).todo.id == todo.id
+        assert (await use_case.execute("買い物", idempotency_key="key-1")).id == todo.id
+
+    asyncio.run(scenario())
+
+
+def test_complete_requires_claim_owner(idempotency_repository):
+    async def scenario():
+        # リース期限がすぐに切れるようにする
+        idempotency_repository.lease = timedelta(seconds=-2)
+        todo_repository = InMemoryTodoRepository()
+        use_case = CreateTodoUseCase(todo_repository)
+        stale_token = await idempotency_repository.claim("key-1", "hash")
+        current_token = await idempotency_repository.claim("key-1", "hash")
+        assert stale_token is not None and current_token is not None
+
+        stale_todo = await use_case.execute("古いリクエスト")
+        assert not await idempotency_repository.complete("key-1", stale_token, stale_todo)
+        await idempotency_repository.release("key-1", stale_token)
+        assert await idempotency_repository.find("key-1") is not None
+
+        current_todo = await use_case.execute("新しいリクエスト")
+        assert await idempotency_repository.complete("key-1", current_token, current_todo)
+        assert (await idempotency_repository.find("key-1")).todo.id == current_todo.id
+
+    asyncio.run(scenario())
+
+
+def test_replays_large_description(dynamodb_client):
+    async def scenario():
+        idempotency_repository = DynamoDBIdempotencyRepository(dynamodb_client)
+        use_case = CreateTodoUseCase(InMemoryTodoRepository(), idempotency_repository=idempotency_repository)
+        description = "あ" * 200 * 1024
+
+        todo = await use_case.execute("大きな説明", description, idempotency_key="key-1")
+        replayed = await use_case.execute("大きな説明", description, idempotency_key="key-1")
+
+        assert replayed.id == todo.id
+        assert replayed.description == description
+
+    asyncio.run(scenario())
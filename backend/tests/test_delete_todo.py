@@ -0,0 +1,66 @@
+"""
+DeleteTodoUseCaseのテスト
+
+同じTODOを同時に削除しても、件数の集計を減らすのは実際に削除した1回だけであることを確認する。
+"""
+import asyncio
+
+import pytest
+
+from application.use_cases.create_todo import CreateTodoUseCase
+from application.use_cases.delete_todo import DeleteTodoUseCase
+from domain.entities.todo_stats import TodoStats
+from infrastructure.repositories.dynamodb_todo_repository import DynamoDBTodoRepository
+from infrastructure.repositories.in_memory_todo_repository import InMemoryTodoRepository
+from infrastructure.repositories.in_memory_todo_stats_repository import InMemoryTodoStatsRepository
+from infrastructure.repositories.write_behind_todo_repository import WriteBehindTodoRepository
+
+
+@pytest.fixture(params=["memory", "dynamodb", "write_behind"])
+def todo_repository(request):
+    if request.param == "memory":
+        return InMemoryTodoRepository()
+    if request.param == "dynamodb":
+        return DynamoDBTodoRepository(request.getfixturevalue("dynamodb_client"))
+    return WriteBehindTodoRepository(InMemoryTodoRepository())
+
+
+def _yield_on_read(monkeypatch, todo_repository):
+    """読み込みのたびに他のタスクへ切り替わるようにして、同時に処理される状況を作る"""
+    find_by_id = todo_repository.find_by_id
+
+    async def yielding_find_by_id(todo_id):
+        await asyncio.sleep(0)
+        return await find_by_id(todo_id)
+
+    monkeypatch.setattr(todo_repository, "find_by_id", yielding_find_by_id)
+
+
+def test_concurrent_deletes_decrement_once(monkeypatch, todo_repository):
+    async def scenario():
+        stats_repository = InMemoryTodoStatsRepository()
+        todo = await CreateTodoUseCase(todo_repository, stats_repository=stats_repository).execute("買い物")
+        todo.mark_as_completed()
+        await todo_repository.save(todo)
+        await stats_repository.increment(completed=1)
+
+        _yield_on_read(monkeypatch, todo_repository)
+        use_case = DeleteTodoUseCase(todo_repository, stats_repository=stats_repository)
+        results = await asyncio.gather(use_case.execute(todo.id), use_case.execute(todo.id))
+
+        assert sorted(results) == [False, True]
+        assert await todo_repository.find_by_id(todo.id) is None
+        assert await stats_repository.get() == TodoStats(total=0, completed=0)
+
+    asyncio.run(scenario())
+
+
+def test_delete_missing_todo(todo_repository):
+    async def scenario():
+        stats_repository = InMemoryTodoStatsRepository()
+        use_case = DeleteTodoUseCase(todo_repository, stats_repository=stats_repository)
+
+        assert await use_case.execute("missing") is False
+        assert await stats_repository.get() == TodoStats(total=0, completed=0)
+
+    asyncio.run(scenario())
@@ -0,0 +1,28 @@
+"""
+InMemoryTodoRepositoryのテスト
+
+削除済みの記録が保持期間を過ぎると捨てられることを確認する。
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+from application.use_cases.create_todo import CreateTodoUseCase
+from infrastructure.repositories.in_memory_todo_repository import InMemoryTodoRepository
+
+
+def test_prunes_tombstones_past_retention():
+    async def scenario():
+        todo_repository = InMemoryTodoRepository(tombstone_retention=timedelta(days=7))
+        use_case = CreateTodoUseCase(todo_repository)
+        old = await use_case.execute("古いTODO")
+        new = await use_case.execute("新しいTODO")
+
+        await todo_repository.delete(old.id)
+        # 保持期間を過ぎた記録として扱う
+        todo_repository._tombstones[old.id] = datetime.now() - timedelta(days=8)
+        await todo_repository.delete(new.id)
+
+        changes = await todo_repository.find_changes_since(datetime.now() - timedelta(days=30))
+        assert [tombstone.id for tombstone in changes.tombstones] == [new.id]
+
+    asyncio.run(scenario())
@@ -0,0 +1,124 @@
+"""
+scripts/migrate_todo_indexes.py のテスト
+
+インデックスのない以前のテーブルに保存したTODOが、移行後に作成順の一覧と差分同期、
+保持期限の取得に含まれること、移行を繰り返しても安全なことを確認する。
+"""
+import asyncio
+import importlib.util
+import os
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from domain.entities.todo_order import todo_order_key
+from infrastructure.repositories.dynamodb_todo_repository import DynamoDBTodoRepository
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts", "migrate_todo_indexes.py")
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location("migrate_todo_indexes", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def legacy_table(dynamodb_client):
+    """インデックスのない以前のテーブルにタイムゾーンのない日時でTODOを保存する"""
+    resource = dynamodb_client.get_resource()
+    resource.Table("Todos").delete()
+    table = resource.create_table(
+        TableName="Todos",
+        KeySchema=[{'AttributeName': 'id', 'KeyType': 'HASH'}],
+        AttributeDefinitions=[{'AttributeName': 'id', 'AttributeType': 'S'}],
+        BillingMode='PAY_PER_REQUEST'
+    )
+    table.wait_until_exists()
+
+    base = datetime(2024, 1, 1, 9, 0, 0)
+    for minutes in range(3):
+        timestamp = (base + timedelta(minutes=minutes)).isoformat()
+        item = {
+            'id': str(uuid.uuid4()),
+            'title': f"以前のTODO{minutes}",
+            'completed': minutes == 0,
+            'created_at': timestamp,
+            'updated_at': timestamp,
+        }
+        if minutes == 0:
+            # 保持期限のある完了済みのTODO
+            item['expires_at'] = int((base + timedelta(days=30)).timestamp())
+        table.put_item(Item=item)
+    return table
+
+
+def test_startup_does_not_wait_for_indexes(dynamodb_client, legacy_table, monkeypatch):
+    def wait_for_indexes(table):
+        raise AssertionError("起動時にインデックスを待っています")
+
+    monkeypatch.setattr(dynamodb_client, "_wait_for_indexes", wait_for_indexes)
+    table = dynamodb_client.create_todos_table()
+    assert not table.global_secondary_indexes
+    assert dynamodb_client.unavailable_todo_indexes(table) == [
+        "updated_at-index", "order_key-index", "expires_at-index"
+    ]
+
+    # インデックスが使えるようになるまではスキャンで代替する
+    repository = DynamoDBTodoRepository(dynamodb_client)
+    page = asyncio.run(repository.find_page(2, None, None))
+    assert [todo.title for todo in page] == ["以前のTODO2", "以前のTODO1"]
+    cursor = todo_order_key(page[-1].id, page[-1].created_at)
+    older = asyncio.run(repository.find_page(2, cursor, None))
+    assert [todo.title for todo in older] == ["以前のTODO0"]
+    newer = asyncio.run(repository.find_page(1, None, todo_order_key(older[0].id, older[0].created_at)))
+    assert [todo.title for todo in newer] == ["以前のTODO1"]
+
+    changes = asyncio.run(repository.find_changes_since(datetime(2024, 1, 1, 9, 0, 30)))
+    assert sorted(todo.title for todo in changes.todos) == ["以前のTODO1", "以前のTODO2"]
+
+    expiring = asyncio.run(repository.find_expiring_before(datetime(2024, 2, 1)))
+    assert [todo.title for todo in expiring] == ["以前のTODO0"]
+
+
+def test_migration_adds_legacy_todos_to_indexes(dynamodb_client, legacy_table, tmp_path):
+    script = _load_script()
+    checkpoint = str(tmp_path / "checkpoint")
+
+    dynamodb_client.ensure_todo_indexes(legacy_table)
+    assert {index['IndexName'] for index in legacy_table.global_secondary_indexes} == {
+        "updated_at-index", "order_key-index", "expires_at-index"
+    }
+
+    result = script.migrate(legacy_table, page_size=1, checkpoint=checkpoint)
+    assert result["migrated"] == 3
+    assert not os.path.exists(checkpoint)
+
+    repository = DynamoDBTodoRepository(dynamodb_client)
+    page = asyncio.run(repository.find_page(10, None, None))
+    assert [todo.title for todo in page] == ["以前のTODO2", "以前のTODO1", "以前のTODO0"]
+
+    changes = asyncio.run(repository.find_changes_since(datetime(2024, 1, 1, 9, 0, 30)))
+    assert sorted(todo.title for todo in changes.todos) == ["以前のTODO1", "以前のTODO2"]
+
+    expiring = asyncio.run(repository.find_expiring_before(datetime(2024, 2, 1)))
+    assert [todo.title for todo in expiring] == ["以前のTODO0"]
+
+    # 2回目は移行するTODOがない
+    assert script.migrate(legacy_table, page_size=1)["migrated"] == 0
+
+
+def test_migration_skips_todo_changed_after_scan(dynamodb_client, legacy_table):
+    script = _load_script()
+    dynamodb_client.ensure_todo_indexes(legacy_table)
+
+    item = legacy_table.scan()['Items'][0]
+    legacy_table.update_item(
+        Key={'id': item['id']},
+        UpdateExpression='SET updated_at = :updated_at',
+        ExpressionAttributeValues={':updated_at': datetime(2024, 1, 2).isoformat()}
+    )
+
+    assert script.migrate_item(legacy_table, item) is False
@@ -0,0 +1,169 @@
+"""
+ResilientCaller・RetryBudget・CircuitBreakerのテスト
+
+FaultInjectorで実際のバックエンドと同じ例外を発生させて確認する。
+"""
+import asyncio
+
+import pytest
+from botocore.exceptions import ClientError
+
+from domain.repositories.exceptions import (
+    CircuitOpenError,
+    RepositoryThrottledError,
+    RepositoryUnavailableError
+)
+from infrastructure.fault_injection.fault_injector import FaultInjector, FaultProfile
+from infrastructure.resilience.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from infrastructure.resilience.resilient_caller import ResilientCaller, classify_error
+from infrastructure.resilience.retry import RetryBudget
+
+
+def _injector(**kwargs) -> FaultInjector:
+    """遅延をほぼなくした障害注入"""
+    return FaultInjector(
+        FaultProfile(latency_median=0.0001, latency_p99=0.0001, timeout=0.0, **kwargs),
+        seed=1
+    )
+
+
+def _caller(breaker=None, **kwargs) -> ResilientCaller:
+    """待ち時間なしで再試行する呼び出し"""
+    return ResilientCaller(breaker=breaker, backoff_base=0.0, backoff_cap=0.0, **kwargs)
+
+
+class _Backend:
+    """呼び出し回数を数え、先頭の failures 回だけ注入した障害で失敗する"""
+
+    def __init__(self, injector: FaultInjector, failures: int = 1_000_000):
+        self.injector = injector
+        self.failures = failures
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            await self.injector.inject("get_item")
+        return "ok"
+
+
+def test_classify_error():
+    throttled = ClientError({"Error": {"Code": "ProvisionedThroughputExceededException"}}, "get_item")
+    unavailable = ClientError({"Error": {"Code": "InternalServerError"}}, "get_item")
+    conditional = ClientError({"Error": {"Code": "ConditionalCheckFailedException"}}, "put_item")
+
+    assert isinstance(classify_error(throttled, "get_item"), RepositoryThrottledError)
+    assert isinstance(classify_error(unavailable, "get_item"), RepositoryUnavailableError)
+    assert classify_error(conditional, "put_item") is None
+    assert classify_error(ValueError("x"), "get_item") is None
+
+
+def test_retries_transient_failure_until_success():
+    backend = _Backend(_injector(timeout_rate=1.0), failures=2)
+    caller = _caller()
+
+    assert asyncio.run(caller.call("get_item", backend)) == "ok"
+    assert backend.calls == 3
+    assert caller.breaker.state == CLOSED
+
+
+def test_non_retryable_error_is_raised_without_retry():
+    calls = 0
+
+    async def conditional_failure():
+        nonlocal calls
+        calls += 1
+        raise ClientError({"Error": {"Code": "ConditionalCheckFailedException"}}, "put_item")
+
+    caller = _caller(breaker=CircuitBreaker(failure_threshold=1))
+
+    with pytest.raises(ClientError):
+        asyncio.run(caller.call("put_item", conditional_failure))
+    assert calls == 1
+    # バックエンドは応答しているので遮断しない
+    assert caller.breaker.state == CLOSED
+
+
+def test_timeouts_give_up_after_max_attempts():
+    backend = _Backend(_injector(timeout_rate=1.0))
+    caller = _caller(max_attempts=3)
+
+    with pytest.raises(RepositoryUnavailableError):
+        asyncio.run(caller.call("get_item", backend))
+    assert backend.calls == 3
+    assert caller.breaker.get_metrics()["failures"] == 3
+
+
+def test_throttling_is_retried_but_does_not_open_breaker():
+    injector = _injector(throttle_rate=1.0)
+    backend = _Backend(injector)
+    caller = _caller(breaker=CircuitBreaker(failure_threshold=1), max_attempts=3)
+
+    with pytest.raises(RepositoryThrottledError):
+        asyncio.run(caller.call("get_item", backend))
+    assert backend.calls == 3
+    assert injector.get_metrics()["throttled"] == 3
+
+    metrics = caller.breaker.get_metrics()
+    assert metrics["state"] == CLOSED
+    assert metrics["failures"] == 0
+    assert metrics["throttled"] == 3
+
+
+def test_retry_budget_runs_out():
+    budget = RetryBudget(ratio=0.5, min_per_second=0.0)
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    assert budget.get_metrics()["exhausted"] == 2
+
+
+def test_caller_stops_retrying_when_budget_is_exhausted():
+    backend = _Backend(_injector(timeout_rate=1.0))
+    caller = _caller(max_attempts=10, budget_ratio=0.0, budget_min_per_second=0.0)
+
+    with pytest.raises(RepositoryUnavailableError):
+        asyncio.run(caller.call("get_item", backend))
+    # 予算の1回分だけ再試行する
+    assert backend.calls == 2
+    assert caller.get_metrics()["retries"]["get_item"]["exhausted"] == 1
+
+    # 予算が尽きた後は再試行しない
+    with pytest.raises(RepositoryUnavailableError):
+        asyncio.run(caller.call("get_item", backend))
+    assert backend.calls == 3
+
+
+def test_breaker_opens_then_half_opens_then_closes():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    caller = _caller(breaker=breaker, max_attempts=1)
+    backend = _Backend(_injector(timeout_rate=1.0), failures=3)
+
+    for _ in range(2):
+        with pytest.raises(RepositoryUnavailableError):
+            asyncio.run(caller.call("get_item", backend))
+    assert breaker.state == OPEN
+
+    # 開いている間はバックエンドを呼び出さない
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(caller.call("get_item", backend))
+    assert backend.calls == 2
+
+    # 試行の呼び出しが失敗するとopenに戻る
+    asyncio.run(asyncio.sleep(0.06))
+    assert breaker.allow_request()
+    assert breaker.state == HALF_OPEN
+    breaker.record_throttled()
+    with pytest.raises(RepositoryUnavailableError):
+        asyncio.run(caller.call("get_item", backend))
+    assert breaker.state == OPEN
+
+    # 試行の呼び出しが成功するとclosedに戻る
+    asyncio.run(asyncio.sleep(0.06))
+    assert asyncio.run(caller.call("get_item", backend)) == "ok"
+    assert breaker.state == CLOSED
+    assert breaker.get_metrics()["opened"] == 2
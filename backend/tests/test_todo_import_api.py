@@ -0,0 +1,83 @@
+"""
+TODO一括インポートのAPIのテスト
+
+ジョブIDを本文の送信前に受け取り、送信中も進捗を取得できることを確認する。
+"""
+import asyncio
+import json
+
+import httpx
+
+
+def _ndjson(start: int, count: int) -> bytes:
+    return "".join(
+        json.dumps({"title": f"インポート{row}"}) + "\n" for row in range(start, start + count)
+    ).encode("utf-8")
+
+
+async def _poll(client, job_id: str, until) -> dict:
+    """条件を満たすまでジョブの進捗を取得する"""
+    for _ in range(200):
+        response = await client.get(f"/todos/import/{job_id}")
+        assert response.status_code == 200
+        job = response.json()
+        if until(job):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"ジョブが想定の状態になりません: {job}")
+
+
+def test_polls_job_while_uploading(load_app):
+    main = load_app(TODO_BACKEND="memory", TODO_IMPORT_BATCH_SIZE="2")
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            created = await client.post("/todos/import")
+            assert created.status_code == 202
+            job = created.json()
+            assert job["status"] == "pending"
+            assert created.headers["location"] == f"/todos/import/{job['id']}"
+
+            finish_upload = asyncio.Event()
+
+            async def body():
+                yield _ndjson(0, 4)
+                # 残りを送る前に、途中までの進捗を取得させる
+                await finish_upload.wait()
+                yield _ndjson(4, 4)
+
+            upload = asyncio.create_task(
+                client.put(created.headers["location"], content=body(), headers={"Content-Type": "application/x-ndjson"})
+            )
+
+            running = await _poll(client, job["id"], lambda job: job["processed"] >= 4)
+            assert running["status"] == "running"
+            assert running["started_at"] is not None
+            assert running["finished_at"] is None
+            finish_upload.set()
+
+            uploaded = await upload
+            assert uploaded.status_code == 202
+
+            finished = await _poll(client, job["id"], lambda job: job["status"] != "running")
+            assert finished["status"] == "completed"
+            assert finished["imported"] == 8
+
+            # 同じジョブには本文を送り直せない
+            again = await client.put(created.headers["location"], content=_ndjson(0, 1))
+            assert again.status_code == 409
+
+    asyncio.run(scenario())
+
+
+def test_upload_to_unknown_job(load_app):
+    main = load_app(TODO_BACKEND="memory")
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.put("/todos/import/missing", content=_ndjson(0, 1))
+            assert response.status_code == 404
+
+    asyncio.run(scenario())
@@ -0,0 +1,60 @@
+"""
+インポートする本文の読み込みのテスト
+
+本文をチャンクに分けて渡し、行やレコードがチャンクの境界をまたいでも解析できることを確認する。
+"""
+import asyncio
+import json
+
+import pytest
+
+from presentation.api.todo_import_reader import (
+    IMPORT_FORMAT_CSV,
+    IMPORT_FORMAT_NDJSON,
+    ImportLineTooLongError,
+    read_import_rows
+)
+
+
+async def _chunks(body: bytes, size: int):
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+def _read(body: bytes, import_format: str, chunk_size: int = 3, **kwargs):
+    async def collect():
+        return [row async for row in read_import_rows(_chunks(body, chunk_size), import_format, **kwargs)]
+    return asyncio.run(collect())
+
+
+def test_ndjson_rows_across_chunks():
+    body = "\n".join([
+        json.dumps({"title": "買い物", "description": "牛乳"}, ensure_ascii=False),
+        "",
+        "{bad json",
+        json.dumps({"title": ""}),
+    ]).encode("utf-8")
+
+    rows = _read(body, IMPORT_FORMAT_NDJSON)
+
+    assert [(row.row, row.title, row.description) for row in rows if row.error is None] == [(1, "買い物", "牛乳")]
+    assert [row.row for row in rows if row.error is not None] == [3, 4]
+
+
+def test_csv_with_bom_and_multiline_value():
+    body = '\ufefftitle,description\n"掃除\n(台所)","床, 窓"\n洗濯,\n\n,x'.encode("utf-8")
+
+    rows = _read(body, IMPORT_FORMAT_CSV)
+
+    assert [(row.row, row.title, row.description) for row in rows[:2]] == [
+        (3, "掃除\n(台所)", "床, 窓"),
+        (4, "洗濯", None),
+    ]
+    assert rows[2].row == 6 and rows[2].error is not None
+
+
+def test_line_too_long():
+    body = json.dumps({"title": "x" * 100}).encode("utf-8")
+
+    with pytest.raises(ImportLineTooLongError):
+        _read(body + b"\n", IMPORT_FORMAT_NDJSON, chunk_size=16, max_line_length=50)
@@ -1,6 +1,6 @@
 'use client';
 
-import { useEffect, useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 import TodoForm from '@/components/TodoForm';
 import TodoItem from '@/components/TodoItem';
 
@@ -13,6 +13,12 @@ interface Todo {
   updated_at: string;
 }
 
+interface TodoChanges {
+  todos: Todo[];
+  deleted: { id: string; deleted_at: string }[];
+  watermark: string;
+}
+
 export default function Home() {
   const [todos, setTodos] = useState<Todo[]>([]);
   const [loading, setLoading] = useState(true);
@@ -20,6 +26,38 @@ export default function Home() {
 
   const apiUrl = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
+  // 受け取った中で最も新しい更新日時（再接続時の差分取得の基準）
+  const watermarkRef = useRef<string | null>(null);
+
+  const advanceWatermark = (timestamp: string) => {
+    if (watermarkRef.current === null || timestamp > watermarkRef.current) {
+      watermarkRef.current = timestamp;
+    }
+  };
+
+  // 作成・更新されたTODOを一覧に反映
+  const upsertTodo = (todo: Todo) => {
+    advanceWatermark(todo.updated_at);
+    setTodos((prev) => {
+      const index = prev.findIndex((t) => t.id === todo.id);
+      if (index === -1) {
+        return [...prev, todo];
+      }
+      // 古いイベントで新しい状態を上書きしない
+      if (prev[index].updated_at > todo.updated_at) {
+        return prev;
+      }
+      const next = [...prev];
+      next[index] = todo;
+      return next;
+    });
+  };
+
+  // 削除されたTODOを一覧から除外
+  const removeTodo = (id: string) => {
+    setTodos((prev) => prev.filter((t) => t.id !== id));
+  };
+
   // TODO一覧を取得
   const fetchTodos = async () => {
     try {
@@ -30,7 +68,8 @@ export default function Home() {
         throw new Error('TODO一覧の取得に失敗しました');
       }
 
-      const data = await response.json();
+      const data: Todo[] = await response.json();
+      data.forEach((todo) => advanceWatermark(todo.updated_at));
       setTodos(data);
       setError(null);
     } catch (err) {
@@ -41,6 +80,36 @@ export default function Home() {
     }
   };
 
+  // 切断中（または配信の打ち切り後）に見逃した変更を取得して一覧に反映
+  const resync = async () => {
+    const since = watermarkRef.current;
+    if (since === null) {
+      await fetchTodos();
+      return;
+    }
+
+    try {
+      const response = await fetch(`${apiUrl}/todos/changes?since=${encodeURIComponent(since)}`);
+
+      // 基準時刻が古すぎる場合は一覧を取り直す
+      if (response.status === 410) {
+        await fetchTodos();
+        return;
+      }
+      if (!response.ok) {
+        throw new Error('TODO差分の取得に失敗しました');
+      }
+
+      const changes: TodoChanges = await response.json();
+      changes.todos.forEach(upsertTodo);
+      changes.deleted.forEach((tombstone) => removeTodo(tombstone.id));
+      advanceWatermark(changes.watermark);
+    } catch (err) {
+      console.error('Error fetching todo changes:', err);
+      await fetchTodos();
+    }
+  };
+
   // TODOを作成
   const createTodo = async (title: string, description: string) => {
     try {
@@ -59,8 +128,7 @@ export default function Home() {
         throw new Error('TODOの作成に失敗しました');
       }
 
-      // TODO一覧を再取得
-      await fetchTodos();
+      upsertTodo(await response.json());
     } catch (err) {
       alert(err instanceof Error ? err.message : 'TODOの作成に失敗しました');
       throw err;
@@ -85,8 +153,7 @@ export default function Home() {
         throw new Error('TODOの更新に失敗しました');
       }
 
-      // TODO一覧を再取得
-      await fetchTodos();
+      upsertTodo(await response.json());
     } catch (err) {
       alert(err instanceof Error ? err.message : 'TODOの更新に失敗しました');
       console.error('Error updating todo:', err);
@@ -110,8 +177,7 @@ export default function Home() {
         throw new Error('TODOの更新に失敗しました');
       }
 
-      // TODO一覧を再取得
-      await fetchTodos();
+      upsertTodo(await response.json());
     } catch (err) {
       alert(err instanceof Error ? err.message : 'TODOの更新に失敗しました');
       console.error('Error updating todo:', err);
@@ -133,8 +199,7 @@ export default function Home() {
         throw new Error('TODOの削除に失敗しました');
       }
 
-      // TODO一覧を再取得
-      await fetchTodos();
+      removeTodo(todo.id);
     } catch (err) {
       alert(err instanceof Error ? err.message : 'TODOの削除に失敗しました');
       console.error('Error deleting todo:', err);
@@ -143,6 +208,24 @@ export default function Home() {
 
   useEffect(() => {
     fetchTodos();
+
+    // 他のタブ・クライアントによる変更を購読して一覧に反映
+    const eventSource = new EventSource(`${apiUrl}/todos/stream`);
+
+    // 再接続した場合は、切断中に配信されなかった変更を取り直す
+    let connected = false;
+    eventSource.onopen = () => {
+      if (connected) {
+        resync();
+      }
+      connected = true;
+    };
+
+    eventSource.addEventListener('created', (e) => upsertTodo(JSON.parse(e.data)));
+    eventSource.addEventListener('updated', (e) => upsertTodo(JSON.parse(e.data)));
+    eventSource.addEventListener('deleted', (e) => removeTodo(JSON.parse(e.data).id));
+
+    return () => eventSource.close();
   }, []);
 
   return (